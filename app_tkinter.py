@@ -5,7 +5,6 @@ import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
-import pandas as pd
 from datetime import datetime
 import time
 import logging
@@ -15,17 +14,53 @@ import subprocess
 # Try both absolute and relative imports for compatibility
 try:
     from core.browser_detector import get_browser_path
-    from core.dice_login import login_to_dice, update_dice_credentials, validate_dice_credentials
-    from core.main_script import get_web_driver, fetch_jobs_with_requests, apply_to_job_url
+    from core.dice_login import update_dice_credentials, validate_dice_credentials, export_session_cookies
+    from core.main_script import get_web_driver, fetch_jobs_with_requests, format_query_novelty
+    from core.apply_pool import ApplyWorkerPool
+    from core.ledger import open_ledger, job_guid_from_url
+    from core.report_writer import StreamingJobWriter, EXCLUDED_COLUMNS, REPORT_FILES, export_report
+    from core.search_client import DiceSearchClient
+    from core.crawl_watermarks import CrawlWatermarks
+    from core.timeout_policy import get_timeout_policy
+    from core.rate_controller import get_rate_controller
+    from core.session_store import ensure_logged_in
+    from core.session_broker import SessionBroker
+    from core.pipeline import JobPipeline, format_pipeline_counts
+    from core.run_journal import RunJournal, read_run_state
+    from core.apply_scheduler import PriorityJobQueue, build_job_scorer
 except ImportError:
     try:
         from core.browser_detector import get_browser_path
-        from core.dice_login import login_to_dice, update_dice_credentials, validate_dice_credentials
-        from core.main_script import get_web_driver, fetch_jobs_with_requests, apply_to_job_url
+        from core.dice_login import update_dice_credentials, validate_dice_credentials, export_session_cookies
+        from core.main_script import get_web_driver, fetch_jobs_with_requests, format_query_novelty
+        from core.apply_pool import ApplyWorkerPool
+        from core.ledger import open_ledger, job_guid_from_url
+        from core.report_writer import StreamingJobWriter, EXCLUDED_COLUMNS, REPORT_FILES, export_report
+        from core.search_client import DiceSearchClient
+        from core.crawl_watermarks import CrawlWatermarks
+        from core.timeout_policy import get_timeout_policy
+        from core.rate_controller import get_rate_controller
+        from core.session_store import ensure_logged_in
+        from core.session_broker import SessionBroker
+        from core.pipeline import JobPipeline, format_pipeline_counts
+        from core.run_journal import RunJournal, read_run_state
+        from core.apply_scheduler import PriorityJobQueue, build_job_scorer
     except ImportError:
         from core.browser_detector import get_browser_path
-        from core.dice_login import login_to_dice, update_dice_credentials, validate_dice_credentials
-        from core.main_script import get_web_driver, fetch_jobs_with_requests, apply_to_job_url
+        from core.dice_login import update_dice_credentials, validate_dice_credentials, export_session_cookies
+        from core.main_script import get_web_driver, fetch_jobs_with_requests, format_query_novelty
+        from core.apply_pool import ApplyWorkerPool
+        from core.ledger import open_ledger, job_guid_from_url
+        from core.report_writer import StreamingJobWriter, EXCLUDED_COLUMNS, REPORT_FILES, export_report
+        from core.search_client import DiceSearchClient
+        from core.crawl_watermarks import CrawlWatermarks
+        from core.timeout_policy import get_timeout_policy
+        from core.rate_controller import get_rate_controller
+        from core.session_store import ensure_logged_in
+        from core.session_broker import SessionBroker
+        from core.pipeline import JobPipeline, format_pipeline_counts
+        from core.run_journal import RunJournal, read_run_state
+        from core.apply_scheduler import PriorityJobQueue, build_job_scorer
 
 
 
@@ -76,6 +111,11 @@ class DiceAutoBotApp:
         # Load configuration if exists
         self.load_config()
         
+        # Keeps a logged-in browser ready so a run doesn't wait for the login
+        self.session_broker = SessionBroker(
+            lambda: get_web_driver(**self.driver_options()), remember=self.remember_session
+        )
+        
         # Create the tabs
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
@@ -98,6 +138,18 @@ class DiceAutoBotApp:
         # Log that app is started
         self.logger.info("Application started")
         
+        # Optionally log in with the saved credentials in the background while the user looks at the UI
+        if self.warm_browser_at_launch:
+            self.session_broker.warm(self.username_entry.get().strip(), self.password_entry.get().strip())
+        
+    def driver_options(self):
+        """get_web_driver arguments from the settings, shared by every browser of a run"""
+        return {
+            "headless": self.headless_var.get(),
+            "page_load_strategy": self.page_load_strategy,
+            "block_resources": self.block_resources,
+        }
+        
     def setup_logging(self):
         """Set up logging for the application"""
         # Create logs directory if needed
@@ -134,6 +186,20 @@ class DiceAutoBotApp:
         "aws","gcp","Azure","agentic","python","rag","llm"]
         self.headless_mode = False
         self.job_limit = 1500
+        self.apply_workers = 1
+        self.driver_recycle_jobs = 150
+        self.driver_recycle_rss_mb = 1500
+        self.search_mode = "http"
+        self.keyword_word_boundaries = False
+        self.prescreen_jobs = True
+        self.return_to_search_page = False
+        self.park_between_jobs = False
+        self.page_load_strategy = "eager"
+        self.block_resources = True
+        self.remember_session = True
+        self.apply_queue_size = 50
+        self.time_budget_minutes = 0
+        self.warm_browser_at_launch = False
         
         # Try to load from file if it exists
         import json
@@ -146,6 +212,20 @@ class DiceAutoBotApp:
                     self.include_keywords = config.get('include_keywords', self.include_keywords)
                     self.headless_mode = config.get('headless_mode', self.headless_mode)
                     self.job_limit = config.get('job_application_limit', self.job_limit)
+                    self.apply_workers = config.get('apply_workers', self.apply_workers)
+                    self.driver_recycle_jobs = config.get('driver_recycle_jobs', self.driver_recycle_jobs)
+                    self.driver_recycle_rss_mb = config.get('driver_recycle_rss_mb', self.driver_recycle_rss_mb)
+                    self.search_mode = config.get('search_mode', self.search_mode)
+                    self.keyword_word_boundaries = config.get('keyword_word_boundaries', self.keyword_word_boundaries)
+                    self.prescreen_jobs = config.get('prescreen_jobs', self.prescreen_jobs)
+                    self.return_to_search_page = config.get('return_to_search_page', self.return_to_search_page)
+                    self.park_between_jobs = config.get('park_between_jobs', self.park_between_jobs)
+                    self.page_load_strategy = config.get('page_load_strategy', self.page_load_strategy)
+                    self.block_resources = config.get('block_resources', self.block_resources)
+                    self.remember_session = config.get('remember_session', self.remember_session)
+                    self.apply_queue_size = config.get('apply_queue_size', self.apply_queue_size)
+                    self.time_budget_minutes = config.get('time_budget_minutes', self.time_budget_minutes)
+                    self.warm_browser_at_launch = config.get('warm_browser_at_launch', self.warm_browser_at_launch)
                     self.logger.info("Configuration loaded successfully")
             except Exception as e:
                 self.logger.error(f"Error loading configuration: {e}")
@@ -158,13 +238,23 @@ class DiceAutoBotApp:
             
         import json
         try:
-            config = {
+            # Keep settings that are not edited in the GUI
+            config = {}
+            if os.path.exists(self.config_file):
+                try:
+                    with open(self.config_file, 'r') as f:
+                        config = json.load(f)
+                except Exception:
+                    config = {}
+            
+            config.update({
                 'search_queries': [q.strip() for q in self.search_query_entry.get().split(',') if q.strip()],
                 'exclude_keywords': [k.strip() for k in self.exclude_keywords_entry.get().split(',') if k.strip()],
                 'include_keywords': [k.strip() for k in self.include_keywords_entry.get().split(',') if k.strip()],
                 'headless_mode': self.headless_var.get(),
-                'job_application_limit': self.job_limit_var.get()
-            }
+                'job_application_limit': self.job_limit_var.get(),
+                'apply_workers': self.apply_workers_var.get()
+            })
             
             with open(self.config_file, 'w') as f:
                 json.dump(config, f, indent=4)
@@ -245,6 +335,11 @@ class DiceAutoBotApp:
         self.start_button = ttk.Button(self.main_tab, text="Start Applying", command=self.start_applying, style="Green.TButton")
         self.start_button.pack(fill="x", padx=10, pady=10)
         
+        # Continue an interrupted run from its journal without searching again
+        self.resume_button = ttk.Button(self.main_tab, text="Resume Last Run",
+                                        command=lambda: self.start_applying(resume=True))
+        self.resume_button.pack(fill="x", padx=10, pady=5)
+        
         # Stop button
         self.stop_button = ttk.Button(self.main_tab, text="Stop", command=self.stop_applying, state="disabled")
         self.stop_button.pack(fill="x", padx=10, pady=5)
@@ -306,6 +401,10 @@ class DiceAutoBotApp:
         excluded_button = ttk.Button(excel_buttons_frame, text="Open Excluded Jobs Excel", command=lambda: self.open_excel_file("excluded_jobs.xlsx"))
         excluded_button.grid(row=0, column=2, padx=5, pady=5)
         
+        # Open Job Report Excel
+        report_button = ttk.Button(excel_buttons_frame, text="Open Job Report Excel", command=lambda: self.open_excel_file("job_application_report.xlsx"))
+        report_button.grid(row=0, column=3, padx=5, pady=5)
+        
         # Log section
         log_frame = ttk.LabelFrame(self.main_tab, text="Logs")
         log_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -325,15 +424,25 @@ class DiceAutoBotApp:
     def open_excel_file(self, filename):
         """Open an Excel file using the system default application"""
         try:
+            # Excel files are only created here, exported on demand from the ledger
+            # or from the streamed report files
+            ledger_status = {"applied_jobs.xlsx": "applied", "not_applied_jobs.xlsx": "not_applied"}.get(filename)
+            report_name = next((name for name, files in REPORT_FILES.items() if files[1] == filename), None)
+
+            if ledger_status:
+                ledger = open_ledger()
+                try:
+                    exported = ledger.export_excel(ledger_status, filename)
+                    self.logger.info(f"Exported {exported} jobs from the ledger to {filename}")
+                finally:
+                    ledger.close()
+            elif report_name:
+                export_report(report_name)
+                self.logger.info(f"Exported {REPORT_FILES[report_name][0]} to {filename}")
+
             if not os.path.exists(filename):
-                if filename == "excluded_jobs.xlsx":
-                    # Create the file if it doesn't exist
-                    df = pd.DataFrame(columns=["Job Title", "Job URL", "Company", "Location", "Employment Type", "Posted Date", "Exclusion Reason"])
-                    df.to_excel(filename, index=False)
-                    self.logger.info(f"Created new {filename} file")
-                else:
-                    messagebox.showinfo("File Not Found", f"The file {filename} does not exist yet.")
-                    return
+                messagebox.showinfo("File Not Found", f"The file {filename} does not exist yet.")
+                return
                     
             # Open the file with the default system application
             if sys.platform == "win32":
@@ -399,6 +508,20 @@ class DiceAutoBotApp:
         )
         job_limit_spin.pack(side="left", padx=5)
         
+        # Parallel browsers
+        workers_frame = ttk.Frame(settings_frame)
+        workers_frame.pack(fill="x", padx=10, pady=5)
+        ttk.Label(workers_frame, text="Browsers applying in parallel:").pack(side="left")
+        self.apply_workers_var = tk.IntVar(value=self.apply_workers)
+        apply_workers_spin = ttk.Spinbox(
+            workers_frame, 
+            from_=1, 
+            to=8, 
+            width=5, 
+            textvariable=self.apply_workers_var
+        )
+        apply_workers_spin.pack(side="left", padx=5)
+        
         # Save settings button
         self.save_settings_button = ttk.Button(
             settings_frame, 
@@ -517,7 +640,10 @@ After the process completes, you can find:
             try:
                 # Import the validation function
                 
-                success = validate_dice_credentials(username, password)
+                success, driver = validate_dice_credentials(username, password, keep_driver=True)
+                if success:
+                    # The next run starts from this session instead of logging in again
+                    self.session_broker.adopt(driver, username, password)
                 
                 # Update UI from the main thread
                 self.root.after(0, lambda: self.test_login_complete(success))
@@ -543,11 +669,18 @@ After the process completes, you can find:
             self.logger.error(f"Login test failed: {error}")
             messagebox.showerror("Login Test", error)
             
-    def start_applying(self):
-        """Start the job application process"""
-        # Validate inputs
+    def start_applying(self, resume=False):
+        """Start the job application process (resume: continue the last interrupted run)"""
+        if resume:
+            resume_state = read_run_state()
+            if resume_state is None or resume_state.finished:
+                messagebox.showinfo("Nothing to Resume", "The last run finished; there is no run to resume.")
+                return
+            self.logger.info(f"Resuming the last run: {resume_state.summary()}")
+        
+        # Validate inputs (a resumed run searches the queries it was started with)
         search_queries = [q.strip() for q in self.search_query_entry.get().split(",") if q.strip()]
-        if not search_queries:
+        if not search_queries and not resume:
             messagebox.showwarning("Missing Input", "Please enter at least one job title to search for.")
             return
             
@@ -566,6 +699,7 @@ After the process completes, you can find:
         # Update UI
         self.running = True
         self.start_button.config(state="disabled")
+        self.resume_button.config(state="disabled")
         self.stop_button.config(state="normal")
         self.progress_bar["value"] = 0
         self.status_label.config(text="Starting...")
@@ -583,13 +717,21 @@ After the process completes, you can find:
         # Run job application process in a separate thread
         self.job_thread = threading.Thread(
             target=self.run_job_application,
-            args=(search_queries, include_keywords, exclude_keywords, username, password),
+            args=(search_queries, include_keywords, exclude_keywords, username, password, resume),
             daemon=True
         )
         self.job_thread.start()
         
-    def run_job_application(self, search_queries, include_keywords, exclude_keywords, username, password):
+    def run_job_application(self, search_queries, include_keywords, exclude_keywords, username, password,
+                            resume=False):
         """Run the job application process in a background thread"""
+        ledger = None
+        excluded_writer = None
+        report_writer = None
+        search_client = None
+        journal = None
+        driver = None
+        login_success = False
         try:
             # Record start time
             start_time = time.time()
@@ -598,11 +740,19 @@ After the process completes, you can find:
             # Initialize web driver
             self.update_status("Initializing web driver...")
             headless = self.headless_var.get()
-            driver = get_web_driver()
+            driver_options = self.driver_options()
             
-            # Login to Dice
-            self.update_status("Logging in to Dice...")
-            login_success = login_to_dice(driver, (username, password))
+            # A browser warmed at launch, by Test Login or by the previous run is already logged in
+            driver = self.session_broker.acquire(username)
+            if driver is not None:
+                self.logger.info("Using the browser logged in ahead of this run")
+                login_success = True
+            else:
+                driver = get_web_driver(**driver_options)
+                
+                # Login to Dice
+                self.update_status("Logging in to Dice...")
+                login_success = ensure_logged_in(driver, (username, password), remember=self.remember_session)
             if not login_success:
                 self.update_status("Login failed. Please check your credentials.")
                 self.root.after(0, lambda: messagebox.showerror(
@@ -615,236 +765,173 @@ After the process completes, you can find:
                     
             self.update_status("Login successful. Fetching jobs...")
             
-            # Find jobs matching the search queries
-            all_jobs = {}
-            excluded_jobs = []  # Track excluded jobs
+            # Queued jobs and their progress are journaled so a crashed or stopped run can be resumed
+            journal = RunJournal()
+            resume_state = journal.resume() if resume else None
+            if resume_state is not None:
+                search_queries = resume_state.remaining_queries()
+                resumed_jobs = resume_state.unfinished_jobs()
+            else:
+                journal.start(search_queries)
+                resumed_jobs = []
+            
+            # Excluded jobs are streamed to disk, deduplicated by job GUID;
+            # a resumed run adds to the reports of the run it continues
+            resuming = resume_state is not None
+            excluded_writer = StreamingJobWriter("excluded_jobs.jsonl", EXCLUDED_COLUMNS, append=resuming)
+            report_writer = StreamingJobWriter("job_data.jsonl", append=resuming)
+            # Applied / not applied outcomes live in the ledger
+            ledger = open_ledger()
             total_queries = len(search_queries)
+            # One pooled HTTP session (sharing the browser's cookies) serves every query
+            if self.search_mode == "http" or self.prescreen_jobs:
+                search_client = DiceSearchClient.from_driver(driver)
+            # GUIDs seen by earlier queries are skipped by later ones
+            seen_guids = {job_guid_from_url(job["Job URL"]) for job, _ in resumed_jobs}
+            query_stats = []
+            # Jobs crawled by earlier runs (in the last day) are not crawled again
+            watermarks = CrawlWatermarks()
             
-            for i, query in enumerate(search_queries):
-                if not self.running:
-                    self.update_status("Stopped by user.")
-                    driver.quit()
-                    self.reset_ui()
-                    return
-                    
-                self.update_status(f"Searching for '{query}' ({i+1}/{total_queries})...")
-                
-                # Use the fetch_jobs_with_requests function
-                jobs, excluded = fetch_jobs_with_requests(driver, query, include_keywords, exclude_keywords)
-                
-                # Track counts before adding new jobs
-                jobs_before = len(all_jobs)
-                
-                # Add unique jobs to dictionary
-                for job in jobs:
-                    if job["Job URL"] not in all_jobs:
-                        all_jobs[job["Job URL"]] = job
-                
-                # Add excluded jobs
-                excluded_jobs.extend(excluded)
-                
-                # Calculate current count
-                current_count = len(all_jobs)
-                
-                # Update the counter after each query, capturing the current count
-                count_to_display = current_count
-                self.root.after(0, lambda c=count_to_display: self.jobs_found_label.config(text=str(c)))
-                
-                # Print debug info
-                print(f"Query '{query}': Found {len(jobs)} total jobs, added {current_count - jobs_before} unique jobs")
+            def fetch_query(query):
+                """Search one query with the run's driver (runs on the pipeline thread)"""
+                self.update_status(f"Searching for '{query}' ({len(query_stats) + 1}/{total_queries})...")
+                stats = {}
+                jobs, excluded = fetch_jobs_with_requests(
+                    driver, query, include_keywords, exclude_keywords,
+                    mode=self.search_mode, search_client=search_client,
+                    word_boundaries=self.keyword_word_boundaries,
+                    seen_guids=seen_guids, query_stats=stats, watermark=watermarks.for_query(query)
+                )
+                query_stats.append(stats)
+                print(f"Query '{query}': Found {len(jobs)} total jobs")
                 
                 # Move mouse to prevent sleeping
                 pyautogui.moveRel(1, 1, duration=0.1)
                 pyautogui.moveRel(-1, -1, duration=0.1)
-                        
-            # Make sure the final count is displayed
-            final_count = len(all_jobs)
-            self.update_status(f"Found {final_count} unique jobs matching criteria")
-            self.root.after(0, lambda c=final_count: self.jobs_found_label.config(text=str(c)))
-            
-            # Save excluded jobs to Excel
-            if excluded_jobs:
-                try:
-                    excluded_file = "excluded_jobs.xlsx"
-                    df_excluded = pd.DataFrame(excluded_jobs)
-                    df_excluded.to_excel(excluded_file, index=False)
-                    self.logger.info(f"Saved {len(excluded_jobs)} excluded jobs to {excluded_file}")
-                except Exception as e:
-                    self.logger.error(f"Error saving excluded jobs: {e}")
+                return jobs, excluded
             
-            # Check for already applied jobs
-            self.update_status("Checking for already applied jobs...")
-            applied_jobs_file = "applied_jobs.xlsx"
-            already_applied = set()
+            def on_pipeline_progress(counts):
+                """Show the jobs queued so far as the total while the search is running"""
+                self.root.after(0, lambda c=counts["queued"]: self.jobs_found_label.config(text=str(c)))
             
-            if os.path.exists(applied_jobs_file):
-                try:
-                    df_applied = pd.read_excel(applied_jobs_file)
-                    already_applied = set(df_applied["Job URL"].dropna())
-                    self.update_status(f"Found {len(already_applied)} previously applied jobs to skip")
-                except Exception as e:
-                    self.logger.error(f"Error reading applied jobs file: {e}")
-            
-            # Filter out already applied jobs
-            jobs_to_apply = [job for job in all_jobs.values() if job["Job URL"] not in already_applied]
-            self.update_status(f"Applying to {len(jobs_to_apply)} jobs...")
-
-            # Update the Total Jobs count to show the jobs that will be processed
-            jobs_to_process_count = len(jobs_to_apply)
-            self.root.after(0, lambda c=jobs_to_process_count: self.jobs_found_label.config(text=str(c)))
-
-            # Apply job limit if set
-            job_limit = self.job_limit_var.get()
-            if job_limit > 0 and len(jobs_to_apply) > job_limit:
-                limited_count = job_limit
-                self.update_status(f"Limiting to {job_limit} jobs as per settings")
-                jobs_to_apply = jobs_to_apply[:job_limit]
-                self.root.after(0, lambda c=limited_count: self.jobs_found_label.config(text=str(c)))
-
-            # Calculate initial estimated time (assuming 10 jobs per minute)
-            jobs_per_minute = 10.0
-            total_jobs = len(jobs_to_apply)
-            
-            if total_jobs > 0:
-                estimated_minutes = total_jobs / jobs_per_minute
-                hours = int(estimated_minutes // 60)
-                minutes = int(estimated_minutes % 60)
-
-                # Format time string
-                initial_estimate = ""
-                if hours > 0:
-                    initial_estimate += f"{hours} hours "
-                if minutes > 0 or hours > 0:
-                    initial_estimate += f"{minutes} minutes"
-                else:
-                    initial_estimate += "less than 1 minute"
-
-                # Update both status and dedicated time label
-                self.update_status(f"Estimated completion time: {initial_estimate}")
-                self.root.after(0, lambda t=initial_estimate: self.estimated_time_label.config(text=t))
-            
-            # Start applying to jobs
-            applied_count = 0
-            failed_count = 0
+            # Search results stream through dedup, the ledger check and the pre-screen into a
+            # bounded queue; applying starts with the first eligible job. Queued jobs are
+            # applied to best-scoring first, and the job limit and time budget are spent
+            # on them rather than on the first jobs found
+            job_queue = PriorityJobQueue(
+                self.apply_queue_size,
+                scorer=build_job_scorer(ledger, include_keywords, self.keyword_word_boundaries),
+                job_limit=self.job_limit_var.get(),
+                time_budget=self.time_budget_minutes * 60,
+            )
+            pipeline = JobPipeline(
+                fetch_query, job_queue, ledger,
+                excluded_writer=excluded_writer,
+                report_writer=report_writer,
+                search_client=search_client,
+                prescreen=self.prescreen_jobs,
+                should_stop=lambda: not self.running,
+                on_progress=on_pipeline_progress,
+                journal=journal,
+            )
             
             # Variables for dynamic time estimation
-            job_start_times = []
             job_processing_times = []
             
-            for i, job in enumerate(jobs_to_apply):
-                if not self.running:
-                    self.update_status("Stopped by user.")
-                    driver.quit()
-                    self.reset_ui()
-                    return
-                
-                # Record job start time for this specific job
-                job_start_time = time.time()
-                
-                # Update progress
-                progress = int((i / len(jobs_to_apply)) * 100) if jobs_to_apply else 0
+            def on_job_start(job, i):
+                """Show job details and progress before a worker applies"""
+                queued = pipeline.counts["queued"]
+                progress = int((i / queued) * 100) if queued else 0
                 self.root.after(0, lambda p=progress: self.progress_bar.config(value=p))
                 
-                # Show job details in status
                 job_title = job.get("Job Title", "Unknown")
-                self.update_status(f"Applying to: {job_title} ({i+1}/{len(jobs_to_apply)})")
-
-                # Apply to job using your existing function
-                try:
-                    result = apply_to_job_url(driver, job["Job URL"])
-                    
-                    # Record job completion time and calculate processing time for this job
-                    job_end_time = time.time()
-                    processing_time = job_end_time - job_start_time
+                self.update_status(f"Applying to: {job_title} ({i+1}/{queued})")
+            
+            def on_job_result(job, result, processing_time):
+                """Update counters and the time estimate after a worker finishes a job"""
+                job_processing_times.append(processing_time)
+                done = pool.processed
+                total_to_apply = pipeline.counts["queued"]
+                
+                # Calculate dynamic time estimate after a few jobs (for the jobs queued so far)
+                if done >= 3 and total_to_apply > done:
+                    # Calculate average time per job based on the last few jobs,
+                    # divided across the browsers working in parallel
+                    recent_times = job_processing_times[-min(10, len(job_processing_times)):]
+                    avg_time_per_job = sum(recent_times) / len(recent_times) / pool.num_workers
                     
-                    # Keep track of job times for estimation
-                    job_start_times.append(job_start_time)
-                    job_processing_times.append(processing_time)
+                    # Calculate remaining time
+                    remaining_jobs = total_to_apply - done
+                    remaining_seconds = avg_time_per_job * remaining_jobs
                     
-                    # Calculate dynamic time estimate after a few jobs
-                    if i >= 2 and len(jobs_to_apply) > i+1:
-                        # Calculate average time per job based on the last few jobs
-                        recent_times = job_processing_times[-min(10, len(job_processing_times)):]
-                        avg_time_per_job = sum(recent_times) / len(recent_times)
-                        
-                        # Calculate remaining time
-                        remaining_jobs = len(jobs_to_apply) - (i + 1)
-                        remaining_seconds = avg_time_per_job * remaining_jobs
-                        
-                        # Format remaining time string
-                        remaining_hours = int(remaining_seconds // 3600)
-                        remaining_minutes = int((remaining_seconds % 3600) // 60)
-                        remaining_seconds = int(remaining_seconds % 60)
-                        
-                        time_remaining = ""
-                        if remaining_hours > 0:
-                            time_remaining += f"{remaining_hours} hours "
-                        if remaining_minutes > 0 or remaining_hours > 0:
-                            time_remaining += f"{remaining_minutes} minutes "
-                        time_remaining += f"{remaining_seconds} seconds"
-                        
-                        # Update the estimated time label
-                        self.root.after(0, lambda t=time_remaining: self.estimated_time_label.config(text=t))
+                    # Format remaining time string
+                    remaining_hours = int(remaining_seconds // 3600)
+                    remaining_minutes = int((remaining_seconds % 3600) // 60)
+                    remaining_seconds = int(remaining_seconds % 60)
                     
-                    if result:
-                        applied_count += 1
-                        # Update applied count
-                        count_to_display = applied_count
-                        self.root.after(0, lambda c=count_to_display: 
-                            self.jobs_applied_label.config(text=str(c)))
-                        
-                        # Save to applied jobs Excel file
-                        try:
-                            job["Applied"] = True
-                            if os.path.exists(applied_jobs_file):
-                                df_existing = pd.read_excel(applied_jobs_file)
-                            else:
-                                df_existing = pd.DataFrame(columns=[
-                                    "Job Title", "Job URL", "Company", "Location", 
-                                    "Employment Type", "Posted Date", "Applied"
-                                ])
-                            
-                            df_new = pd.DataFrame([job])
-                            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-                            df_combined.to_excel(applied_jobs_file, index=False)
-                        except Exception as e:
-                            self.logger.error(f"Error updating Excel file: {e}")
-                    else:
-                        failed_count += 1
-                        # Update failed count
-                        count_to_display = failed_count
-                        self.root.after(0, lambda c=count_to_display: 
-                            self.jobs_failed_label.config(text=str(c)))
-                        
-                        # Save to not applied jobs Excel file
-                        not_applied_file = "not_applied_jobs.xlsx"
-                        try:
-                            if os.path.exists(not_applied_file):
-                                df_existing = pd.read_excel(not_applied_file)
-                            else:
-                                df_existing = pd.DataFrame(columns=[
-                                    "Job Title", "Job URL", "Company", "Location", 
-                                    "Employment Type", "Posted Date", "Applied"
-                                ])
-                            
-                            job["Applied"] = False
-                            df_new = pd.DataFrame([job])
-                            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-                            df_combined.to_excel(not_applied_file, index=False)
-                        except Exception as e:
-                            self.logger.error(f"Error updating not_applied Excel file: {e}")
+                    time_remaining = ""
+                    if remaining_hours > 0:
+                        time_remaining += f"{remaining_hours} hours "
+                    if remaining_minutes > 0 or remaining_hours > 0:
+                        time_remaining += f"{remaining_minutes} minutes "
+                    time_remaining += f"{remaining_seconds} seconds"
                     
-                except Exception as e:
-                    self.logger.error(f"Error applying to {job_title}: {e}")
-                    failed_count += 1
-                    # Update failed count
-                    count_to_display = failed_count
-                    self.root.after(0, lambda c=count_to_display: 
-                        self.jobs_failed_label.config(text=str(c)))
+                    # Update the estimated time label
+                    self.root.after(0, lambda t=time_remaining: self.estimated_time_label.config(text=t))
                 
-                # Move mouse to prevent sleeping
-                pyautogui.moveRel(1, 1, duration=0.1)
-                pyautogui.moveRel(-1, -1, duration=0.1)
+                # Update applied / failed counts
+                self.root.after(0, lambda c=pool.applied: self.jobs_applied_label.config(text=str(c)))
+                self.root.after(0, lambda c=pool.failed: self.jobs_failed_label.config(text=str(c)))
+            
+            # Apply with one or more browsers sharing this driver's login session;
+            # this driver keeps searching while they apply
+            pool = ApplyWorkerPool(
+                self.apply_workers_var.get(),
+                export_session_cookies(driver),
+                headless=headless,
+                ledger=ledger,
+                report_writer=report_writer,
+                on_start=on_job_start,
+                on_result=on_job_result,
+                should_stop=lambda: not self.running,
+                recycle_after_jobs=self.driver_recycle_jobs,
+                recycle_rss_mb=self.driver_recycle_rss_mb,
+                return_to_search_page=self.return_to_search_page,
+                park_between_jobs=self.park_between_jobs,
+                driver_options=driver_options,
+                job_queue=job_queue,
+                journal=journal,
+            )
+            pipeline.start(search_queries, resumed_jobs)
+            pool.run()
+            pipeline.finish()
+            # A run stopped by the user stays resumable
+            if self.running:
+                journal.finish()
+            applied_count = pool.applied
+            failed_count = pool.failed
+            deferred_jobs = pipeline.deferred_jobs
+            
+            # Show which queries mostly return jobs already found by others
+            for line in format_query_novelty(query_stats):
+                self.logger.info(f"Query novelty - {line}")
+            self.logger.info(f"Pipeline: {format_pipeline_counts(pipeline.counts)}")
+            self.logger.info(f"Saved {excluded_writer.written} excluded jobs to {excluded_writer.path}")
+            if deferred_jobs:
+                self.logger.info(f"Job limit reached; {len(deferred_jobs)} jobs left for the next run")
+            
+            if not self.running:
+                self.update_status("Stopped by user. Use Resume Last Run to continue.")
+                self.reset_ui()
+                return
+            
+            # Later runs skip the jobs applied to or skipped for good; failed and deferred ones come back
+            watermarks.save(lambda guid: guid in pipeline.decided_guids or ledger.has_applied(guid))
+            # Keep what this run learned about Dice's response times for the next one
+            timeout_policy = get_timeout_policy()
+            timeout_policy.save()
+            self.logger.info(timeout_policy.summary())
+            self.logger.info(get_rate_controller().summary())
             
             # Compute execution time
             end_time = time.time()
@@ -864,7 +951,7 @@ After the process completes, you can find:
             import json
             try:
                 job_data = {
-                    "Total Jobs Found": len(all_jobs),
+                    "Total Jobs Found": pipeline.counts["queued"] + len(deferred_jobs),
                     "Jobs Applied": applied_count,
                     "Jobs Failed": failed_count,
                     "Execution Time": time_str,
@@ -884,9 +971,6 @@ After the process completes, you can find:
                 f"Total execution time: {time_str}"
             ))
             
-            # Clean up
-            driver.quit()
-                
         except Exception as e:
             self.logger.error(f"Error in job application process: {e}")
             self.update_status(f"Error: {str(e)}")
@@ -895,6 +979,24 @@ After the process completes, you can find:
                 f"An error occurred: {str(e)}"
             ))
         finally:
+            if search_client is not None:
+                search_client.close()
+            # Commit any buffered ledger rows
+            if ledger is not None:
+                ledger.close()
+            # Close the streamed report files
+            for writer in (excluded_writer, report_writer):
+                if writer is not None:
+                    writer.close()
+            if journal is not None:
+                journal.close()
+            # The run's login warms the browser of the next run (the run's browser is quit)
+            if login_success:
+                try:
+                    self.session_broker.adopt(driver, username, password)
+                except Exception as e:
+                    self.logger.error(f"Could not hand the session to the next run: {e}")
+                    self.session_broker.warm(username, password)
             # Reset UI
             self.reset_ui()
 
@@ -914,6 +1016,7 @@ After the process completes, you can find:
         """Reset UI after job completion or stop"""
         self.running = False
         self.start_button.config(state="normal")
+        self.resume_button.config(state="normal")
         self.stop_button.config(state="normal", text="Stop")
         
     def update_status(self, message):
@@ -947,6 +1050,7 @@ def main():
     app = DiceAutoBotApp(root)
     root.protocol("WM_DELETE_WINDOW", root.quit)
     root.mainloop()
+    app.session_broker.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,118 @@
+"""
+Micro-benchmark: WebDriver round trips needed to read one page of job cards.
+
+Compares the old element-by-element extraction with the single execute_script
+bulk extraction on a generated results page (no network or login needed).
+
+Usage:
+    python benchmarks/bench_card_extraction.py [--cards 20] [--repeat 5] [--headless]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.webdriver.common.by import By
+from core.main_script import get_web_driver
+from core.page_scripts import EXTRACT_CARDS_SCRIPT
+
+CARD_HTML = """
+<div data-id="{i}" data-job-guid="guid-{i}">
+  <a data-testid="job-search-job-detail-link" href="#">Senior Data Engineer {i}</a>
+  <a href="/company-profile/{i}"><p>Company {i}</p></a>
+  <p class="text-sm font-normal text-zinc-600">Remote</p>
+  <div class="box"><p{emp_id}>Contract</p></div>
+</div>
+"""
+
+
+def write_fixture(num_cards):
+    """Write a results page with num_cards cards and return its file URL."""
+    cards = "".join(
+        # Every other card lacks the employment-type id to exercise the fallback
+        CARD_HTML.format(i=i, emp_id=' id="employmentType-label"' if i % 2 else "")
+        for i in range(num_cards)
+    )
+    fd, path = tempfile.mkstemp(suffix=".html")
+    with os.fdopen(fd, "w") as f:
+        f.write(f"<html><body>{cards}</body></html>")
+    return path, "file://" + path
+
+
+def count_rpcs(driver):
+    """Wrap driver.execute so every WebDriver command is counted."""
+    counter = {"rpcs": 0}
+    original_execute = driver.execute
+
+    def counting_execute(*args, **kwargs):
+        counter["rpcs"] += 1
+        return original_execute(*args, **kwargs)
+
+    driver.execute = counting_execute
+    return counter
+
+
+def extract_per_element(driver):
+    """The previous extraction: several WebDriver commands per card."""
+    jobs = []
+    for card in driver.find_elements(By.CSS_SELECTOR, "div[data-id][data-job-guid]"):
+        job = {
+            "id": card.get_attribute("data-id"),
+            "guid": card.get_attribute("data-job-guid"),
+            "title": card.find_element(By.CSS_SELECTOR, "a[data-testid='job-search-job-detail-link']").text.strip(),
+            "company": card.find_element(By.CSS_SELECTOR, "a[href*='company-profile'] p").text.strip(),
+        }
+        locations = card.find_elements(By.CSS_SELECTOR, "p.text-sm.font-normal.text-zinc-600")
+        job["location"] = locations[0].text.strip() if locations else None
+        try:
+            job["employmentType"] = card.find_element(By.CSS_SELECTOR, "p#employmentType-label").text.strip()
+        except Exception:
+            job["employmentType"] = None
+            for element in card.find_elements(By.CSS_SELECTOR, "div.box p"):
+                if "Contract" in element.text:
+                    job["employmentType"] = element.text.strip()
+                    break
+        jobs.append(job)
+    return jobs
+
+
+def extract_bulk(driver):
+    """The current extraction: one execute_script for the whole page."""
+    return driver.execute_script(EXTRACT_CARDS_SCRIPT)
+
+
+def measure(driver, counter, extractor, repeat):
+    """Return (cards, rpcs per run, seconds per run) for an extractor."""
+    counter["rpcs"] = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        cards = extractor(driver)
+    elapsed = (time.perf_counter() - start) / repeat
+    return len(cards), counter["rpcs"] / repeat, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job-card extraction round trips")
+    parser.add_argument("--cards", type=int, default=20, help="Cards on the generated page")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per extractor")
+    parser.add_argument("--headless", action="store_true", help="Run the browser headless")
+    args = parser.parse_args()
+
+    path, url = write_fixture(args.cards)
+    driver = get_web_driver(headless=args.headless)
+    try:
+        driver.get(url)
+        counter = count_rpcs(driver)
+        for name, extractor in (("per-element", extract_per_element), ("bulk script", extract_bulk)):
+            cards, rpcs, seconds = measure(driver, counter, extractor, args.repeat)
+            print(f"{name:12s}: {cards} cards, {rpcs:.0f} RPCs, {seconds * 1000:.1f} ms per page")
+    finally:
+        driver.quit()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
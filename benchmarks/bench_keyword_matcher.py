@@ -0,0 +1,88 @@
+"""
+Benchmark: include/exclude title filtering over many titles.
+
+Compares the previous per-keyword substring checks with the compiled
+TitleFilter, using the keyword lists from config/settings.json. Both take
+about the same time; the point of the matcher is word-boundary matching and
+reporting the matched keywords, so this mainly shows how many decisions change.
+
+Usage:
+    python benchmarks/bench_keyword_matcher.py [--titles 100000]
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core.keyword_matcher import TitleFilter
+
+WORDS = ["Senior", "Data", "Engineer", "AI", "ML", "Machine", "Learning", "Java", "Python", "Cloud",
+         "Analyst", "Manager", "HTML", "Developer", "Maintain", "Azure", "W2", "only", "Lead", "Scientist",
+         "Remote", "Contract", "NLP", "ETL", ".NET", "SAP", "Tester", "Platform", "Backend", "GenAI"]
+
+
+def substring_filter(titles, include_keywords, exclude_keywords):
+    """The previous filtering: lowercase substring checks, keyword by keyword."""
+    decisions = []
+    for title in titles:
+        include_job = True
+        exclusion_reason = ""
+        title_lower = title.lower()
+        if exclude_keywords and any(keyword.lower() in title_lower for keyword in exclude_keywords):
+            matching_keywords = [kw for kw in exclude_keywords if kw.lower() in title_lower]
+            exclusion_reason = f"Contains excluded keywords: {', '.join(matching_keywords)}"
+            include_job = False
+        if include_keywords and not any(keyword.lower() in title_lower for keyword in include_keywords):
+            exclusion_reason = f"Missing required keywords: {', '.join(include_keywords)}"
+            include_job = False
+        decisions.append((include_job, exclusion_reason))
+    return decisions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark title keyword filtering")
+    parser.add_argument("--titles", type=int, default=100000, help="Number of generated titles")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, "config", "settings.json")) as f:
+        config = json.load(f)
+    include_keywords = config["include_keywords"]
+    exclude_keywords = config["exclude_keywords"]
+
+    rng = random.Random(args.seed)
+    titles = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8))) for _ in range(args.titles)]
+
+    start = time.perf_counter()
+    old = substring_filter(titles, include_keywords, exclude_keywords)
+    substring_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    title_filter = TitleFilter(include_keywords, exclude_keywords)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [title_filter.classify(title) for title in titles]
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = title_filter.filter_titles(titles)
+    batch_time = time.perf_counter() - start
+
+    assert single == batch
+    changed = sum(1 for a, b in zip(old, batch) if a[0] != b[0])
+    print(f"{args.titles} titles, {len(include_keywords)} include / {len(exclude_keywords)} exclude keywords")
+    print(f"substring checks : {substring_time:.3f}s")
+    print(f"compile          : {compile_time * 1000:.2f}ms")
+    print(f"matcher, per title: {single_time:.3f}s")
+    print(f"matcher, batch    : {batch_time:.3f}s")
+    print(f"decisions changed by word boundaries: {changed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: page load time and bytes transferred per resource profile.
+
+Loads the same pages with resource blocking off and with each profile, under the
+"normal" and "eager" page-load strategies. Bytes are the transferSize of the
+navigation and resource timing entries (blocked requests never appear there).
+Public search and job pages are used, so no login is needed.
+
+Usage:
+    python benchmarks/bench_resource_policy.py [--query "python developer"] [--repeat 3] [--headless]
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.main_script import get_web_driver
+from core.search_client import build_search_url
+from core.resource_policy import set_resource_profile
+
+TRANSFER_SIZE_SCRIPT = """
+return performance.getEntriesByType('navigation')
+    .concat(performance.getEntriesByType('resource'))
+    .reduce(function (total, entry) { return total + (entry.transferSize || 0); }, 0);
+"""
+
+FIRST_JOB_URL_SCRIPT = """
+var card = document.querySelector('div[data-job-guid]');
+return card ? 'https://www.dice.com/job-detail/' + card.getAttribute('data-job-guid') : null;
+"""
+
+
+def measure(driver, url, profile, repeat):
+    """Return (seconds per load, bytes per load) for a URL under a profile."""
+    set_resource_profile(driver, profile)
+    seconds = 0.0
+    transferred = 0
+    for _ in range(repeat):
+        # Start from a blank page with an empty cache so every load is comparable
+        driver.get("about:blank")
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        start = time.perf_counter()
+        driver.get(url)
+        seconds += time.perf_counter() - start
+        transferred += driver.execute_script(TRANSFER_SIZE_SCRIPT) or 0
+    return seconds / repeat, transferred / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resource blocking profiles")
+    parser.add_argument("--query", default="python developer", help="Search query to load")
+    parser.add_argument("--repeat", type=int, default=3, help="Loads per profile")
+    parser.add_argument("--headless", action="store_true", help="Run the browser headless")
+    args = parser.parse_args()
+
+    search_url = build_search_url(args.query)
+    for strategy in ("normal", "eager"):
+        driver = get_web_driver(headless=args.headless, page_load_strategy=strategy, block_resources=True)
+        try:
+            driver.get(search_url)
+            pages = [("search", search_url)]
+            job_url = driver.execute_script(FIRST_JOB_URL_SCRIPT)
+            if job_url:
+                pages.append(("detail", job_url))
+
+            for page_type, url in pages:
+                for profile in ("off", page_type):
+                    seconds, transferred = measure(driver, url, profile, args.repeat)
+                    print(f"{strategy:6s} {page_type:6s} profile={profile:6s}: "
+                          f"{seconds * 1000:7.0f} ms, {transferred / 1024:8.0f} KiB per load")
+        finally:
+            driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+import time
+import threading
+import pyautogui
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.main_script import get_web_driver, apply_to_job_url, find_free_port
+    from dice_auto_apply.core.dice_login import apply_session_cookies
+    from dice_auto_apply.core.driver_manager import DriverManager
+    from dice_auto_apply.core.pipeline import JobQueue
+except ImportError:
+    try:
+        from ..core.main_script import get_web_driver, apply_to_job_url, find_free_port
+        from ..core.dice_login import apply_session_cookies
+        from ..core.driver_manager import DriverManager
+        from ..core.pipeline import JobQueue
+    except ImportError:
+        from core.main_script import get_web_driver, apply_to_job_url, find_free_port
+        from core.dice_login import apply_session_cookies
+        from core.driver_manager import DriverManager
+        from core.pipeline import JobQueue
+
+
+class ApplyWorkerPool:
+    """
+    Applies to jobs with several browser processes pulling from one shared job queue.
+
+    Only one login is needed: the pool copies the session cookies of an already
+    logged-in driver into every worker browser. Each worker browser gets its own
+    remote debugging port so they can run side by side. Outcomes from all workers
+    are recorded in one place (the ledger and report writer passed in).
+    Every worker browser is wrapped in a DriverManager that recycles it once it
+    has handled too many jobs or grown too large.
+    """
+
+    def __init__(self, num_workers, cookies, headless=False,
+                 ledger=None, report_writer=None, on_start=None, on_result=None, should_stop=None,
+                 recycle_after_jobs=150, recycle_rss_mb=1500, return_to_search_page=False,
+                 park_between_jobs=False, driver_options=None, job_queue=None, journal=None):
+        """
+        Parameters:
+            num_workers (int): Number of browsers applying in parallel
+            cookies (list): Session cookies of a logged-in driver (see export_session_cookies)
+            headless (bool): Whether worker browsers run headless
+            ledger (ApplicationLedger): Ledger that receives every outcome
+            report_writer (StreamingJobWriter): Optional report file that receives every outcome
+            on_start (callable): Called as on_start(job, index) before a job is processed
+            on_result (callable): Called as on_result(job, applied, elapsed) after each job
+            should_stop (callable): Returns True when the run should stop early
+            recycle_after_jobs (int): Recycle a worker browser after this many jobs
+            recycle_rss_mb (float): Recycle a worker browser above this memory use (MB)
+            return_to_search_page (bool): Navigate back to the previous page after every job
+            park_between_jobs (bool): Load about:blank between jobs to release the job page
+            driver_options (dict): Extra get_web_driver arguments for worker browsers
+                (e.g. page_load_strategy, block_resources; a "headless" entry overrides headless)
+            job_queue (JobQueue): Queue filled by a producer while the workers run (see
+                core/pipeline.py); workers wait for jobs until it is closed. Without it,
+                run() takes the full job list.
+            journal (RunJournal): Records when each job is started and finished, so an
+                interrupted run can be resumed
+        """
+        self.num_workers = max(1, int(num_workers))
+        self.cookies = cookies or []
+        self.headless = headless
+        self.ledger = ledger
+        self.report_writer = report_writer
+        self.on_start = on_start
+        self.on_result = on_result
+        self.should_stop = should_stop or (lambda: False)
+        self.recycle_after_jobs = recycle_after_jobs
+        self.recycle_rss_mb = recycle_rss_mb
+        self.return_to_search_page = return_to_search_page
+        self.park_between_jobs = park_between_jobs
+        self.driver_options = driver_options or {}
+        self.journal = journal
+
+        self.jobs = job_queue if job_queue is not None else JobQueue(maxsize=0)
+        self.applied = 0
+        self.failed = 0
+        self.processed = 0
+        self.job_seconds = 0.0
+        self._started = 0
+        self._lock = threading.Lock()
+
+    def _create_driver_manager(self):
+        """Create the browser manager of a worker; the shared session is restored into every browser."""
+        options = dict(self.driver_options)
+        options.setdefault("headless", self.headless)
+        return DriverManager(
+            lambda: get_web_driver(debugging_port=find_free_port(), **options),
+            session_restorer=lambda driver: apply_session_cookies(driver, self.cookies),
+            max_jobs=self.recycle_after_jobs,
+            max_rss_mb=self.recycle_rss_mb,
+        )
+
+    def _record(self, job, applied, elapsed):
+        """Record a job outcome and update the shared counters."""
+        # The ledger, report writer and journal lock themselves; only the counters
+        # need the pool lock, so workers don't wait on each other's I/O
+        job["Applied"] = applied
+        if self.ledger is not None:
+            self.ledger.record(job, "applied" if applied else "not_applied")
+        if self.report_writer is not None:
+            self.report_writer.write(job)
+        if self.journal is not None:
+            self.journal.done(job, applied)
+
+        with self._lock:
+            self.processed += 1
+            self.job_seconds += elapsed
+            if applied:
+                self.applied += 1
+            else:
+                self.failed += 1
+            processed = self.processed
+
+        # Move mouse every 3 jobs to prevent system sleeping
+        if processed % 3 == 0:
+            pyautogui.moveRel(1, 1, duration=0.1)
+            pyautogui.moveRel(-1, -1, duration=0.1)
+
+        if self.on_result:
+            self.on_result(job, applied, elapsed)
+
+    def _worker(self, worker_id):
+        """Pull jobs from the queue and apply until it is empty or the run is stopped."""
+        try:
+            manager = self._create_driver_manager()
+        except Exception as e:
+            print(f"Apply worker {worker_id} could not start a browser: {e}")
+            return
+
+        try:
+            while not self.should_stop():
+                job = self.jobs.get_job(self.should_stop)
+                if job is None:
+                    break
+                if self.journal is not None:
+                    self.journal.started(job)
+
+                with self._lock:
+                    index = self._started
+                    self._started += 1
+                if self.on_start:
+                    self.on_start(job, index)
+
+                job_start_time = time.time()
+                try:
+                    applied = apply_to_job_url(
+                        manager.driver, job["Job URL"],
+                        return_to_original=self.return_to_search_page, park=self.park_between_jobs
+                    )
+                except Exception as e:
+                    print(f"Apply worker {worker_id} error on {job.get('Job URL')}: {e}")
+                    applied = False
+                self._record(job, applied, time.time() - job_start_time)
+
+                try:
+                    manager.job_done()
+                except Exception as e:
+                    print(f"Apply worker {worker_id} could not recycle its browser: {e}")
+        finally:
+            manager.close()
+
+    def run(self, jobs=None):
+        """
+        Applies to all jobs and blocks until the queue is drained or the run is stopped.
+
+        Parameters:
+            jobs (list): Job entries with a "Job URL" key; omit it when a producer
+                fills the job_queue given to the constructor
+
+        Returns:
+            dict: Counts of applied, failed and processed jobs, and the average
+            wall time per job in seconds
+        """
+        num_workers = self.num_workers
+        if jobs is not None:
+            for job in jobs:
+                if not job.get("Applied") and job.get("Job URL") != "Unknown":
+                    self.jobs.put(job)
+            self.jobs.close()
+            num_workers = min(num_workers, max(1, self.jobs.qsize()))
+            print(f"Starting {num_workers} apply worker(s) for {self.jobs.qsize()} jobs")
+        else:
+            print(f"Starting {num_workers} apply worker(s) on the streamed job queue")
+
+        threads = [
+            threading.Thread(target=self._worker, args=(worker_id,), daemon=True)
+            for worker_id in range(num_workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        avg_job_seconds = self.job_seconds / self.processed if self.processed else 0.0
+        print(f"Apply workers finished {self.processed} jobs, {avg_job_seconds:.1f}s per job on average")
+        return {"applied": self.applied, "failed": self.failed, "processed": self.processed,
+                "avg_job_seconds": avg_job_seconds}
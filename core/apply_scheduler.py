@@ -0,0 +1,222 @@
+import re
+import time
+import heapq
+import itertools
+import threading
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.pipeline import JobQueue, DEFAULT_QUEUE_SIZE
+    from dice_auto_apply.core.keyword_matcher import KeywordMatcher
+except ImportError:
+    try:
+        from ..core.pipeline import JobQueue, DEFAULT_QUEUE_SIZE
+        from ..core.keyword_matcher import KeywordMatcher
+    except ImportError:
+        from core.pipeline import JobQueue, DEFAULT_QUEUE_SIZE
+        from core.keyword_matcher import KeywordMatcher
+
+# Weight of each default score component; every component is in [0, 1]
+DEFAULT_WEIGHTS = {
+    "keywords": 1.0,
+    "recency": 0.5,
+    "company": 1.0,
+    "title_history": 2.0,
+}
+
+# Keyword matches beyond this don't raise the score further
+MAX_KEYWORD_MATCHES = 3
+# Results per query position scale: the first JOBS_PER_RANK_STEP results score highest
+JOBS_PER_RANK_STEP = 20
+
+TITLE_WORD = re.compile(r"\w{2,}")
+
+
+def _success_rate(applied, total):
+    """Laplace-smoothed success rate (0.5 without history)."""
+    return (applied + 1) / (total + 2)
+
+
+class OutcomeHistory:
+    """Applied / total counts per company and per title word, read from the ledger once."""
+
+    def __init__(self, outcomes=()):
+        """
+        Parameters:
+            outcomes (iterable): (job_title, company, status) rows, e.g. ledger.iter_outcomes()
+        """
+        self.companies = {}
+        self.title_words = {}
+        for title, company, status in outcomes:
+            applied = 1 if status == "applied" else 0
+            if company:
+                self._add(self.companies, company.strip().casefold(), applied)
+            for word in set(TITLE_WORD.findall((title or "").casefold())):
+                self._add(self.title_words, word, applied)
+
+    @staticmethod
+    def _add(counts, key, applied):
+        entry = counts.setdefault(key, [0, 0])
+        entry[0] += applied
+        entry[1] += 1
+
+    def company_rate(self, company):
+        """Share of past jobs at the company that were applied to."""
+        applied, total = self.companies.get((company or "").strip().casefold(), (0, 0))
+        return _success_rate(applied, total)
+
+    def title_rate(self, title):
+        """Mean success rate of the title's words over past jobs."""
+        words = set(TITLE_WORD.findall((title or "").casefold()))
+        if not words:
+            return _success_rate(0, 0)
+        return sum(_success_rate(*self.title_words.get(word, (0, 0))) for word in words) / len(words)
+
+
+class JobScorer:
+    """
+    Weighted sum of score components. A component is a function
+    component(job, rank) -> float in [0, 1]; more can be added with add().
+    """
+
+    def __init__(self):
+        self.components = []
+
+    def add(self, name, weight, component):
+        """
+        Adds a score component.
+
+        Parameters:
+            name (str): Component name
+            weight (float): Weight of the component in the total score
+            component (callable): component(job, rank) -> float in [0, 1]
+
+        Returns:
+            JobScorer: self, so calls can be chained
+        """
+        if weight:
+            self.components.append((name, weight, component))
+        return self
+
+    def score(self, job, rank=None):
+        """
+        Scores a job.
+
+        Parameters:
+            job (dict): Job entry
+            rank (int): Position of the job in its query's results (0 = first), if known
+
+        Returns:
+            float: Total score; higher is applied to first
+        """
+        return sum(weight * component(job, rank) for _, weight, component in self.components)
+
+
+def build_job_scorer(ledger=None, include_keywords=None, word_boundaries=False, weights=None):
+    """
+    Builds the default scorer: include-keyword matches, position in the results,
+    and the success rate of past applications to the company and to similar titles.
+
+    Parameters:
+        ledger (ApplicationLedger): Source of past outcomes (None: no history)
+        include_keywords (list): Include keywords counted in the title
+        word_boundaries (bool): Match keywords as whole words
+        weights (dict): Overrides for DEFAULT_WEIGHTS (0 disables a component)
+
+    Returns:
+        JobScorer: The scorer
+    """
+    weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+    history = OutcomeHistory(ledger.iter_outcomes() if ledger is not None else ())
+    matcher = KeywordMatcher(include_keywords or [], word_boundaries)
+
+    def keywords(job, rank):
+        return min(len(matcher.matches(job.get("Job Title"))), MAX_KEYWORD_MATCHES) / MAX_KEYWORD_MATCHES
+
+    def recency(job, rank):
+        # Searches only cover the last day; earlier results are taken as the fresher ones
+        if rank is None:
+            return 0.5
+        return 1 / (1 + rank / JOBS_PER_RANK_STEP)
+
+    def company(job, rank):
+        return history.company_rate(job.get("Company"))
+
+    def title_history(job, rank):
+        return history.title_rate(job.get("Job Title"))
+
+    return (JobScorer()
+            .add("keywords", weights["keywords"], keywords)
+            .add("recency", weights["recency"], recency)
+            .add("company", weights["company"], company)
+            .add("title_history", weights["title_history"], title_history))
+
+
+class PriorityJobQueue(JobQueue):
+    """
+    JobQueue that hands out the highest-scoring job first.
+
+    Jobs are scored once when they are queued and kept in a heap, so streaming
+    results in costs O(log n) per job. A job limit and a time budget are enforced
+    when jobs are taken: once either is used up, workers get no more jobs and the
+    rest stays queued (the pipeline defers it).
+    """
+
+    def __init__(self, maxsize=DEFAULT_QUEUE_SIZE, scorer=None, job_limit=0, time_budget=0):
+        """
+        Parameters:
+            maxsize (int): Maximum number of queued jobs (0: unbounded)
+            scorer (JobScorer): Scores jobs (default: all jobs score equally, FIFO order)
+            job_limit (int): Maximum number of jobs handed out (0: no limit)
+            time_budget (float): Seconds from now after which no more jobs are handed out (0: none)
+        """
+        super().__init__(maxsize)
+        self.scorer = scorer or JobScorer()
+        self.job_limit = job_limit
+        self.deadline = time.time() + time_budget if time_budget else None
+        self.taken = 0
+        self.exhausted_reason = None
+        self._sequence = itertools.count()
+        self._taken_lock = threading.Lock()
+
+    # queue.Queue storage hooks (called with the queue's mutex held)
+    def _init(self, maxsize):
+        self.queue = []
+
+    def _qsize(self):
+        return len(self.queue)
+
+    def _put(self, item):
+        heapq.heappush(self.queue, item)
+
+    def _get(self):
+        return heapq.heappop(self.queue)[-1]
+
+    def put_job(self, job, should_stop=None, rank=None):
+        """Scores a job and queues it (see JobQueue.put_job)."""
+        item = (-self.scorer.score(job, rank), next(self._sequence), job)
+        return super().put_job(item, should_stop)
+
+    def _reserve(self):
+        """Counts a job against the limit; False once the limit or the time budget is used up."""
+        with self._taken_lock:
+            if self.job_limit and self.taken >= self.job_limit:
+                reason = f"Job limit of {self.job_limit} reached"
+            elif self.deadline is not None and time.time() >= self.deadline:
+                reason = "Time budget used up"
+            else:
+                self.taken += 1
+                return True
+            if self.exhausted_reason is None:
+                self.exhausted_reason = reason
+                print(f"{reason}; the remaining jobs are left for the next run")
+            return False
+
+    def get_job(self, should_stop=None):
+        """Takes the highest-scoring job (see JobQueue.get_job)."""
+        if not self._reserve():
+            return None
+        job = super().get_job(should_stop)
+        if job is None:
+            with self._taken_lock:
+                self.taken -= 1
+        return job
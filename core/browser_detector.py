@@ -1,177 +1,279 @@
 import os
+import ntpath
+import shutil
 import platform
-import subprocess
-import glob
 from pathlib import Path
 from dotenv import load_dotenv, set_key, find_dotenv
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.driver_cache import (
+        CACHE_DIR, load_json_cache, save_json_cache, binary_fingerprint, get_browser_version
+    )
+except ImportError:
+    try:
+        from ..core.driver_cache import (
+            CACHE_DIR, load_json_cache, save_json_cache, binary_fingerprint, get_browser_version
+        )
+    except ImportError:
+        from core.driver_cache import (
+            CACHE_DIR, load_json_cache, save_json_cache, binary_fingerprint, get_browser_version
+        )
+
+# Order of preference: Brave, Chrome, Safari, Edge, Firefox
+PREFERRED_ORDER = ["Brave", "Chrome", "Safari", "Edge", "Firefox"]
+
+BROWSER_CACHE_FILE = os.path.join(CACHE_DIR, "browser_cache.json")
+
+# Executables searched for on PATH (name on PATH -> browser name)
+PATH_EXECUTABLES = {
+    "Windows": [("brave", "Brave"), ("chrome", "Chrome"), ("msedge", "Edge"), ("firefox", "Firefox")],
+    "Other": [("brave", "Brave"), ("brave-browser", "Brave"), ("google-chrome", "Chrome"),
+              ("chrome", "Chrome"), ("chromium", "Chromium"), ("firefox", "Firefox"), ("safari", "Safari")],
+}
+
+# Per-user install locations searched under each Windows profile, relative to the profile
+WINDOWS_USER_TARGETS = {
+    "Brave": ("Brave-Browser", "Application", "brave.exe"),
+    "Chrome": ("Chrome", "Application", "chrome.exe"),
+    "Edge": ("Edge", "Application", "msedge.exe"),
+    "Firefox": ("Firefox", "firefox.exe"),
+}
+
+# Directories never worth descending into while searching a Windows profile
+WINDOWS_SKIP_DIRS = {"node_modules", "temp", "cache", "inetcache", "packages", "crashpad", "user data"}
+
+# Process-wide memo so repeated get_browser_path calls don't touch .env
+_resolved = {"path": None, "fingerprint": None}
+
+
+class _OSFileSystem:
+    """File system access used by the Windows search; swap in a fake to test it on any OS."""
+
+    listdir = staticmethod(os.listdir)
+    isdir = staticmethod(os.path.isdir)
+    exists = staticmethod(os.path.exists)
+
+
+def _walk_profile(fs, root, targets, max_depth=6):
+    """
+    Breadth-first search of a user profile for browser executables.
+
+    A single bounded walk looks for every target at once instead of one
+    recursive glob per browser.
+
+    Parameters:
+        fs: File system object with listdir/isdir/exists
+        root (str): Profile directory (Windows path)
+        targets (dict): Browser name -> path suffix parts, e.g. ("Chrome", "Application", "chrome.exe")
+        max_depth (int): Maximum directory depth below root
+
+    Returns:
+        dict: Browser name -> first matching executable path
+    """
+    found = {}
+    level = [root]
+    for _ in range(max_depth):
+        next_level = []
+        for directory in level:
+            try:
+                entries = fs.listdir(directory)
+            except OSError:
+                continue
+            for entry in entries:
+                path = ntpath.join(directory, entry)
+                for browser, parts in targets.items():
+                    if browser in found or entry.lower() != parts[0].lower():
+                        continue
+                    candidate = ntpath.join(path, *parts[1:])
+                    if fs.exists(candidate):
+                        found[browser] = candidate
+                if entry.startswith(".") or entry.lower() in WINDOWS_SKIP_DIRS:
+                    continue
+                if fs.isdir(path):
+                    next_level.append(path)
+        if len(found) == len(targets) or not next_level:
+            break
+        level = next_level
+    return found
+
+
+def find_windows_browsers(environ=None, fs=None):
+    """
+    Finds browsers on Windows: standard Program Files locations first,
+    then per-user installs under every profile.
+
+    Parameters:
+        environ (dict): Environment variables (defaults to os.environ)
+        fs: File system object with listdir/isdir/exists (defaults to the real one)
 
-def detect_browser_paths():
+    Returns:
+        dict: Browser name -> executable path
+    """
+    environ = os.environ if environ is None else environ
+    fs = fs or _OSFileSystem
+    browser_paths = {}
+
+    # Standard program locations
+    program_files = environ.get("ProgramFiles", "C:\\Program Files")
+    program_files_x86 = environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)")
+    possible_paths = {
+        "Brave": [ntpath.join(base, "BraveSoftware", "Brave-Browser", "Application", "brave.exe")
+                  for base in (program_files, program_files_x86)],
+        "Chrome": [ntpath.join(base, "Google", "Chrome", "Application", "chrome.exe")
+                   for base in (program_files, program_files_x86)],
+        "Edge": [ntpath.join(base, "Microsoft", "Edge", "Application", "msedge.exe")
+                 for base in (program_files, program_files_x86)],
+        "Firefox": [ntpath.join(base, "Mozilla Firefox", "firefox.exe")
+                    for base in (program_files, program_files_x86)],
+    }
+
+    # Get all user profiles
+    users_dir = ntpath.join(environ.get("SystemDrive", "C:") + "\\", "Users")
+    try:
+        user_folders = [f for f in fs.listdir(users_dir) if fs.isdir(ntpath.join(users_dir, f))
+                        and f not in ["Public", "Default", "Default User", "All Users"]]
+    except OSError:
+        user_folders = []
+
+    # Common per-user locations
+    for user in user_folders:
+        local_app_data = ntpath.join(users_dir, user, "AppData", "Local")
+        roaming_app_data = ntpath.join(users_dir, user, "AppData", "Roaming")
+        possible_paths["Brave"].append(ntpath.join(local_app_data, "BraveSoftware", "Brave-Browser", "Application", "brave.exe"))
+        possible_paths["Chrome"].append(ntpath.join(local_app_data, "Google", "Chrome", "Application", "chrome.exe"))
+        possible_paths["Edge"].append(ntpath.join(local_app_data, "Microsoft", "Edge", "Application", "msedge.exe"))
+        possible_paths["Firefox"].append(ntpath.join(roaming_app_data, "Mozilla", "Firefox", "firefox.exe"))
+
+    # Take first found instance of each browser
+    for browser, paths in possible_paths.items():
+        for path in paths:
+            if fs.exists(path):
+                browser_paths[browser] = path
+                break
+
+    # Only search the profiles for browsers not found in the usual places
+    missing = {browser: parts for browser, parts in WINDOWS_USER_TARGETS.items() if browser not in browser_paths}
+    for user in user_folders:
+        if not missing:
+            break
+        found = _walk_profile(fs, ntpath.join(users_dir, user), missing)
+        browser_paths.update(found)
+        missing = {browser: parts for browser, parts in missing.items() if browser not in found}
+
+    return browser_paths
+
+
+def find_macos_browsers(exists=os.path.exists):
+    """
+    Finds browsers in the standard macOS application locations.
+
+    Returns:
+        dict: Browser name -> executable path
+    """
+    possible_paths = {
+        "Brave": [
+            "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
+            "/Applications/Brave Browser Dev.app/Contents/MacOS/Brave Browser Dev",
+            "/Applications/Brave Browser Beta.app/Contents/MacOS/Brave Browser Beta"
+        ],
+        "Chrome": [
+            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+            "/Applications/Google Chrome Dev.app/Contents/MacOS/Google Chrome Dev",
+            "/Applications/Google Chrome Beta.app/Contents/MacOS/Google Chrome Beta"
+        ],
+        "Safari": ["/Applications/Safari.app/Contents/MacOS/Safari"],
+        "Firefox": ["/Applications/Firefox.app/Contents/MacOS/firefox"],
+        "Edge": ["/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge"]
+    }
+
+    browser_paths = {}
+    for browser, paths in possible_paths.items():
+        for path in paths:
+            if exists(path):
+                browser_paths[browser] = path
+    return browser_paths
+
+
+def find_browsers_on_path(system=None):
+    """
+    Finds browsers on PATH with shutil.which (no subprocesses).
+
+    Returns:
+        dict: Browser name -> executable path
+    """
+    system = system or platform.system()
+    browser_paths = {}
+    for executable, browser in PATH_EXECUTABLES["Windows" if system == "Windows" else "Other"]:
+        if browser in browser_paths:
+            continue
+        path = shutil.which(executable)
+        if path:
+            browser_paths[browser] = path
+    return browser_paths
+
+
+def _load_cached_browser():
+    """Return the cached browser path if its fingerprint still matches, else None."""
+    cache = load_json_cache(BROWSER_CACHE_FILE)
+    path = cache.get("path")
+    if path and cache.get("fingerprint") == binary_fingerprint(path):
+        return path
+    return None
+
+
+def _save_cached_browser(path):
+    """Store the selected browser with its fingerprint (path + mtime + size) and version."""
+    save_json_cache(BROWSER_CACHE_FILE, {
+        "path": path,
+        "fingerprint": binary_fingerprint(path),
+        "version": get_browser_version(path),
+    })
+
+
+def detect_browser_paths(use_cache=True):
     """
     Detects browser paths on the current system (macOS or Windows) and updates .env file.
     Searches in this order: Brave, Chrome, Safari, Edge, Firefox.
     
+    Detection results are cached with a fingerprint of the selected executable,
+    so a warm start only stats one file. .env is written only when the path changed.
+    
+    Parameters:
+        use_cache (bool): Whether a still-valid cached result may be returned
+    
     Returns:
         str: The path to the detected browser or None if no browser is found.
     """
+    if use_cache:
+        cached_path = _load_cached_browser()
+        if cached_path:
+            update_env_file(cached_path)
+            return cached_path
+
     system = platform.system()
-    browser_paths = {}
-    
-    # print(f"Detecting browsers on {system} platform...")
     
     if system == "Darwin":  # macOS
-        # Define common browser paths on macOS
-        possible_paths = {
-            "Brave": [
-                "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
-                "/Applications/Brave Browser Dev.app/Contents/MacOS/Brave Browser Dev",
-                "/Applications/Brave Browser Beta.app/Contents/MacOS/Brave Browser Beta"
-            ],
-            "Chrome": [
-                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                "/Applications/Google Chrome Dev.app/Contents/MacOS/Google Chrome Dev",
-                "/Applications/Google Chrome Beta.app/Contents/MacOS/Google Chrome Beta"
-            ],
-            "Safari": ["/Applications/Safari.app/Contents/MacOS/Safari"],
-            "Firefox": ["/Applications/Firefox.app/Contents/MacOS/firefox"],
-            "Edge": ["/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge"]
-        }
-        
-        # Check each browser path
-        for browser, paths in possible_paths.items():
-            for path in paths:
-                if os.path.exists(path):
-                    browser_paths[browser] = path
-                    # print(f"Found {browser} at: {path}")
-    
-    
+        browser_paths = find_macos_browsers()
     elif system == "Windows":
-        # Get all user profiles 
-        users_dir = os.path.join(os.environ.get("SystemDrive", "C:"), "\\Users")
-        user_folders = [f for f in os.listdir(users_dir) if os.path.isdir(os.path.join(users_dir, f)) 
-                        and f not in ["Public", "Default", "Default User", "All Users"]]
-        
-        # Standard program locations
-        program_files = os.environ.get("ProgramFiles", "C:\\Program Files")
-        program_files_x86 = os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)")
-        
-        # Possible browser paths across all users and standard locations
-        possible_paths = {
-            "Brave": [
-                f"{program_files}\\BraveSoftware\\Brave-Browser\\Application\\brave.exe",
-                f"{program_files_x86}\\BraveSoftware\\Brave-Browser\\Application\\brave.exe"
-            ],
-            "Chrome": [
-                f"{program_files}\\Google\\Chrome\\Application\\chrome.exe",
-                f"{program_files_x86}\\Google\\Chrome\\Application\\chrome.exe"
-            ],
-            "Edge": [
-                f"{program_files}\\Microsoft\\Edge\\Application\\msedge.exe",
-                f"{program_files_x86}\\Microsoft\\Edge\\Application\\msedge.exe"
-            ],
-            "Firefox": [
-                f"{program_files}\\Mozilla Firefox\\firefox.exe",
-                f"{program_files_x86}\\Mozilla Firefox\\firefox.exe"
-            ]
-        }
-        
-        # Add user-specific locations for browsers
-        for user in user_folders:
-            user_path = os.path.join(users_dir, user)
-            
-            # AppData locations
-            local_app_data = os.path.join(user_path, "AppData", "Local")
-            roaming_app_data = os.path.join(user_path, "AppData", "Roaming")
-            
-            # Add common user-specific browser locations
-            if os.path.exists(local_app_data):
-                possible_paths["Brave"].extend([
-                    os.path.join(local_app_data, "BraveSoftware", "Brave-Browser", "Application", "brave.exe"),
-                    # Handle potential user-specific install directories
-                    *glob.glob(os.path.join(user_path, "**", "Brave-Browser", "Application", "brave.exe"), recursive=True)
-                ])
-                
-                possible_paths["Chrome"].extend([
-                    os.path.join(local_app_data, "Google", "Chrome", "Application", "chrome.exe"),
-                    # Handle potential user-specific install directories
-                    *glob.glob(os.path.join(user_path, "**", "Chrome", "Application", "chrome.exe"), recursive=True)
-                ])
-                
-                possible_paths["Edge"].extend([
-                    os.path.join(local_app_data, "Microsoft", "Edge", "Application", "msedge.exe"),
-                    # Handle potential user-specific install directories
-                    *glob.glob(os.path.join(user_path, "**", "Edge", "Application", "msedge.exe"), recursive=True)
-                ])
-            
-            if os.path.exists(roaming_app_data):
-                possible_paths["Firefox"].extend([
-                    os.path.join(roaming_app_data, "Mozilla", "Firefox", "firefox.exe"),
-                    # Handle potential user-specific install directories
-                    *glob.glob(os.path.join(user_path, "**", "Firefox", "firefox.exe"), recursive=True)
-                ])
-        
-        # Check each browser path
-        for browser, paths in possible_paths.items():
-            for path in paths:
-                if os.path.exists(path):
-                    browser_paths[browser] = path
-                    # print(f"Found {browser} at: {path}")
-                    break  # Take first found instance of each browser
-
-    # Try to detect browsers using command line on Windows or Unix-like
+        browser_paths = find_windows_browsers()
+    else:
+        browser_paths = {}
+
+    # Fall back to executables on PATH
     if not browser_paths:
-        try:
-            if system == 'Windows':
-                # Try using where command on Windows
-                for browser in ["brave", "chrome", "msedge", "firefox"]:
-                    try:
-                        result = subprocess.run(f'where {browser}', shell=True, capture_output=True, text=True)
-                        if result.returncode == 0 and result.stdout.strip():
-                            path = result.stdout.strip().split('\n')[0]  # Take first result
-                            browser_name = browser.capitalize()
-                            if browser == "msedge":
-                                browser_name = "Edge"
-                            browser_paths[browser_name] = path
-                            # print(f"Found {browser_name} at: {path}")
-                    except Exception:
-                        pass
-            else:
-                # Try using which command on Unix-like
-                for browser in ["brave", "chrome", "chromium", "firefox", "safari"]:
-                    try:
-                        result = subprocess.run(f'which {browser}', shell=True, capture_output=True, text=True)
-                        if result.returncode == 0 and result.stdout.strip():
-                            browser_name = browser.capitalize()
-                            browser_paths[browser_name] = result.stdout.strip()
-                            # print(f"Found {browser_name} at: {result.stdout.strip()}")
-                    except Exception:
-                        pass
-        except Exception as e:
-            print(f"Error detecting browser using command line: {e}")
-    
-    # IMPORTANT CHANGE: Always clear the existing browser path in .env to force detection
-    from dotenv import set_key, find_dotenv
-    dotenv_path = find_dotenv()
-    if dotenv_path:
-        load_dotenv(dotenv_path)  # Load first to get other variables
-        set_key(dotenv_path, "WEB_BROWSER_PATH", "")  # Clear the browser path
-    
-    # Order of preference: Brave, Chrome, Safari, Edge, Firefox
-    preferred_order = ["Brave", "Chrome", "Safari", "Edge", "Firefox"]
+        browser_paths = find_browsers_on_path(system)
     
     # Return the first browser found in the preferred order
-    selected_browser = None
     selected_path = None
-    
-    for browser in preferred_order:
+    for browser in PREFERRED_ORDER + [b for b in browser_paths if b not in PREFERRED_ORDER]:
         if browser in browser_paths:
-            selected_browser = browser
             selected_path = browser_paths[browser]
-            print(f"Selected {selected_browser} browser")
+            print(f"Selected {browser} browser")
             break
     
     if selected_path:
-        # print(f"Selected {selected_browser} at {selected_path} as the preferred browser")
         update_env_file(selected_path)
+        _save_cached_browser(selected_path)
         return selected_path
     else:
         print("No compatible browsers found!")
@@ -210,26 +312,30 @@ def update_env_file(browser_path):
 def get_browser_path():
     """
     Gets the browser path from .env file or detects it if not available.
+    Results are memoized per process and revalidated with a single stat call.
     
     Returns:
         str: The path to the browser.
     """
+    # Warm path: the browser resolved earlier in this process is unchanged
+    if _resolved["path"] and binary_fingerprint(_resolved["path"]) == _resolved["fingerprint"]:
+        return _resolved["path"]
+    
     # Load .env file
     load_dotenv()
     
     # Check if WEB_BROWSER_PATH exists in .env
     browser_path = os.getenv("WEB_BROWSER_PATH")
     
-    if browser_path and os.path.exists(browser_path):
-        # print(f"Using existing browser path from .env: {browser_path}")
-        return browser_path
-    
-    # Detect browser paths if not found in .env or if path doesn't exist
-    browser_path = detect_browser_paths()
+    if not (browser_path and os.path.exists(browser_path)):
+        # Detect browser paths if not found in .env or if path doesn't exist
+        browser_path = detect_browser_paths()
     
     if not browser_path:
         raise Exception("No compatible browser found on your system. Please install Brave, Chrome, Safari, Edge, or Firefox.")
     
+    _resolved["path"] = browser_path
+    _resolved["fingerprint"] = binary_fingerprint(browser_path)
     return browser_path
 
 if __name__ == "__main__":
@@ -0,0 +1,132 @@
+import os
+import re
+import time
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.driver_cache import CACHE_DIR, load_json_cache, save_json_cache
+except ImportError:
+    try:
+        from ..core.driver_cache import CACHE_DIR, load_json_cache, save_json_cache
+    except ImportError:
+        from core.driver_cache import CACHE_DIR, load_json_cache, save_json_cache
+
+DEFAULT_WATERMARK_FILE = os.path.join(CACHE_DIR, "crawl_watermarks.json")
+
+# Searches only cover jobs posted in the last day, so older watermarks say nothing
+MAX_AGE_SECONDS = 24 * 60 * 60
+MAX_GUIDS_PER_QUERY = 1000
+
+GUID_PATTERN = re.compile(r"""data-job-guid=["']?([^"'\s>]+)""")
+
+
+def guids_in_html(html):
+    """Job GUIDs of a results page in page order, read with a regex instead of a parser."""
+    return list(dict.fromkeys(GUID_PATTERN.findall(html or "")))
+
+
+class QueryWatermark:
+    """
+    What the previous runs decided for one search query: the GUIDs of the jobs
+    applied to or skipped for good (e.g. external applications). Jobs excluded by
+    the keywords or whose application failed aren't kept, so they are looked at
+    again after a keyword change or on the next run.
+
+    The crawler reads the GUIDs of each page with a regex first and only extracts
+    the cards that aren't known. Every page is still read: results aren't sorted
+    by date, so new jobs can turn up on any page.
+    """
+
+    def __init__(self, query, guids=None):
+        """
+        Parameters:
+            query (str): Search query
+            guids (list): GUIDs decided by earlier runs, newest first
+        """
+        self.query = query
+        self.guids = list(guids or [])
+        self.known = set(self.guids)
+        self._new_guids = []
+
+    @property
+    def has_history(self):
+        """True if an earlier run left a watermark for this query."""
+        return bool(self.known)
+
+    def check_page(self, guids):
+        """
+        Classifies a results page and records the GUIDs seen on it.
+
+        Parameters:
+            guids (list): GUIDs of the cards on the page, in page order
+
+        Returns:
+            str: "known" (only decided jobs) or "new" (has undecided jobs, or no cards)
+        """
+        new_guids = [guid for guid in guids if guid not in self.known]
+        self._new_guids.extend(guid for guid in new_guids if guid not in self._new_guids)
+        if guids and not new_guids:
+            return "known"
+        return "new"
+
+    def to_dict(self, is_decided):
+        """
+        Merged state to persist: the GUIDs decided in this run first, then the older ones.
+
+        Parameters:
+            is_decided (callable): is_decided(guid) returns True if the job was applied to
+                or skipped for good; the other crawled GUIDs stay unknown
+        """
+        decided = [guid for guid in self._new_guids if is_decided(guid)]
+        new_guids = set(decided)
+        guids = decided + [guid for guid in self.guids if guid not in new_guids]
+        return {
+            "guids": guids[:MAX_GUIDS_PER_QUERY],
+            "updated_at": time.time(),
+        }
+
+
+class CrawlWatermarks:
+    """Per-query watermarks persisted in a JSON file between runs."""
+
+    def __init__(self, path=DEFAULT_WATERMARK_FILE, max_age=MAX_AGE_SECONDS):
+        """
+        Loads the watermark file.
+
+        Parameters:
+            path (str): Path to the JSON file
+            max_age (float): Seconds after which a query's watermark is ignored
+        """
+        self.path = path
+        self.data = load_json_cache(path)
+        self.max_age = max_age
+        self._queries = {}
+
+    def for_query(self, query):
+        """
+        Returns the watermark of a query (empty if it is missing or stale).
+
+        Parameters:
+            query (str): Search query
+
+        Returns:
+            QueryWatermark: The watermark, updated in place while crawling
+        """
+        if query not in self._queries:
+            entry = self.data.get(query, {})
+            if time.time() - entry.get("updated_at", 0) > self.max_age:
+                entry = {}
+            self._queries[query] = QueryWatermark(query, entry.get("guids"))
+        return self._queries[query]
+
+    def save(self, is_decided):
+        """
+        Persists the watermarks of the queries crawled in this run.
+        Call it once the crawled jobs have been processed.
+
+        Parameters:
+            is_decided (callable): is_decided(guid) returns True if the job was applied to
+                or skipped for good (see QueryWatermark.to_dict)
+        """
+        for query, watermark in self._queries.items():
+            self.data[query] = watermark.to_dict(is_decided)
+        save_json_cache(self.path, self.data)
@@ -1,14 +1,28 @@
 import os
-import time
 from pathlib import Path
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from dotenv import load_dotenv, set_key, find_dotenv
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.browser_detector import get_browser_path
+    from dice_auto_apply.core.driver_cache import resolve_chromedriver_path, StartupTimer
+    from dice_auto_apply.core.timeout_policy import get_timeout_policy
+except ImportError:
+    try:
+        from ..core.browser_detector import get_browser_path
+        from ..core.driver_cache import resolve_chromedriver_path, StartupTimer
+        from ..core.timeout_policy import get_timeout_policy
+    except ImportError:
+        from core.browser_detector import get_browser_path
+        from core.driver_cache import resolve_chromedriver_path, StartupTimer
+        from core.timeout_policy import get_timeout_policy
 
 def update_dice_credentials(username, password, update_env=True):
     """
@@ -59,13 +73,8 @@ def get_headless_driver():
     Returns:
         webdriver: A headless Chrome/Brave WebDriver instance
     """
-    try:
-        # Import browser detector if available
-        from browser_detector import get_browser_path
-        web_browser_path = get_browser_path()
-    except ImportError:
-        # Fallback if browser_detector is not available
-        web_browser_path = None
+    timer = StartupTimer("Headless browser startup")
+    web_browser_path = get_browser_path()
     
     options = Options()
     
@@ -80,22 +89,153 @@ def get_headless_driver():
     # Set browser binary location if available
     if web_browser_path:
         options.binary_location = web_browser_path
+        driver_path = resolve_chromedriver_path(web_browser_path)
+    else:
+        driver_path = ChromeDriverManager().install()
+    timer.mark("driver path")
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    driver = webdriver.Chrome(service=Service(driver_path), options=options)
+    timer.mark("launch")
+    timer.report()
     return driver
 
-def validate_dice_credentials(username, password, headless=True):
+LOGIN_URL = "https://www.dice.com/dashboard/login"
+
+EMAIL_FIELD = (By.NAME, "email")
+PASSWORD_FIELD = (By.NAME, "password")
+CONTINUE_BUTTON = (By.XPATH, "//button[@data-testid='sign-in-button']")
+LOGIN_BUTTON = (By.XPATH, "//button[@data-testid='submit-password']")
+SEARCH_FORM = (By.XPATH, "//form[@class='flex h-auto w-full flex-row rounded-lg rounded-bl-lg bg-white']")
+DASHBOARD_HEADER = (By.XPATH, "//div[contains(@class, 'dashboard-header')]")
+LOGIN_ERROR = (By.XPATH, "//div[contains(@class, 'error-message') or contains(@class, 'alert-danger')]")
+# Pages only a logged-in user lands on (the login page itself lives under /dashboard)
+LOGGED_IN_URL = r"dice\.com/(dashboard(?!/login)|home|jobs)"
+
+
+def _signal(name, condition):
+    """Wraps an expected condition so it returns its name instead of the element."""
+    def check(driver):
+        return name if condition(driver) else False
+    return check
+
+
+def _race(driver, timeout, signals):
+    """
+    Waits until the first of several named conditions holds.
+
+    Parameters:
+        driver (WebDriver): Driver
+        timeout (float): Maximum seconds to wait
+        signals (dict): Name -> expected condition
+
+    Returns:
+        str: Name of the condition that won, or None on timeout
+    """
+    race = EC.any_of(*(_signal(name, condition) for name, condition in signals.items()))
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(race)
+    except TimeoutException:
+        return None
+
+
+def _error_text(driver):
+    """Text of the login error message, if one is shown."""
+    try:
+        return driver.find_element(*LOGIN_ERROR).text.strip()
+    except Exception:
+        return ""
+
+
+def perform_login(driver, username, password, step_timeout=None, verify_timeout=None):
+    """
+    Logs a driver into Dice and reports how long each step took.
+
+    Every wait races the signals of the next state (e.g. the password field
+    against an error message), so the login continues, or fails, as soon as the
+    page shows the outcome instead of after fixed sleeps.
+
+    Parameters:
+        driver (WebDriver): Driver to log in
+        username (str): Dice account email/username
+        password (str): Dice account password
+        step_timeout (float): Seconds per form step (default: learned "login_step" timeout)
+        verify_timeout (float): Seconds to wait for the logged-in page (default:
+            learned "login_verify" timeout)
+
+    Returns:
+        dict: {"success": bool, "signal": what decided the outcome, "error": message or None,
+        "steps": seconds per step}
+    """
+    policy = get_timeout_policy()
+    step_timeout = policy.timeout("login_step") if step_timeout is None else step_timeout
+    verify_timeout = policy.timeout("login_verify") if verify_timeout is None else verify_timeout
+    timer = StartupTimer("Login")
+    wait = WebDriverWait(driver, step_timeout, poll_frequency=0.1)
+
+    def result(success, signal, error=None):
+        if signal in ("search_form", "dashboard_header", "url"):
+            policy.record("login_verify", timer.stages[-1][1])
+        elif signal is None and error is None:
+            error = "Could not verify login result"
+        steps = timer.report()
+        if not success:
+            print(f"Login failed: {error}")
+        return {"success": success, "signal": signal, "error": error, "steps": steps}
+
+    try:
+        driver.get(LOGIN_URL)
+        email_field = wait.until(EC.presence_of_element_located(EMAIL_FIELD))
+        timer.mark("login page")
+        policy.record("login_step", timer.stages[-1][1])
+
+        email_field.clear()
+        email_field.send_keys(username)
+        wait.until(EC.element_to_be_clickable(CONTINUE_BUTTON)).click()
+        signal = _race(driver, step_timeout, {
+            "password": EC.visibility_of_element_located(PASSWORD_FIELD),
+            "error": EC.visibility_of_element_located(LOGIN_ERROR),
+        })
+        timer.mark("email")
+        if signal != "password":
+            return result(False, signal, _error_text(driver) or "Password step did not appear")
+        policy.record("login_step", timer.stages[-1][1])
+
+        password_field = driver.find_element(*PASSWORD_FIELD)
+        password_field.clear()
+        password_field.send_keys(password)
+        wait.until(EC.element_to_be_clickable(LOGIN_BUTTON)).click()
+        signal = _race(driver, verify_timeout, {
+            "search_form": EC.presence_of_element_located(SEARCH_FORM),
+            "dashboard_header": EC.presence_of_element_located(DASHBOARD_HEADER),
+            "url": EC.url_matches(LOGGED_IN_URL),
+            "error": EC.visibility_of_element_located(LOGIN_ERROR),
+        })
+        timer.mark("verify")
+        if signal is None:
+            policy.record("login_verify", verify_timeout, timed_out=True)
+        if signal == "error":
+            return result(False, signal, _error_text(driver))
+        return result(signal is not None, signal)
+
+    except Exception as e:
+        timer.mark("failed")
+        return result(False, None, str(e))
+
+
+def validate_dice_credentials(username, password, headless=True, keep_driver=False):
     """
     Validates Dice credentials by attempting to log in using a headless browser.
-    With enhanced waiting times for slow login processes.
     
     Parameters:
         username (str): Dice account email/username
         password (str): Dice account password
         headless (bool): Whether to use headless mode for validation
+        keep_driver (bool): Leave the logged-in browser open and return it, so its
+            session can be reused instead of logging in again
         
     Returns:
-        bool: True if login was successful, False otherwise
+        bool: True if login was successful, False otherwise. With keep_driver, a
+        (success, driver) tuple; driver is None unless the login succeeded.
     """
     print(f"Validating credentials for {username}...")
     
@@ -103,87 +243,28 @@ def validate_dice_credentials(username, password, headless=True):
     if headless:
         driver = get_headless_driver()
     else:
-        # Import from main file to get regular driver
-        from browser_detector import get_browser_path
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
-        
         web_browser_path = get_browser_path()
         options = Options()
         options.binary_location = web_browser_path
         options.add_argument("--start-maximized")
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        driver = webdriver.Chrome(service=Service(resolve_chromedriver_path(web_browser_path)), options=options)
     
+    success = False
     try:
-        # Try login with provided credentials
-        driver.get("https://www.dice.com/dashboard/login")
-        wait = WebDriverWait(driver, 20)       # Increased from 10 to 20
-        long_wait = WebDriverWait(driver, 120) # Much longer wait for final verification
-        
-        # Enter email/username
-        email_field = wait.until(EC.presence_of_element_located((By.NAME, "email")))
-        email_field.clear()
-        email_field.send_keys(username)
-        
-        # Click continue
-        continue_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@data-testid='sign-in-button']")))
-        continue_button.click()
-        time.sleep(3)  # Increased pause
-        
-        # Enter password
-        password_field = wait.until(EC.presence_of_element_located((By.NAME, "password")))
-        password_field.clear()
-        password_field.send_keys(password)
-        
-        # Click login button
-        login_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@data-testid='submit-password']")))
-        login_button.click()
-        
-        # Add a longer pause after clicking login
-        time.sleep(10)  # Increased wait time
-        
-        # Check for successful login using multiple methods
-        try:
-            # Method 1: Check for search form
-            long_wait.until(EC.presence_of_element_located((By.XPATH, "//form[@class='flex h-auto w-full flex-row rounded-lg rounded-bl-lg bg-white']")))
+        success = perform_login(driver, username, password)["success"]
+        if success:
             print("Login successful with provided credentials!")
-            return True
-        except Exception:
-            try:
-                # Method 2: Check for dashboard header
-                long_wait.until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'dashboard-header')]")))
-                print("Login successful with provided credentials!")
-                return True
-            except Exception:
-                # Method 3: Check URL change
-                current_url = driver.current_url
-                if "dashboard" in current_url or "/home" in current_url or "/jobs" in current_url:
-                    print("Login successful with provided credentials!")
-                    return True
-                
-                # Look for error messages
-                try:
-                    error_message = wait.until(EC.presence_of_element_located(
-                        (By.XPATH, "//div[contains(@class, 'error-message') or contains(@class, 'alert-danger')]")))
-                    print(f"Login failed: {error_message.text}")
-                except Exception:
-                    print("Login failed: Could not verify login result")
-                
-                return False
-            
-    except Exception as e:
-        print(f"Error validating credentials: {e}")
-        return False
     finally:
-        driver.quit()
+        if not (keep_driver and success):
+            driver.quit()
+    if keep_driver:
+        return success, driver if success else None
+    return success
 
 
 def login_to_dice(driver, credentials_from_params=None):
     """
     Logs into Dice using credentials from the .env file or provided parameters.
-    With enhanced waiting and retry logic for slow login processes.
     
     Parameters:
         driver (selenium.webdriver): Selenium WebDriver instance.
@@ -204,82 +285,52 @@ def login_to_dice(driver, credentials_from_params=None):
     if not username or not password:
         raise Exception("Dice credentials not found. Please set DICE_USERNAME and DICE_PASSWORD in .env file or provide them as parameters.")
     
-    # Navigate to login page
-    print("Navigating to Dice login page...")
-    driver.get("https://www.dice.com/dashboard/login")
-    
-    # Set up wait objects with increased timeouts
-    short_wait = WebDriverWait(driver, 20)  # Increased timeout
-    long_wait = WebDriverWait(driver, 120)  # Much longer timeout for final step
+    print("Logging in to Dice...")
+    outcome = perform_login(driver, username, password)
+    if outcome["success"]:
+        print(f"Login verified by {outcome['signal'].replace('_', ' ')}!")
+    return outcome["success"]
 
-    try:
-        # Enter email/username
-        print("Entering username...")
-        email_field = short_wait.until(EC.presence_of_element_located((By.NAME, "email")))
-        email_field.clear()
-        email_field.send_keys(username)
-
-        # Click continue button
-        print("Clicking continue button...")
-        continue_button = short_wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@data-testid='sign-in-button']")))
-        continue_button.click()
-        time.sleep(3)  # Increased pause to ensure page transitions
 
-        # Enter password
-        print("Entering password...")
-        password_field = short_wait.until(EC.presence_of_element_located((By.NAME, "password")))
-        password_field.clear()
-        password_field.send_keys(password)
+def export_session_cookies(driver):
+    """
+    Returns the cookies of a logged-in driver so other drivers can reuse the session.
+    
+    Parameters:
+        driver (selenium.webdriver): Logged-in Selenium WebDriver instance.
+    
+    Returns:
+        list: Cookie dicts as returned by driver.get_cookies()
+    """
+    return driver.get_cookies()
 
-        # Click login button
-        print("Clicking login button...")
-        login_button = short_wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@data-testid='submit-password']")))
-        login_button.click()
-        
-        # Add a longer pause after clicking login
-        print("Waiting for login to complete (this may take some time)...")
-        time.sleep(10)  # Increased wait time after login click
 
-        # Wait for successful login with multiple verification methods
-        print("Verifying login success...")
+def apply_session_cookies(driver, cookies, base_url="https://www.dice.com/"):
+    """
+    Copies session cookies into a fresh driver instead of logging in again.
+    
+    Parameters:
+        driver (selenium.webdriver): Selenium WebDriver instance to receive the cookies.
+        cookies (list): Cookie dicts from export_session_cookies
+        base_url (str): Page to open first, cookies can only be set for the current domain
+    
+    Returns:
+        int: Number of cookies that were set
+    """
+    driver.get(base_url)
+    added = 0
+    for cookie in cookies:
+        cookie = {key: value for key, value in cookie.items() if key in
+                  ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")}
+        if cookie.get("sameSite") not in (None, "Strict", "Lax", "None"):
+            cookie.pop("sameSite")
         try:
-            # Method 1: Check for the search form
-            long_wait.until(EC.presence_of_element_located((By.XPATH, "//form[@class='flex h-auto w-full flex-row rounded-lg rounded-bl-lg bg-white']")))
-            print("Login verified by search form presence!")
-            return True
-        except Exception as e1:
-            print(f"Primary verification method failed: {e1}")
-            try:
-                # Method 2: Check for any element that would only appear after login
-                long_wait.until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'dashboard-header')]")))
-                print("Login verified by dashboard header presence!")
-                return True
-            except Exception as e2:
-                print(f"Secondary verification method failed: {e2}")
-                try:
-                    # Method 3: Check if URL changed to something that indicates successful login
-                    current_url = driver.current_url
-                    if "dashboard" in current_url or "/home" in current_url or "/jobs" in current_url:
-                        print(f"Login verified by URL change to: {current_url}")
-                        return True
-                    else:
-                        print(f"Login verification failed - current URL: {current_url}")
-                        # One last attempt - check if any job-related content is visible
-                        try:
-                            if driver.find_element(By.XPATH, "//div[contains(@class, 'job-cards')]") or \
-                               driver.find_element(By.XPATH, "//div[contains(@class, 'search-results')]"):
-                                print("Login verified by presence of job-related content!")
-                                return True
-                        except:
-                            pass
-                        return False
-                except Exception as e3:
-                    print(f"URL verification method failed: {e3}")
-                    return False
-
-    except Exception as e:
-        print(f"Login process failed: {e}")
-        return False
+            driver.add_cookie(cookie)
+            added += 1
+        except Exception:
+            # Cookies for other domains (e.g. third-party trackers) can't be set here
+            continue
+    return added
 
 
 def setup_credentials_interactive(headless=True):
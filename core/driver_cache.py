@@ -0,0 +1,211 @@
+import os
+import re
+import json
+import time
+import platform
+import threading
+import subprocess
+
+# Newest chromedriver release of each Chrome milestone (Chrome for Testing)
+MILESTONE_VERSIONS_URL = (
+    "https://googlechromelabs.github.io/chrome-for-testing/latest-versions-per-milestone.json"
+)
+
+# Per-user cache directory shared by the startup caches
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".dice_auto_apply")
+DRIVER_CACHE_FILE = os.path.join(CACHE_DIR, "driver_cache.json")
+
+_cache_lock = threading.Lock()
+
+
+def load_json_cache(path):
+    """Load a JSON cache file, returning an empty dict if it is missing or corrupt."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def save_json_cache(path, data):
+    """Atomically write a JSON cache file."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Warning: could not write cache {path}: {e}")
+
+
+def binary_fingerprint(binary_path):
+    """
+    Cheap fingerprint of an executable: path, modification time and size.
+    It changes whenever the browser is updated, without launching it.
+
+    Parameters:
+        binary_path (str): Path to the executable
+
+    Returns:
+        str: Fingerprint string, or None if the file doesn't exist
+    """
+    try:
+        stat = os.stat(binary_path)
+    except OSError:
+        return None
+    return f"{binary_path}|{stat.st_mtime_ns}|{stat.st_size}"
+
+
+def get_browser_version(binary_path):
+    """
+    Returns the version string of a Chromium-based browser binary.
+
+    Parameters:
+        binary_path (str): Path to the browser executable
+
+    Returns:
+        str: Version such as "124.0.6367.91", or None if it can't be determined
+    """
+    if platform.system() == "Windows":
+        # Windows installs keep the version as a folder name next to the executable
+        app_dir = os.path.dirname(binary_path)
+        try:
+            versions = [d for d in os.listdir(app_dir) if re.match(r"^\d+(\.\d+)+$", d)]
+        except OSError:
+            versions = []
+        if versions:
+            return max(versions, key=lambda v: [int(part) for part in v.split(".")])
+        return None
+
+    try:
+        output = subprocess.run([binary_path, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except Exception:
+        return None
+    match = re.search(r"(\d+(?:\.\d+)+)", output or "")
+    return match.group(1) if match else None
+
+
+def major_version(version):
+    """Major version ("124") of a version string, or None."""
+    return version.split(".")[0] if version else None
+
+
+def chromedriver_version_for(browser_version):
+    """
+    The chromedriver release matching a browser's major version.
+
+    Only the major version of Chromium-based browsers (Brave, Edge) lines up with
+    Chrome's, so the newest chromedriver of that milestone is looked up.
+
+    Parameters:
+        browser_version (str): Browser version such as "124.1.65.114"
+
+    Returns:
+        str: Full chromedriver version such as "124.0.6367.207", or None if unknown
+    """
+    major = major_version(browser_version)
+    if not major:
+        return None
+    try:
+        import requests
+        response = requests.get(MILESTONE_VERSIONS_URL, timeout=10)
+        response.raise_for_status()
+        return response.json()["milestones"][major]["version"]
+    except Exception as e:
+        print(f"Could not look up the chromedriver release for browser version {major}: {e}")
+        return None
+
+
+def fix_driver_permissions(driver_path):
+    """Make one chromedriver binary executable (and un-quarantined on macOS)."""
+    try:
+        from fix_chromedriver import fix_driver_permissions as fix_permissions
+    except ImportError:
+        import sys
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from fix_chromedriver import fix_driver_permissions as fix_permissions
+    return fix_permissions(driver_path)
+
+
+def resolve_chromedriver_path(browser_path):
+    """
+    Returns a chromedriver path matching the browser, using the cache when possible.
+
+    The cache entry is keyed on the browser binary and records its fingerprint
+    and version; a change of either invalidates it. The driver is downloaded for
+    the browser's major version, so Brave or Edge get a driver matching them
+    rather than the latest Chrome. webdriver_manager (which may hit the network)
+    only runs when the browser changed or the cached driver disappeared, and
+    driver permissions are fixed once per driver binary.
+
+    Parameters:
+        browser_path (str): Path to the browser executable
+
+    Returns:
+        str: Path to the chromedriver executable
+    """
+    fingerprint = binary_fingerprint(browser_path)
+    version = get_browser_version(browser_path)
+
+    with _cache_lock:
+        cache = load_json_cache(DRIVER_CACHE_FILE)
+        entry = cache.get(browser_path)
+        same_version = bool(entry) and entry.get("version") == version
+        if (same_version and entry.get("fingerprint") == fingerprint and
+                os.path.isfile(entry.get("driver_path", "")) and entry.get("permissions_fixed")):
+            return entry["driver_path"]
+
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        if same_version and version and os.path.isfile(entry.get("driver_path", "")):
+            # Browser binary was touched but its version didn't change
+            driver_path = entry["driver_path"]
+        else:
+            driver_version = chromedriver_version_for(version)
+            if driver_version is None:
+                print("Browser version unknown; downloading the chromedriver of the latest Chrome")
+            driver_path = ChromeDriverManager(driver_version=driver_version).install()
+
+        permissions_fixed = bool(fix_driver_permissions(driver_path))
+        cache[browser_path] = {
+            "fingerprint": fingerprint,
+            "version": version,
+            "driver_path": driver_path,
+            "permissions_fixed": permissions_fixed,
+        }
+        save_json_cache(DRIVER_CACHE_FILE, cache)
+        print(f"Cached chromedriver for browser version {version}: {driver_path}")
+        return driver_path
+
+
+def probe_driver(driver):
+    """
+    Local health probe for a new driver: loads about:blank and runs a script.
+    Needs no network access.
+    """
+    driver.get("about:blank")
+    driver.execute_script("return document.readyState")
+
+
+class StartupTimer:
+    """Records how long each driver startup stage takes and prints a summary."""
+
+    def __init__(self, label="Browser startup"):
+        self.label = label
+        self.stages = []
+        self._start = time.time()
+        self._last = self._start
+
+    def mark(self, stage):
+        """Record the time since the previous mark under the given stage name."""
+        now = time.time()
+        self.stages.append((stage, now - self._last))
+        self._last = now
+
+    def report(self):
+        """Print the stage timings and return them as a dict."""
+        total = time.time() - self._start
+        parts = " | ".join(f"{stage}: {seconds:.2f}s" for stage, seconds in self.stages)
+        print(f"{self.label} took {total:.2f}s ({parts})")
+        return dict(self.stages, total=total)
@@ -0,0 +1,242 @@
+import platform
+import threading
+import subprocess
+
+try:
+    import psutil
+except ImportError:
+    # psutil is optional; on macOS/Linux the process tree is read from `ps` instead
+    psutil = None
+
+
+def _process_tree_rss_mb(root_pid):
+    """
+    Returns the resident memory (MB) of a process and all its descendants.
+
+    Parameters:
+        root_pid (int): PID of the root process (the chromedriver service)
+
+    Returns:
+        float: Total RSS in MB, or None if it could not be measured
+    """
+    if not root_pid:
+        return None
+
+    if psutil is not None:
+        try:
+            root = psutil.Process(root_pid)
+            processes = [root] + root.children(recursive=True)
+            total = 0
+            for process in processes:
+                try:
+                    total += process.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            return total / (1024 * 1024)
+        except Exception:
+            return None
+
+    if platform.system() == "Windows":
+        return None
+
+    try:
+        output = subprocess.run(
+            ["ps", "-A", "-o", "pid=,ppid=,rss="], capture_output=True, text=True, timeout=5
+        ).stdout
+    except Exception:
+        return None
+
+    children = {}
+    rss = {}
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) != 3:
+            continue
+        try:
+            pid, ppid, kb = int(parts[0]), int(parts[1]), int(parts[2])
+        except ValueError:
+            continue
+        rss[pid] = kb
+        children.setdefault(ppid, []).append(pid)
+
+    total_kb = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total_kb += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total_kb / 1024
+
+
+class DriverManager:
+    """
+    Owns the browser used by one worker and recycles it before it gets slow.
+
+    The manager counts jobs and measures the RSS of the browser process tree
+    (chromedriver, browser and renderer processes). When the browser nears a
+    threshold, a replacement is started and its session restored in the
+    background, so the swap itself costs no wall-clock time.
+    """
+
+    def __init__(self, driver_factory, session_restorer=None,
+                 max_jobs=150, max_rss_mb=1500, check_every=5, standby_at=0.8):
+        """
+        Parameters:
+            driver_factory (callable): Returns a new WebDriver
+            session_restorer (callable): Logs a new driver in, called as session_restorer(driver)
+            max_jobs (int): Recycle after this many jobs (0 disables the job limit)
+            max_rss_mb (float): Recycle when the browser tree uses more memory (0 disables)
+            check_every (int): Measure memory and clear page state every N jobs
+            standby_at (float): Fraction of a threshold at which the replacement is prepared
+        """
+        self.driver_factory = driver_factory
+        self.session_restorer = session_restorer
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self.check_every = max(1, check_every)
+        self.standby_at = standby_at
+
+        self.driver = self._new_driver()
+        self.jobs_on_driver = 0
+        self.recycles = 0
+        self.last_rss_mb = None
+
+        self._standby = None
+        self._standby_thread = None
+        self._lock = threading.Lock()
+
+    def _new_driver(self):
+        """Start a browser and restore the logged-in session into it."""
+        driver = self.driver_factory()
+        if self.session_restorer:
+            self.session_restorer(driver)
+        return driver
+
+    def _prepare_standby(self):
+        """Start the replacement browser in a background thread."""
+        if self._standby is not None or (self._standby_thread and self._standby_thread.is_alive()):
+            return
+
+        def build():
+            try:
+                driver = self._new_driver()
+                with self._lock:
+                    self._standby = driver
+                print("Standby browser is ready")
+            except Exception as e:
+                print(f"Could not prepare standby browser: {e}")
+
+        self._standby_thread = threading.Thread(target=build, daemon=True)
+        self._standby_thread.start()
+
+    def _driver_pid(self):
+        """PID of the chromedriver service process of the current driver."""
+        try:
+            return self.driver.service.process.pid
+        except Exception:
+            return None
+
+    def measure_rss_mb(self):
+        """Return the RSS (MB) of the current browser process tree, or None if unknown."""
+        self.last_rss_mb = _process_tree_rss_mb(self._driver_pid())
+        return self.last_rss_mb
+
+    def clear_page_state(self):
+        """
+        Drops heavy page state without touching the session cookies:
+        extra tabs and unreachable JS heap objects. The HTTP cache is kept, so
+        Dice's JS/CSS bundles stay warm for the next job and wizard loads.
+        """
+        driver = self.driver
+        try:
+            handles = driver.window_handles
+            if len(handles) > 1:
+                main_handle = handles[0]
+                for handle in handles[1:]:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                driver.switch_to.window(main_handle)
+        except Exception:
+            pass
+
+        try:
+            driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        except Exception:
+            # Not every browser build exposes this CDP domain
+            pass
+
+    def job_done(self):
+        """
+        Call after each job. Clears page state, checks the thresholds and recycles
+        the browser when one is exceeded.
+
+        Returns:
+            WebDriver: The driver to use for the next job
+        """
+        self.jobs_on_driver += 1
+        if self.jobs_on_driver % self.check_every != 0:
+            return self.driver
+
+        self.clear_page_state()
+        rss_mb = self.measure_rss_mb()
+
+        job_ratio = self.jobs_on_driver / self.max_jobs if self.max_jobs else 0
+        rss_ratio = rss_mb / self.max_rss_mb if (self.max_rss_mb and rss_mb) else 0
+
+        if max(job_ratio, rss_ratio) >= 1:
+            reason = f"{self.jobs_on_driver} jobs" if job_ratio >= 1 else f"{rss_mb:.0f} MB RSS"
+            self.recycle(reason)
+        elif max(job_ratio, rss_ratio) >= self.standby_at:
+            self._prepare_standby()
+
+        return self.driver
+
+    def recycle(self, reason="manual"):
+        """
+        Swaps in a fresh browser. Uses the warm standby if it is ready,
+        otherwise starts a new one synchronously.
+
+        Parameters:
+            reason (str): Why the browser is recycled (for the log)
+        """
+        with self._lock:
+            replacement = self._standby
+            self._standby = None
+
+        if replacement is None:
+            if self._standby_thread and self._standby_thread.is_alive():
+                self._standby_thread.join()
+                with self._lock:
+                    replacement = self._standby
+                    self._standby = None
+            if replacement is None:
+                replacement = self._new_driver()
+
+        old_driver = self.driver
+        self.driver = replacement
+        self.jobs_on_driver = 0
+        self.recycles += 1
+        print(f"Recycled browser after {reason} (recycle #{self.recycles})")
+
+        # Shut the old browser down in the background so the swap doesn't block
+        threading.Thread(target=self._retire, args=(old_driver,), daemon=True).start()
+
+    @staticmethod
+    def _retire(driver):
+        """Quit a replaced browser."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit the browser of the manager, including an unused standby."""
+        if self._standby_thread and self._standby_thread.is_alive():
+            self._standby_thread.join()
+        for driver in (self._standby, self.driver):
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+        self._standby = None
@@ -0,0 +1,207 @@
+import re
+import bisect
+from functools import lru_cache
+
+
+class KeywordMatcher:
+    r"""
+    Matches a list of keywords against titles with one compiled regular expression.
+
+    All keywords are combined into a single alternation (longest first) inside a
+    lookahead, so one scan of a title finds every keyword occurrence. With word
+    boundaries (opt-in), "AI" no longer matches "maintain" and "ML" no longer matches "HTML".
+    Keywords that start and end with word characters share one leading (?<!\w)
+    check, which rejects most positions before any alternative is tried.
+    """
+
+    def __init__(self, keywords, word_boundaries=False, case_insensitive=True):
+        """
+        Compiles the matcher.
+
+        Parameters:
+            keywords (list): Keywords to look for
+            word_boundaries (bool): Only match keywords as whole words
+            case_insensitive (bool): Compare case-folded text
+        """
+        self.case_insensitive = case_insensitive
+        self.word_boundaries = word_boundaries
+        self.keywords = [kw for kw in dict.fromkeys(k.strip() for k in keywords or []) if kw]
+
+        # Normalized form -> keyword as written in the settings
+        self._by_key = {}
+        for keyword in self.keywords:
+            self._by_key.setdefault(self._normalize(keyword), keyword)
+
+        self.pattern = self._compile(sorted(self._by_key, key=len, reverse=True)) if self._by_key else None
+
+    def _normalize(self, text):
+        return text.casefold() if self.case_insensitive else text
+
+    def _compile(self, keys):
+        """
+        Builds the combined pattern. Each branch is a zero-width lookahead that
+        captures the keyword, so finditer also reports matches that start inside
+        a longer one, e.g. "Learning" within "Machine Learning".
+        """
+        if not self.word_boundaries:
+            return re.compile("(?=(" + "|".join(re.escape(key) for key in keys) + "))")
+
+        # Keywords with word characters at both ends share the boundary checks
+        words = [key for key in keys if re.match(r"\w", key) and re.search(r"\w$", key)]
+        others = [key for key in keys if key not in words]
+        branches = []
+        if words:
+            branches.append(r"(?<!\w)(?=(" + "|".join(re.escape(key) for key in words) + r")(?!\w))")
+        if others:
+            # Boundaries only apply at edges that are word characters (".net" matches "asp.net")
+            alternatives = []
+            for key in others:
+                pattern = re.escape(key)
+                if re.match(r"\w", key):
+                    pattern = r"(?<!\w)" + pattern
+                if re.search(r"\w$", key):
+                    pattern = pattern + r"(?!\w)"
+                alternatives.append(pattern)
+            branches.append("(?=(" + "|".join(alternatives) + "))")
+        return re.compile("|".join(branches))
+
+    def _keyword(self, match):
+        """Keyword (as written in the settings) captured by a match of the pattern."""
+        return self._by_key[match.group(match.lastindex)]
+
+    def __bool__(self):
+        return self.pattern is not None
+
+    def search(self, title):
+        """Return True if any keyword occurs in the title."""
+        return bool(self.pattern and self.pattern.search(self._normalize(title or "")))
+
+    def matches(self, title):
+        """
+        Finds the keywords that occur in a title.
+
+        Parameters:
+            title (str): Job title
+
+        Returns:
+            list: Matched keywords as written in the settings, in order of appearance
+        """
+        if not self.pattern:
+            return []
+        found = dict.fromkeys(
+            self._keyword(match) for match in self.pattern.finditer(self._normalize(title or ""))
+        )
+        return list(found)
+
+    def match_many(self, titles):
+        """
+        Finds the matched keywords of many titles in a single scan.
+
+        The titles are joined with newlines (never part of a keyword and never a
+        word character) and every match is mapped back to its title by offset.
+
+        Parameters:
+            titles (list): Job titles
+
+        Returns:
+            list: One list of matched keywords per title
+        """
+        # Offsets come from the normalized titles: case folding can change a
+        # title's length ("ß" becomes "ss")
+        titles = [self._normalize(title or "") for title in titles]
+        results = [[] for _ in titles]
+        if not self.pattern or not titles:
+            return results
+
+        starts = []
+        offset = 0
+        for title in titles:
+            starts.append(offset)
+            offset += len(title) + 1
+        text = "\n".join(titles)
+
+        for match in self.pattern.finditer(text):
+            index = bisect.bisect_right(starts, match.start()) - 1
+            keyword = self._keyword(match)
+            if keyword not in results[index]:
+                results[index].append(keyword)
+        return results
+
+
+class TitleFilter:
+    """Include/exclude title filtering built from two compiled KeywordMatchers."""
+
+    def __init__(self, include_keywords=None, exclude_keywords=None, word_boundaries=False, case_insensitive=True):
+        """
+        Parameters:
+            include_keywords (list): At least one must appear in the title (empty: no requirement)
+            exclude_keywords (list): None may appear in the title
+            word_boundaries (bool): Only match keywords as whole words
+            case_insensitive (bool): Ignore case when matching
+        """
+        self.include_keywords = list(include_keywords or [])
+        self.include = KeywordMatcher(self.include_keywords, word_boundaries, case_insensitive)
+        self.exclude = KeywordMatcher(exclude_keywords, word_boundaries, case_insensitive)
+
+    def _reason(self, has_include, excluded_matches):
+        """Exclusion reason for a title, or "" if it is kept."""
+        reason = ""
+        if excluded_matches:
+            reason = f"Contains excluded keywords: {', '.join(excluded_matches)}"
+        if self.include and not has_include:
+            reason = f"Missing required keywords: {', '.join(self.include_keywords)}"
+        return reason
+
+    def classify(self, title):
+        """
+        Decides whether a title is kept.
+
+        Parameters:
+            title (str): Job title
+
+        Returns:
+            tuple: (include_job, exclusion_reason)
+        """
+        reason = self._reason(self.include.search(title), self.exclude.matches(title))
+        return not reason, reason
+
+    def filter_titles(self, titles):
+        """
+        Classifies a batch of titles. Excluded keywords are found in one scan of
+        the whole batch; the include check stops at the first match of each title.
+
+        Parameters:
+            titles (list): Job titles
+
+        Returns:
+            list: (include_job, exclusion_reason) per title
+        """
+        search = self.include.search
+        reasons = [
+            self._reason(search(title), excluded)
+            for title, excluded in zip(titles, self.exclude.match_many(titles))
+        ]
+        return [(not reason, reason) for reason in reasons]
+
+
+@lru_cache(maxsize=16)
+def _cached_title_filter(include_keywords, exclude_keywords, word_boundaries, case_insensitive):
+    return TitleFilter(include_keywords, exclude_keywords, word_boundaries, case_insensitive)
+
+
+def get_title_filter(include_keywords=None, exclude_keywords=None, word_boundaries=False, case_insensitive=True):
+    """
+    Returns a TitleFilter for the keyword lists, compiling it only once per distinct settings.
+
+    Parameters:
+        include_keywords (list): Include keywords
+        exclude_keywords (list): Exclude keywords
+        word_boundaries (bool): Only match keywords as whole words
+        case_insensitive (bool): Ignore case when matching
+
+    Returns:
+        TitleFilter: The shared compiled filter
+    """
+    return _cached_title_filter(
+        tuple(include_keywords or ()), tuple(exclude_keywords or ()), word_boundaries, case_insensitive
+    )
@@ -0,0 +1,363 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+# Columns shared by the ledger, the legacy Excel files and the exports
+JOB_COLUMNS = ["Job Title", "Job URL", "Company", "Location", "Employment Type", "Posted Date", "Applied"]
+
+# Legacy Excel files that are imported into the ledger once
+LEGACY_EXCEL_FILES = {
+    "applied_jobs.xlsx": "applied",
+    "not_applied_jobs.xlsx": "not_applied",
+}
+
+DEFAULT_LEDGER_FILE = "job_ledger.db"
+
+
+def job_guid_from_url(job_url):
+    """
+    Extracts the Dice job GUID from a job detail URL.
+
+    Parameters:
+        job_url (str): Job URL such as https://www.dice.com/job-detail/<guid>
+
+    Returns:
+        str: The job GUID, or the URL itself if it has no job-detail segment
+    """
+    if not job_url:
+        return ""
+    job_url = str(job_url).strip()
+    marker = "/job-detail/"
+    if marker in job_url:
+        return job_url.split(marker, 1)[1].split("?", 1)[0].split("/", 1)[0]
+    return job_url
+
+
+class ApplicationLedger:
+    """
+    Append-only SQLite ledger of application outcomes.
+
+    Every outcome is a new row, so recording a job never rewrites history.
+    Rows are buffered and committed in groups to keep the per-job cost low.
+    """
+
+    def __init__(self, db_path=DEFAULT_LEDGER_FILE, commit_every=20, commit_interval=5.0):
+        """
+        Opens (or creates) the ledger database.
+
+        Parameters:
+            db_path (str): Path to the SQLite database file
+            commit_every (int): Number of buffered rows that triggers a commit
+            commit_interval (float): Maximum seconds a row may stay buffered
+        """
+        self.db_path = db_path
+        self.commit_every = commit_every
+        self.commit_interval = commit_interval
+        self._lock = threading.RLock()
+        self._pending = []
+        self._pending_applied = set()
+        self._last_commit = time.time()
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create tables and indexes if they don't exist."""
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS applications (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_guid TEXT NOT NULL,
+                    job_url TEXT NOT NULL,
+                    job_title TEXT,
+                    company TEXT,
+                    location TEXT,
+                    employment_type TEXT,
+                    posted_date TEXT,
+                    status TEXT NOT NULL,
+                    reason TEXT,
+                    recorded_at TEXT NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_applications_guid_status ON applications(job_guid, status)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_applications_url ON applications(job_url)"
+            )
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS imports (
+                    source TEXT PRIMARY KEY,
+                    rows INTEGER NOT NULL,
+                    imported_at TEXT NOT NULL
+                )
+            """)
+
+    def record(self, job, status, reason=None):
+        """
+        Appends an outcome for a job. The row is committed with the next group commit.
+
+        Parameters:
+            job (dict): Job entry with the usual "Job Title", "Job URL", ... keys
+            status (str): Outcome such as "applied" or "not_applied"
+            reason (str): Optional reason for the outcome
+        """
+        job_url = str(job.get("Job URL") or "").strip()
+        job_guid = job_guid_from_url(job_url)
+        row = (
+            job_guid,
+            job_url,
+            job.get("Job Title"),
+            job.get("Company"),
+            job.get("Location"),
+            job.get("Employment Type"),
+            job.get("Posted Date"),
+            status,
+            reason,
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+        with self._lock:
+            self._pending.append(row)
+            if status == "applied":
+                self._pending_applied.add(job_guid)
+
+            if (len(self._pending) >= self.commit_every or
+                    time.time() - self._last_commit >= self.commit_interval):
+                self.flush()
+
+    def flush(self):
+        """Commit all buffered rows in a single transaction."""
+        with self._lock:
+            if self._pending:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT INTO applications (job_guid, job_url, job_title, company, location, "
+                        "employment_type, posted_date, status, reason, recorded_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        self._pending,
+                    )
+                self._pending = []
+                self._pending_applied = set()
+            self._last_commit = time.time()
+
+    def has_applied(self, job_url):
+        """
+        Checks whether a job was already applied to, using the GUID index.
+
+        Parameters:
+            job_url (str): Job URL or GUID
+
+        Returns:
+            bool: True if an "applied" outcome exists for the job
+        """
+        job_guid = job_guid_from_url(job_url)
+        with self._lock:
+            if job_guid in self._pending_applied:
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM applications WHERE job_guid = ? AND status = 'applied' LIMIT 1",
+                (job_guid,),
+            ).fetchone()
+        return row is not None
+
+    def count(self, status):
+        """Return the number of distinct jobs whose latest outcome is the given status."""
+        self.flush()
+        with self._lock:
+            row = self._conn.execute("""
+                SELECT COUNT(*) FROM applications a
+                WHERE a.status = ? AND a.id = (
+                    SELECT MAX(b.id) FROM applications b WHERE b.job_guid = a.job_guid
+                )
+            """, (status,)).fetchone()
+        return row[0] if row else 0
+
+    def iter_jobs(self, status):
+        """
+        Yields job entries whose latest outcome is the given status, oldest first.
+
+        Parameters:
+            status (str): Outcome to select
+
+        Yields:
+            dict: Job entry with the standard job columns
+        """
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT a.job_title, a.job_url, a.company, a.location, a.employment_type,
+                       a.posted_date, a.status
+                FROM applications a
+                WHERE a.status = ? AND a.id = (
+                    SELECT MAX(b.id) FROM applications b WHERE b.job_guid = a.job_guid
+                )
+                ORDER BY a.id
+            """, (status,)).fetchall()
+
+        for row in rows:
+            yield {
+                "Job Title": row[0],
+                "Job URL": row[1],
+                "Company": row[2],
+                "Location": row[3],
+                "Employment Type": row[4],
+                "Posted Date": row[5],
+                "Applied": row[6] == "applied",
+            }
+
+    def iter_outcomes(self):
+        """
+        Yields the latest outcome of every job, for statistics over past runs.
+
+        Yields:
+            tuple: (job_title, company, status)
+        """
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT a.job_title, a.company, a.status
+                FROM applications a
+                WHERE a.id = (
+                    SELECT MAX(b.id) FROM applications b WHERE b.job_guid = a.job_guid
+                )
+            """).fetchall()
+        yield from rows
+
+    def export_excel(self, status, filename):
+        """
+        Streams the jobs with the given latest status to an Excel file.
+
+        Parameters:
+            status (str): Outcome to export
+            filename (str): Destination .xlsx path
+
+        Returns:
+            int: Number of exported rows
+        """
+        try:
+            from dice_auto_apply.core.report_writer import write_excel
+        except ImportError:
+            try:
+                from ..core.report_writer import write_excel
+            except ImportError:
+                from core.report_writer import write_excel
+
+        return write_excel(self.iter_jobs(status), filename, JOB_COLUMNS)
+
+    def import_excel(self, filename, status):
+        """
+        Bulk imports a legacy Excel file into the ledger. Each file is imported only once.
+
+        Parameters:
+            filename (str): Path to the .xlsx file
+            status (str): Outcome to record for every row of the file
+
+        Returns:
+            int: Number of imported rows (0 if the file was already imported or missing)
+        """
+        if not os.path.exists(filename):
+            return 0
+
+        source = os.path.abspath(filename)
+        with self._lock:
+            already = self._conn.execute(
+                "SELECT 1 FROM imports WHERE source = ?", (source,)
+            ).fetchone()
+        if already:
+            return 0
+
+        import pandas as pd
+
+        df = pd.read_excel(filename)
+        if "Job URL" not in df.columns:
+            df = pd.DataFrame(columns=JOB_COLUMNS)
+        df = df.dropna(subset=["Job URL"]).astype(object)
+        df = df.where(pd.notnull(df), None)
+
+        recorded_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = [
+            (
+                job_guid_from_url(job.get("Job URL")),
+                str(job.get("Job URL")).strip(),
+                job.get("Job Title"),
+                job.get("Company"),
+                job.get("Location"),
+                job.get("Employment Type"),
+                job.get("Posted Date"),
+                status,
+                "imported from " + os.path.basename(filename),
+                recorded_at,
+            )
+            for job in df.to_dict("records")
+        ]
+
+        self.flush()
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO applications (job_guid, job_url, job_title, company, location, "
+                    "employment_type, posted_date, status, reason, recorded_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute(
+                    "INSERT INTO imports (source, rows, imported_at) VALUES (?, ?, ?)",
+                    (source, len(rows), recorded_at),
+                )
+        return len(rows)
+
+    def import_legacy_files(self, directory="."):
+        """
+        Imports applied_jobs.xlsx / not_applied_jobs.xlsx from a directory if not done yet.
+
+        Parameters:
+            directory (str): Directory holding the legacy Excel files
+
+        Returns:
+            int: Total number of imported rows
+        """
+        total = 0
+        for filename, status in LEGACY_EXCEL_FILES.items():
+            path = os.path.join(directory, filename)
+            try:
+                imported = self.import_excel(path, status)
+                if imported:
+                    print(f"Imported {imported} rows from {filename} into the application ledger")
+                total += imported
+            except Exception as e:
+                print(f"Error importing {filename} into the ledger: {e}")
+        return total
+
+    def close(self):
+        """Flush buffered rows and close the database."""
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+
+def open_ledger(db_path=DEFAULT_LEDGER_FILE):
+    """
+    Opens the application ledger and imports the legacy Excel files on first use.
+
+    Parameters:
+        db_path (str): Path to the SQLite database file
+
+    Returns:
+        ApplicationLedger: The opened ledger
+    """
+    ledger = ApplicationLedger(db_path)
+    ledger.import_legacy_files(os.path.dirname(os.path.abspath(db_path)))
+    return ledger
+
+
+if __name__ == "__main__":
+    # Running the module directly performs the one-time import and prints a summary
+    ledger = open_ledger()
+    print(f"Applied jobs in ledger: {ledger.count('applied')}")
+    print(f"Not applied jobs in ledger: {ledger.count('not_applied')}")
+    ledger.close()
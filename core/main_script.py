@@ -1,40 +1,97 @@
 import os
-import json
-import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import ElementClickInterceptedException
+from selenium.common.exceptions import ElementClickInterceptedException, WebDriverException, TimeoutException
 from dotenv import load_dotenv
 import time
 import re
+import argparse
 import pyautogui
 import datetime
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import quote
 # Try both absolute and relative imports for compatibility
 try:
     from dice_auto_apply.core.browser_detector import get_browser_path
-    from dice_auto_apply.core.dice_login import login_to_dice
+    from dice_auto_apply.core.dice_login import export_session_cookies
+    from dice_auto_apply.core.ledger import open_ledger, job_guid_from_url
+    from dice_auto_apply.core.driver_cache import resolve_chromedriver_path, probe_driver, StartupTimer
+    from dice_auto_apply.core.report_writer import StreamingJobWriter, EXCLUDED_COLUMNS
+    from dice_auto_apply.core.search_client import DiceSearchClient, build_search_url, pages_for_total, JOBS_PER_PAGE
+    from dice_auto_apply.core.page_scripts import (
+        FETCH_PAGES_SCRIPT, EXTRACT_CARDS_SCRIPT, WAIT_FOR_ELEMENTS_SCRIPT, APPLY_FLOW_SCRIPT
+    )
+    from dice_auto_apply.core.keyword_matcher import get_title_filter
+    from dice_auto_apply.core.crawl_watermarks import CrawlWatermarks
+    from dice_auto_apply.core.timeout_policy import get_timeout_policy
+    from dice_auto_apply.core.rate_controller import get_rate_controller
+    from dice_auto_apply.core.session_store import ensure_logged_in
+    from dice_auto_apply.core.pipeline import JobPipeline, format_pipeline_counts
+    from dice_auto_apply.core.run_journal import RunJournal
+    from dice_auto_apply.core.apply_scheduler import PriorityJobQueue, build_job_scorer
+    from dice_auto_apply.core.resource_policy import enable_resource_blocking, set_resource_profile, load_page, profile_for_url
 except ImportError:
     try:
         from ..core.browser_detector import get_browser_path
-        from ..core.dice_login import login_to_dice
+        from ..core.dice_login import export_session_cookies
+        from ..core.ledger import open_ledger, job_guid_from_url
+        from ..core.driver_cache import resolve_chromedriver_path, probe_driver, StartupTimer
+        from ..core.report_writer import StreamingJobWriter, EXCLUDED_COLUMNS
+        from ..core.search_client import DiceSearchClient, build_search_url, pages_for_total, JOBS_PER_PAGE
+        from ..core.page_scripts import (
+            FETCH_PAGES_SCRIPT, EXTRACT_CARDS_SCRIPT, WAIT_FOR_ELEMENTS_SCRIPT, APPLY_FLOW_SCRIPT
+        )
+        from ..core.keyword_matcher import get_title_filter
+        from ..core.crawl_watermarks import CrawlWatermarks
+        from ..core.timeout_policy import get_timeout_policy
+        from ..core.rate_controller import get_rate_controller
+        from ..core.session_store import ensure_logged_in
+        from ..core.pipeline import JobPipeline, format_pipeline_counts
+        from ..core.run_journal import RunJournal
+        from ..core.apply_scheduler import PriorityJobQueue, build_job_scorer
+        from ..core.resource_policy import enable_resource_blocking, set_resource_profile, load_page, profile_for_url
     except ImportError:
         from core.browser_detector import get_browser_path
-        from core.dice_login import login_to_dice
+        from core.dice_login import export_session_cookies
+        from core.ledger import open_ledger, job_guid_from_url
+        from core.driver_cache import resolve_chromedriver_path, probe_driver, StartupTimer
+        from core.report_writer import StreamingJobWriter, EXCLUDED_COLUMNS
+        from core.search_client import DiceSearchClient, build_search_url, pages_for_total, JOBS_PER_PAGE
+        from core.page_scripts import (
+            FETCH_PAGES_SCRIPT, EXTRACT_CARDS_SCRIPT, WAIT_FOR_ELEMENTS_SCRIPT, APPLY_FLOW_SCRIPT
+        )
+        from core.keyword_matcher import get_title_filter
+        from core.crawl_watermarks import CrawlWatermarks
+        from core.timeout_policy import get_timeout_policy
+        from core.rate_controller import get_rate_controller
+        from core.session_store import ensure_logged_in
+        from core.pipeline import JobPipeline, format_pipeline_counts
+        from core.run_journal import RunJournal
+        from core.apply_scheduler import PriorityJobQueue, build_job_scorer
+        from core.resource_policy import enable_resource_blocking, set_resource_profile, load_page, profile_for_url
 
 
 # Load environment variables
 load_dotenv()
 
-def get_web_driver(headless=False, retry_with_alternative=True):
+def find_free_port():
+    """
+    Asks the OS for a free local TCP port.
+    
+    Returns:
+        int: A port number that was free at the time of the call
+    """
+    import socket
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def get_web_driver(headless=False, retry_with_alternative=True, debugging_port=9222,
+                   page_load_strategy="eager", block_resources=True):
     """
     Initializes a Selenium WebDriver with fallback options.
     If the primary browser (Brave) fails to load, it will try Chrome as a fallback.
@@ -42,33 +99,23 @@ def get_web_driver(headless=False, retry_with_alternative=True):
     Parameters:
         headless (bool): Whether to use headless mode
         retry_with_alternative (bool): Whether to try alternative browsers if primary fails
+        debugging_port (int): Remote debugging port; each concurrent browser needs its own
+        page_load_strategy (str): "eager" returns from driver.get at DOMContentLoaded (callers
+            wait explicitly for what they need), "normal" waits for every resource
+        block_resources (bool): Block images, fonts, media and trackers per page type
+            (see core/resource_policy.py)
         
     Returns:
         WebDriver: Initialized WebDriver instance
     """
-    # Fix ChromeDriver permissions first
-    try:
-        # Import fix_chromedriver
-        import sys
-        import os
-        
-        # Add the parent directory to the path to find fix_chromedriver
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(script_dir)
-        if parent_dir not in sys.path:
-            sys.path.insert(0, parent_dir)
-            
-        # Run fix_chromedriver
-        from fix_chromedriver import fix_chromedriver_permissions
-        fix_chromedriver_permissions()
-    except Exception as e:
-        print(f"Warning: Could not fix ChromeDriver permissions: {e}")
-
-
     import platform  # Add this import for system detection
     
+    # Time each startup stage so slow steps are visible in the log
+    timer = StartupTimer()
+    
     # Get browser path from .env or detect it
     web_browser_path = get_browser_path()
+    timer.mark("browser path")
     
     if not web_browser_path:
         raise Exception("Browser path not found in .env file. Please set WEB_BROWSER_PATH.")
@@ -79,6 +126,7 @@ def get_web_driver(headless=False, retry_with_alternative=True):
     try:
         options = Options()
         options.binary_location = web_browser_path
+        options.page_load_strategy = page_load_strategy
         
         # Add headless mode options if requested
         if headless:
@@ -91,7 +139,7 @@ def get_web_driver(headless=False, retry_with_alternative=True):
         options.add_argument("--disable-web-security")
         options.add_argument("--disable-features=EnableEphemeralFlashPermission")
         options.add_argument("--no-sandbox")
-        options.add_argument("--remote-debugging-port=9222")
+        options.add_argument(f"--remote-debugging-port={debugging_port}")
         options.add_argument("--disable-infobars")
         options.add_argument("--disable-notifications")
         
@@ -99,14 +147,22 @@ def get_web_driver(headless=False, retry_with_alternative=True):
         options.add_argument("--disable-application-cache")
         options.add_argument("--incognito")
 
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        # Cached, version-matched chromedriver (permissions fixed once per binary)
+        driver_path = resolve_chromedriver_path(web_browser_path)
+        timer.mark("driver path")
+        
+        driver = webdriver.Chrome(service=Service(driver_path), options=options)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if block_resources:
+            enable_resource_blocking(driver)
+        timer.mark("launch")
         
-        # Test navigation to a simple page to verify browser is working
-        driver.get("https://www.google.com")
-        driver.find_element(By.TAG_NAME, "body")  # Should work if page loaded
+        # Local health probe to verify the browser is working (no network needed)
+        probe_driver(driver)
+        timer.mark("probe")
         
         print(f"Successfully initialized browser: {os.path.basename(web_browser_path)}")
+        timer.report()
         return driver
         
     except Exception as e:
@@ -148,6 +204,7 @@ def get_web_driver(headless=False, retry_with_alternative=True):
             try:
                 options = Options()
                 options.binary_location = alt_path
+                options.page_load_strategy = page_load_strategy
                 
                 if headless:
                     options.add_argument("--headless")
@@ -157,12 +214,15 @@ def get_web_driver(headless=False, retry_with_alternative=True):
                 options.add_argument("--disable-blink-features=AutomationControlled")
                 options.add_argument("--incognito")  # Use incognito to avoid cache issues
                 
-                driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+                driver = webdriver.Chrome(service=Service(resolve_chromedriver_path(alt_path)), options=options)
                 driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+                if block_resources:
+                    enable_resource_blocking(driver)
                 
-                # Test navigation
-                driver.get("https://www.google.com")
-                driver.find_element(By.TAG_NAME, "body")
+                # Local health probe
+                probe_driver(driver)
+                timer.mark("alternative browser")
+                timer.report()
                 
                 print(f"Successfully initialized alternative browser: {os.path.basename(alt_path)}")
                 
@@ -184,19 +244,143 @@ def get_web_driver(headless=False, retry_with_alternative=True):
 
 
 
-def apply_to_job_url(driver, job_url):
+def _leave_job_page(driver, original_url=None, park=False):
+    """
+    Optional navigation after a job: back to the page we came from, or onto
+    about:blank so the job page's memory is released before the next job.
+    """
+    if original_url:
+        load_page(driver, original_url)
+    elif park:
+        driver.get("about:blank")
+
+
+def run_apply_flow(driver, phase="detail", timeout=None, confirm_timeout=None, max_steps=10):
+    """
+    Runs the in-page Easy Apply state machine (APPLY_FLOW_SCRIPT) on the current document.
+    The time to Submit and to the confirmation is recorded in the timeout policy.
+
+    Parameters:
+        driver (WebDriver): Driver on a job detail or apply wizard page
+        phase (str): "detail" to find and click the apply control, "wizard" to step through the wizard
+        timeout (float): Seconds to reach the Submit button (default: learned "apply_flow" timeout)
+        confirm_timeout (float): Seconds to wait for the confirmation after Submit
+            (default: learned "apply_confirm" timeout)
+        max_steps (int): Maximum number of Next clicks
+
+    Returns:
+        dict: Outcome with "status", "kind", "href", per-step "steps" timings and "elapsedMs"
+    """
+    policy = get_timeout_policy()
+    timeout = policy.timeout("apply_flow") if timeout is None else timeout
+    confirm_timeout = policy.timeout("apply_confirm") if confirm_timeout is None else confirm_timeout
+    driver.set_script_timeout(timeout + confirm_timeout + 5)
+    outcome = driver.execute_async_script(
+        APPLY_FLOW_SCRIPT, phase, int(timeout * 1000), int(confirm_timeout * 1000), max_steps
+    )
+
+    status = outcome["status"]
+    step_ms = {step["step"]: step["ms"] for step in outcome.get("steps", [])}
+    if status in ("submitted", "submitted_unconfirmed"):
+        to_submit = 0
+        for step in outcome["steps"]:
+            to_submit += step["ms"]
+            if step["step"] == "submit":
+                break
+        policy.record("apply_flow", to_submit / 1000)
+        if status == "submitted":
+            policy.record("apply_confirm", step_ms.get("confirmation", 0) / 1000)
+        else:
+            policy.record("apply_confirm", confirm_timeout, timed_out=True)
+    elif status == "timeout":
+        # A job without an apply control says nothing about how long the wizard takes
+        policy.record("apply_flow", timeout, timed_out=True)
+    return outcome
+
+
+def _format_apply_steps(outcome):
+    """One-line summary of the step timings of apply outcomes."""
+    steps = ", ".join(f"{step['step']} {step['ms']}ms" for step in outcome.get("steps", []))
+    return f"{outcome['status']} in {outcome.get('elapsedMs', 0)}ms ({steps})"
+
+
+def _wait_for_new_document(driver):
+    """Wait until the document a click navigated to has been parsed."""
+    timeout = get_timeout_policy().timeout("page_load")
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") != "loading"
+    )
+
+
+def _run_apply_flow_across_pages(driver, max_navigations=5):
+    """
+    Runs the apply flow from the job detail page to the confirmation, following
+    full page loads. A navigation ends the running script, so the flow is rerun on
+    every new document; a Submit clicked before the navigation is remembered by
+    the page (sessionStorage), and the rerun only waits for the confirmation.
+
+    Parameters:
+        driver (WebDriver): Driver on a job detail page
+        max_navigations (int): Maximum number of page loads to follow
+
+    Returns:
+        dict: Outcome of the last flow run, with the steps of every run
+    """
+    phase = "detail"
+    steps = []
+    kind = None
+    outcome = {"status": "timeout", "steps": []}
+    for _ in range(max_navigations + 1):
+        try:
+            outcome = run_apply_flow(driver, phase)
+        except WebDriverException:
+            # A click started a full page load, which ends the script. From the detail
+            # page only a load of the wizard counts; anything else is a real error.
+            if phase == "detail" and profile_for_url(driver.current_url) != "wizard":
+                raise
+            navigation_start = time.time()
+            _wait_for_new_document(driver)
+            steps.append({"step": "navigation", "ms": int((time.time() - navigation_start) * 1000)})
+            phase = "wizard"
+            continue
+
+        steps.extend(outcome.get("steps", []))
+        kind = kind or outcome.get("kind")
+        if outcome["status"] != "navigate":
+            break
+        # Apply anchors continue on the wizard document
+        if outcome.get("href"):
+            load_page(driver, outcome["href"], "wizard")
+        phase = "wizard"
+
+    outcome["steps"] = steps
+    outcome["kind"] = kind
+    return outcome
+
+
+def apply_to_job_url(driver, job_url, return_to_original=False, park=False):
     """
     Applies to a job without opening a new tab, preventing focus stealing.
-    Instead navigates to job URL in the same tab and returns to original URL when done.
+    Navigates to the job URL in the same tab. By default the driver stays on the
+    job page, so the next job URL is loaded directly without reloading the search page.
+
+    The apply flow itself runs inside the page (see run_apply_flow); Python only
+    steps in when the flow has to continue on another document.
+
+    Parameters:
+        driver (WebDriver): Logged-in driver
+        job_url (str): Job detail URL
+        return_to_original (bool): Navigate back to the previous page when done
+        park (bool): Load about:blank when done (ignored if return_to_original is set)
+
+    Returns:
+        bool: True if the application was submitted (or already existed)
     """
-    # Store current URL to return to later
-    original_url = driver.current_url
-    
-    # Navigate to job URL in the same tab
-    driver.get(job_url)
+    # Store current URL to return to later (only when asked, it's a WebDriver round trip)
+    original_url = driver.current_url if return_to_original else None
     
-    # Dice pages can be slow/heavy; give a bit more time for the apply control to become interactable
-    wait = WebDriverWait(driver, 20)
+    # Navigate to job URL in the same tab (images, fonts and trackers are blocked if enabled)
+    load_page(driver, job_url, "detail")
     applied = False
     
     # move pointer to prevent sleeping
@@ -204,505 +388,425 @@ def apply_to_job_url(driver, job_url):
     pyautogui.moveRel(-1, -1, duration=0.1)
 
     try:
-        # Dice UI has evolved multiple times. Current (Feb 2026) uses:
-        # - button[data-testid="apply-button"] with text "Apply Now" or "Easy Apply"
-        # - Located inside a job-detail-header-card or the older #applyButton container
-        #
-        # We poll until the button appears and has actionable text.
-        max_attempts = 40  # ~20 seconds at 0.5s intervals
-        status = None
-        apply_kind = None
-
-        for _ in range(max_attempts):
-            apply_check = driver.execute_script("""
-                // 2026 Dice UI: button with data-testid="apply-button"
-                const applyBtn = document.querySelector('button[data-testid="apply-button"]');
-                if (applyBtn) {
-                    const text = (applyBtn.textContent || '').trim();
-                    const disabled = applyBtn.disabled || applyBtn.getAttribute('aria-disabled') === 'true';
-                    return { found: true, kind: 'button', text, disabled };
-                }
-
-                // 2026 Dice UI variant: anchor <a> with data-testid="apply-button" (can be anywhere in page)
-                const applyAnchor = document.querySelector('a[data-testid="apply-button"]');
-                if (applyAnchor) {
-                    const text = (applyAnchor.textContent || '').trim();
-                    const href = applyAnchor.getAttribute('href') || '';
-                    const ariaDisabled = applyAnchor.getAttribute('aria-disabled');
-                    return { found: true, kind: 'anchor', text, href, ariaDisabled };
-                }
-
-                // Legacy: shadow DOM web component
-                const applyButtonWc = document.querySelector('apply-button-wc');
-                if (applyButtonWc && applyButtonWc.shadowRoot) {
-                    const shadowText = applyButtonWc.shadowRoot.textContent || '';
-                    if (shadowText.includes('Application Submitted')) {
-                        return { found: true, kind: 'shadow', status: 'already_applied' };
-                    }
-                    if ((shadowText || '').toLowerCase().includes('easy apply') ||
-                        (shadowText || '').toLowerCase().includes('apply now') ||
-                        (shadowText || '').toLowerCase().includes('apply')) {
-                        return { found: true, kind: 'shadow', status: 'can_apply' };
-                    }
-                    return { found: true, kind: 'shadow', status: 'unknown' };
-                }
-
-                return { found: false };
-            """)
-
-            if apply_check and apply_check.get("found"):
-                apply_kind = apply_check.get("kind")
-
-                if apply_kind == "button":
-                    text = (apply_check.get("text") or "").strip()
-                    text_l = text.lower()
-                    disabled = apply_check.get("disabled", False)
-
-                    if "applied" in text_l or "application submitted" in text_l:
-                        status = "already_applied"
-                        break
-
-                    if ("apply now" in text_l or "easy apply" in text_l or "apply" in text_l) and not disabled:
-                        status = "can_apply"
-                        break
-
-                    # Button present but not yet hydrated or still disabled; keep waiting.
-                    status = None
-
-                elif apply_kind == "anchor":
-                    text = (apply_check.get("text") or "").strip()
-                    href = (apply_check.get("href") or "").strip()
-                    text_l = text.lower()
-
-                    if "applied" in text_l or "application submitted" in text_l:
-                        status = "already_applied"
-                        break
-
-                    # Match "Apply", "Easy Apply", "Apply Now", or href pointing to wizard
-                    if text_l in ("apply", "easy apply", "apply now") or "apply" in text_l or ("/job-applications/" in href and "/wizard" in href):
-                        status = "can_apply"
-                        break
-
-                    status = None
-
-                else:
-                    shadow_status = apply_check.get("status", "unknown")
-                    if shadow_status in {"already_applied", "can_apply"}:
-                        status = shadow_status
-                        break
-                    status = None
-
-            time.sleep(0.5)
-
-        if not status:
-            driver.get(original_url)
-            return False
+        # The wizard keeps its fonts; switch before the apply click navigates to it
+        set_resource_profile(driver, "wizard")
+        outcome = _run_apply_flow_across_pages(driver)
 
+        status = outcome["status"]
         if status == "already_applied":
             print(f"Skipping this Job as it is already applied: {job_url}")
             applied = True
-
-        elif status == "can_apply":
-            click_success = False
-
-            if apply_kind == "button":
-                # New Dice UI: button[data-testid="apply-button"]
-                try:
-                    apply_button = wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[data-testid="apply-button"]'))
-                    )
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'nearest'});", apply_button)
-                    time.sleep(0.2)
-                    try:
-                        apply_button.click()
-                    except Exception:
-                        driver.execute_script("arguments[0].click();", apply_button)
-                    click_success = True
-                except Exception as e:
-                    print(f"Failed to click Apply button: {e}")
-                    click_success = False
-
-            elif apply_kind == "anchor":
-                # Anchor <a> with data-testid="apply-button" (can be anywhere in page)
-                try:
-                    easy_apply_link = wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'a[data-testid="apply-button"]'))
-                    )
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'nearest'});", easy_apply_link)
-                    time.sleep(0.3)
-                    try:
-                        wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'a[data-testid="apply-button"]')))
-                        easy_apply_link.click()
-                    except Exception:
-                        driver.execute_script("arguments[0].click();", easy_apply_link)
-                    click_success = True
-                except Exception as e:
-                    print(f"Failed to click Apply link: {e}")
-                    click_success = False
-
-            else:
-                # Legacy: shadow-DOM web component click
-                click_success = driver.execute_script("""
-                    const applyButtonWc = document.querySelector('apply-button-wc');
-                    if (!applyButtonWc || !applyButtonWc.shadowRoot) return false;
-
-                    const easyApplyBtn =
-                        applyButtonWc.shadowRoot.querySelector('button.btn.btn-primary') ||
-                        (applyButtonWc.shadowRoot.querySelector('apply-button') &&
-                         applyButtonWc.shadowRoot.querySelector('apply-button').shadowRoot &&
-                         applyButtonWc.shadowRoot.querySelector('apply-button').shadowRoot.querySelector('button.btn.btn-primary')) ||
-                        Array.from(applyButtonWc.shadowRoot.querySelectorAll('button')).find(btn =>
-                            (btn.textContent || '').toLowerCase().includes('easy apply') ||
-                            (btn.textContent || '').toLowerCase().includes('apply now')
-                        );
-
-                    if (!easyApplyBtn) return false;
-                    easyApplyBtn.click();
-                    return true;
-                """)
-
-            if click_success:
-                # Continue with the application process
-                try:
-                    # Dice "Easy Apply" is a multi-step wizard. Keep clicking "Next" until "Submit" appears.
-                    next_locator = (
-                        By.XPATH,
-                        "//button[not(@disabled) and (@type='submit' or @type='button') and "
-                        "(normalize-space(.)='Next' or .//span[normalize-space()='Next'])]",
-                    )
-                    submit_locator = (
-                        By.XPATH,
-                        "//button[not(@disabled) and (@type='submit' or @type='button') and "
-                        "(normalize-space(.)='Submit' or .//span[normalize-space()='Submit'])]",
-                    )
-
-                    # Fast polling so we click as soon as buttons appear (avoid long "Submit" waits)
-                    step_wait = WebDriverWait(driver, 12, poll_frequency=0.2)
-                    max_steps = 10
-                    submitted = False
-
-                    for _ in range(max_steps):
-                        # Check immediately for Submit/Next (no blocking waits that delay Next)
-                        submit_candidates = driver.find_elements(*submit_locator)
-                        submit_button = next((b for b in submit_candidates if b.is_displayed() and b.is_enabled()), None)
-                        if submit_button:
-                            driver.execute_script(
-                                "arguments[0].scrollIntoView({block: 'center', inline: 'nearest'});",
-                                submit_button,
-                            )
-                            time.sleep(0.1)
-                            try:
-                                submit_button.click()
-                            except Exception:
-                                driver.execute_script("arguments[0].click();", submit_button)
-                            submitted = True
-                            break
-
-                        next_candidates = driver.find_elements(*next_locator)
-                        next_button = next((b for b in next_candidates if b.is_displayed() and b.is_enabled()), None)
-                        if next_button:
-                            driver.execute_script(
-                                "arguments[0].scrollIntoView({block: 'center', inline: 'nearest'});",
-                                next_button,
-                            )
-                            time.sleep(0.1)
-                            try:
-                                next_button.click()
-                            except Exception:
-                                driver.execute_script("arguments[0].click();", next_button)
-                        else:
-                            # Neither button is ready yet; wait (fast poll) until one becomes clickable.
-                            def _ready_button(d):
-                                for loc in (submit_locator, next_locator):
-                                    try:
-                                        el = d.find_element(*loc)
-                                        if el.is_displayed() and el.is_enabled():
-                                            return el
-                                    except Exception:
-                                        continue
-                                return False
-
-                            step_wait.until(_ready_button)
-                            continue
-
-                        # Let the wizard step render/hydrate (staleness isn't always reliable with React)
-                        time.sleep(0.5)
-                    
-                    # Wait for confirmation (Dice has multiple success UIs)
-                    try:
-                        confirmation_wait = WebDriverWait(driver, 30)
-                        confirmation_wait.until(
-                            EC.presence_of_element_located(
-                                (
-                                    By.CSS_SELECTOR,
-                                    '[data-testid="job-application-success-card"]',
-                                )
-                            )
-                        )
-                        print(f"Application confirmed for New Job: {job_url}")
-                        applied = True
-                    except Exception:
-                        # Backwards-compatible fallback for older Dice success banner
-                        try:
-                            confirmation_wait = WebDriverWait(driver, 15)
-                            confirmation_wait.until(
-                                EC.presence_of_element_located(
-                                    (
-                                        By.XPATH,
-                                        "//header[contains(@class, 'post-apply-banner')]//h1[contains(text(), 'Application submitted')]",
-                                    )
-                                )
-                            )
-                            print(f"Application confirmed for New Job: {job_url}")
-                            applied = True
-                        except Exception as e:
-                            print(f"Could not confirm application submission: {e}")
-                            applied = submitted
-                        
-                except Exception as e:
-                    applied = False
-            else:
-                print("Failed to click Easy apply button")
-                applied = False
-        else:
-            print(f"Unknown shadow DOM state: {status}")
-            applied = False
+        elif status == "submitted":
+            print(f"Application confirmed for New Job: {job_url}")
+            applied = True
+        elif status == "submitted_unconfirmed":
+            print(f"Could not confirm application submission: {job_url}")
+            applied = True
+        elif status == "click_failed":
+            print(f"Failed to click Easy apply button: {outcome.get('error', '')}")
+        print(f"Apply flow {_format_apply_steps(outcome)}")
             
     except Exception as e:
         print(f"Error in application process: {e}")
         applied = False
         
-    # Always return to the original URL
-    driver.get(original_url)
+    _leave_job_page(driver, original_url, park)
     return applied
 
-def fetch_jobs_with_requests(driver, search_query, include_keywords=None, exclude_keywords=None):
+def filter_jobs(jobs, include_keywords=None, exclude_keywords=None, word_boundaries=False):
     """
-    Use the existing browser instance to fetch job listings.
+    Splits job entries into included and excluded jobs by their title keywords.
+
+    Parameters:
+        jobs (list): Job entries
+        include_keywords (list): At least one must appear in the title
+        exclude_keywords (list): None may appear in the title
+        word_boundaries (bool): Match keywords as whole words ("AI" doesn't match "maintain")
+            instead of substrings
+
+    Returns:
+        tuple: (included_jobs, excluded_jobs); excluded jobs get an "Exclusion Reason"
+    """
+    title_filter = get_title_filter(include_keywords, exclude_keywords, word_boundaries)
+    decisions = title_filter.filter_titles([job_entry["Job Title"] for job_entry in jobs])
+    
+    included_jobs = []
+    excluded_jobs = []
+    for job_entry, (include_job, exclusion_reason) in zip(jobs, decisions):
+        if include_job:
+            included_jobs.append(job_entry)
+        else:
+            job_entry["Exclusion Reason"] = exclusion_reason
+            excluded_jobs.append(job_entry)
+    return included_jobs, excluded_jobs
+
+
+def fetch_jobs_with_requests(driver, search_query, include_keywords=None, exclude_keywords=None,
+                             mode="http", search_client=None, word_boundaries=False,
+                             seen_guids=None, query_stats=None, watermark=None):
+    """
+    Fetches and filters the job listings of a search query.
+
+    Parameters:
+        driver (WebDriver): Logged-in driver (its session is shared with the HTTP client)
+        search_query (str): Search query
+        include_keywords (list): Keywords of which at least one must be in the title
+        exclude_keywords (list): Keywords that exclude a job
+        mode (str): "http" to fetch result pages with requests, "page_fetch" to fetch them from inside
+            the loaded page with one async script, "browser" to page through them in the driver
+        search_client (DiceSearchClient): Client reused across queries (created from the driver if omitted)
+        word_boundaries (bool): Match keywords as whole words instead of substrings
+        seen_guids (set): Run-wide set of job GUIDs already processed by earlier queries.
+            Cards in it are skipped without being read; new GUIDs are added to it.
+        query_stats (dict): Receives the card count, new job count and novelty rate of the query
+        watermark (QueryWatermark): What earlier runs decided for this query (see CrawlWatermarks);
+            its jobs are skipped like seen_guids
+
+    Returns:
+        tuple: (included_jobs, excluded_jobs)
     """
     print(f"Fetching jobs for query: {search_query}")
     
-    # Format search parameters for URL
-    encoded_query = quote(search_query)
+    stats = {"cards": 0}
+    jobs = None
+    if mode == "http":
+        client = search_client or DiceSearchClient.from_driver(driver)
+        try:
+            jobs = client.search(search_query, seen_guids=seen_guids, stats=stats, watermark=watermark)
+        finally:
+            if search_client is None:
+                client.close()
+        if jobs is None:
+            print("Search results could not be read over HTTP, fetching them from inside the browser")
     
-    # Updated URL structure
-    base_url = f"https://www.dice.com/jobs?filters.employmentType=CONTRACTS&filters.postedDate=ONE&q={encoded_query}"
+    if jobs is None and mode in ("http", "page_fetch"):
+        jobs = fetch_jobs_with_page_fetch(driver, search_query, seen_guids=seen_guids, stats=stats,
+                                          watermark=watermark)
     
-    included_jobs = []
-    excluded_jobs = []
-    total_jobs_found = 0
+    if jobs is None:
+        jobs = fetch_jobs_with_browser(driver, search_query, seen_guids=seen_guids, stats=stats,
+                                       watermark=watermark)
     
-    # Create WebDriverWait objects with different timeout values
-    short_wait = WebDriverWait(driver, 20)
-    medium_wait = WebDriverWait(driver, 60)  # Increased timeout for slow loading
+    if seen_guids is not None:
+        # Also drops GUIDs repeated within this query (results can shift between pages)
+        new_jobs = []
+        for job in jobs:
+            job_guid = job_guid_from_url(job["Job URL"])
+            if job_guid not in seen_guids:
+                seen_guids.add(job_guid)
+                new_jobs.append(job)
+        jobs = new_jobs
+    
+    novelty = len(jobs) / stats["cards"] if stats["cards"] else 0.0
+    print(f"Query '{search_query}': {len(jobs)} new of {stats['cards']} cards (novelty {novelty:.0%})")
+    if query_stats is not None:
+        query_stats.update(query=search_query, cards=stats["cards"], new=len(jobs), novelty=novelty)
+    
+    included_jobs, excluded_jobs = filter_jobs(jobs, include_keywords, exclude_keywords, word_boundaries)
+    
+    print(f"Total jobs processed: {len(jobs)}")
+    print(f"Jobs included after filtering: {len(included_jobs)}")
+    print(f"Jobs excluded after filtering: {len(excluded_jobs)}")
+    
+    return included_jobs, excluded_jobs
+
+
+def format_query_novelty(query_stats):
+    """
+    Formats per-query novelty rates: the share of a query's cards not already
+    returned by an earlier query. A low rate marks a redundant query.
+
+    Parameters:
+        query_stats (list): Dicts filled in by fetch_jobs_with_requests
+
+    Returns:
+        list: One summary line per query
+    """
+    return [
+        f"{stats['query']}: {stats['new']} new of {stats['cards']} cards ({stats['novelty']:.0%} novel)"
+        for stats in query_stats
+    ]
+
+
+def _load_search_page(driver, url, max_retries=3):
+    """Load a search results page, retrying a few times before giving up."""
+    policy = get_timeout_policy()
+    for attempt in range(max_retries):
+        timeout = policy.timeout("page_load")
+        start = time.time()
+        try:
+            load_page(driver, url, "search")
+            WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            policy.record("page_load", time.time() - start)
+            return
+        except Exception as e:
+            if isinstance(e, TimeoutException):
+                policy.record("page_load", timeout, timed_out=True)
+            if attempt < max_retries - 1:
+                print(f"Error loading page. Retry {attempt+1}/{max_retries}...")
+            else:
+                print(f"Failed to load page after {max_retries} attempts.")
+                raise e
+
+
+def wait_for_elements(driver, selector, text_contains=None, target_count=None, quiet_ms=300, timeout=None,
+                      site=None):
+    """
+    Waits in the page until elements matching a selector have rendered.
+
+    A MutationObserver re-counts the matches on every DOM change and returns as
+    soon as target_count is reached or the count has been stable for quiet_ms,
+    so the wait tracks the real render time instead of a fixed sleep.
+
+    Parameters:
+        driver (WebDriver): Driver with the page loaded
+        selector (str): CSS selector of the elements
+        text_contains (str): Only count elements whose text contains this
+        target_count (int): Return as soon as this many elements exist
+        quiet_ms (int): Return once the (non-zero) count is unchanged for this long
+        timeout (float): Maximum seconds to wait (default: the site's learned timeout, or 20)
+        site (str): Timeout policy site that learns from this wait
+
+    Returns:
+        dict: {"count", "reason" ("target", "quiet" or "timeout"), "elapsedMs"}
+    """
+    policy = get_timeout_policy() if site else None
+    if timeout is None:
+        timeout = policy.timeout(site) if policy else 20
+    driver.set_script_timeout(timeout + 5)
+    ready = driver.execute_async_script(
+        WAIT_FOR_ELEMENTS_SCRIPT, selector, text_contains, quiet_ms, target_count, int(timeout * 1000)
+    )
+    if policy:
+        policy.record(site, ready["elapsedMs"] / 1000, timed_out=ready["reason"] == "timeout")
+    return ready
+
+
+def _read_total_pages(driver, search_query, timeout=None):
+    """
+    Reads the result count of the loaded search page.
+
+    Returns:
+        int: Number of result pages to process (at most 11)
+    """
+    try:
+        print("Looking for job count element...")
+        
+        # Wait for the job count element with flexibility in the class name
+        ready = wait_for_elements(driver, "p[class*='text-neutral-900']", text_contains="results",
+                                  target_count=1, timeout=timeout, site="result_count")
+        if not ready["count"]:
+            raise TimeoutError(f"no result count after {ready['elapsedMs'] / 1000:.0f}s")
+        job_count_element = driver.find_element(
+            By.XPATH, "//p[contains(@class, 'text-neutral-900') and contains(text(), 'results')]"
+        )
+        
+        total_jobs_text = job_count_element.text
+        print(f"Found job count text: '{total_jobs_text}'")
+        
+        total_jobs_match = re.search(r'(\d+)\s+results', total_jobs_text)
+        
+        if total_jobs_match:
+            total_jobs = int(total_jobs_match.group(1))
+            print(f"Total jobs for query '{search_query}': {total_jobs}")
+            
+            # 20 jobs per page
+            total_pages = pages_for_total(total_jobs)
+            print(f"Will process {total_pages} pages ({JOBS_PER_PAGE} jobs per page)")
+            return total_pages
+        
+        print(f"Could not extract job count from: {total_jobs_text}")
+    except Exception as e:
+        print(f"Could not find total job count, defaulting to 3 pages: {str(e)}")
+    return 3  # Default to 3 pages
+
+
+def job_entry_from_card(card, first_position=0):
+    """
+    Builds a job entry from the plain card object returned by the page scripts.
+
+    Parameters:
+        card (dict): Card fields (guid, title, company, location, employmentType, index)
+        first_position (int): Position of the page's first card in the query's results
+
+    Returns:
+        dict: Job entry
+    """
+    return {
+        "Job Title": card.get("title") or "Unknown",
+        "Job URL": f"https://www.dice.com/job-detail/{card['guid']}",
+        "Company": card.get("company") or "Unknown",
+        "Location": card.get("location") or "Unknown",
+        "Employment Type": card.get("employmentType") or "Contract",
+        # Posted date is always "Today" since we filter for last 24 hours
+        "Posted Date": "Today",
+        "Applied": False,
+        "Result Position": first_position + card.get("index", 0),
+    }
+
+
+def _extract_page_jobs(driver, page, timeout=None, seen_guids=None, stats=None):
+    """
+    Waits for the job cards of the loaded page and extracts them.
+    Cards whose GUID is in seen_guids are counted in stats["cards"] but not read.
+
+    Returns:
+        tuple: (job entries of the page, GUIDs of all cards on the page)
+    """
+    jobs = []
+    guids = []
+    try:
+        print("Waiting for job cards to load...")
+        
+        # Wait until a full page of cards is there or the card count stops changing
+        ready = wait_for_elements(driver, "div[data-id][data-job-guid]",
+                                  target_count=JOBS_PER_PAGE, timeout=timeout, site="result_cards")
+        print(f"Cards ready on page {page} after {ready['elapsedMs'] / 1000:.2f}s ({ready['reason']})")
+        
+        # Read every card in one round trip instead of several commands per card
+        result = driver.execute_script(EXTRACT_CARDS_SCRIPT, list(seen_guids or ())) or {}
+        cards = result.get("cards", [])
+        guids = result.get("guids", [])
+        if stats is not None:
+            stats["cards"] += result.get("total", 0)
+        
+        if not result.get("total"):
+            print(f"No job cards found on page {page}")
+            return jobs, guids
+            
+        print(f"Found {result['total']} jobs on page {page} ({len(cards)} not seen before)")
+        
+        for card_index, card in enumerate(cards):
+            if not card.get("guid"):
+                print(f"Missing job_guid on card {card_index}")
+                continue
+            jobs.append(job_entry_from_card(card, (page - 1) * JOBS_PER_PAGE))
+        
+    except Exception as e:
+        print(f"Error processing job cards on page {page}: {str(e)}")
+    return jobs, guids
+
+
+def fetch_jobs_with_browser(driver, search_query, seen_guids=None, stats=None, watermark=None):
+    """
+    Use the existing browser instance to fetch job listings, one page at a time.
+    Cards whose GUID is in seen_guids (or the watermark) are skipped.
+
+    Returns:
+        list: Unfiltered job entries
+    """
+    base_url = build_search_url(search_query)
+    jobs = []
+    skip_guids = set(seen_guids or ()) | (watermark.known if watermark is not None else set())
     
     try:
         # First load the initial page
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                print(f"Loading search results for query: '{search_query}'...")
-                driver.get(base_url)
-                short_wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                break
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    print(f"Error loading initial page. Retry {attempt+1}/{max_retries}...")
-                else:
-                    print(f"Failed to load initial page after {max_retries} attempts.")
-                    raise e
+        print(f"Loading search results for query: '{search_query}'...")
+        _load_search_page(driver, base_url)
         
         # Move mouse to prevent system sleeping
         pyautogui.moveRel(1, 1, duration=0.1)
         pyautogui.moveRel(-1, -1, duration=0.1)
         
         # Get total jobs count
-        total_pages = 1
-        try:
-            print("Looking for job count element...")
-            
-            # Wait for the job count element with flexibility in the class name
-            job_count_element = medium_wait.until(
-                EC.presence_of_element_located((By.XPATH, "//p[contains(@class, 'text-neutral-900') and contains(text(), 'results')]"))
-            )
-            
-            total_jobs_text = job_count_element.text
-            print(f"Found job count text: '{total_jobs_text}'")
-            
-            total_jobs_match = re.search(r'(\d+)\s+results', total_jobs_text)
-            
-            if total_jobs_match:
-                total_jobs = int(total_jobs_match.group(1))
-                print(f"Total jobs for query '{search_query}': {total_jobs}")
-                
-                # 20 jobs per page
-                jobs_per_page = 20
-                total_pages = min(11, (total_jobs + jobs_per_page - 1) // jobs_per_page)
-                print(f"Will process {total_pages} pages ({jobs_per_page} jobs per page)")
-            else:
-                print(f"Could not extract job count from: {total_jobs_text}")
-                total_pages = 3  # Default to 3 pages
-            
-        except Exception as e:
-            print(f"Could not find total job count, defaulting to 3 pages: {str(e)}")
-            total_pages = 3
+        total_pages = _read_total_pages(driver, search_query)
         
         # Process each page
         for page in range(1, total_pages + 1):
-            current_url = base_url if page == 1 else f"{base_url}&page={page}"
+            current_url = build_search_url(search_query, page)
             print(f"Processing page {page}/{total_pages}: {current_url}")
             
             if page > 1:  # Only need to navigate if not on first page
                 try:
-                    driver.get(current_url)
-                    short_wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                    _load_search_page(driver, current_url, max_retries=1)
                 except Exception as e:
                     print(f"Error loading page {page}: {e}")
                     continue
             
-            # Wait for job cards to appear with a more specific selector based on example
-            try:
-                print("Waiting for job cards to load...")
-                
-                # NEW APPROACH: Wait specifically for job cards using data attributes
-                medium_wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-id][data-job-guid]"))
-                )
-                
-                # Add a small delay to ensure dynamic content is fully rendered
-                time.sleep(2)
-                
-                # Get all job cards using the data-id and data-job-guid attributes
-                job_cards = driver.find_elements(By.CSS_SELECTOR, "div[data-id][data-job-guid]")
-                
-                if not job_cards:
-                    print(f"No job cards found on page {page}")
-                    continue
-                    
-                print(f"Found {len(job_cards)} jobs on page {page}")
-                
-                # Process each job card
-                for card_index, card in enumerate(job_cards):
-                    try:
-                        # Get job ID and URL from data attributes
-                        job_id = card.get_attribute('data-id')
-                        job_guid = card.get_attribute('data-job-guid') 
-                        if not job_guid:
-                            print(f"Missing job_guid on card {card_index}")
-                            continue
-                            
-                        job_url = f"https://www.dice.com/job-detail/{job_guid}"
-                        
-                        # Extract job title - using the exact classes from example
-                        job_title_element = card.find_element(
-                            By.CSS_SELECTOR, 
-                            "a[data-testid='job-search-job-detail-link']"
-                        )
-                        job_title = job_title_element.text.strip() if job_title_element else "Unknown"
-                        
-                        # Extract company name - using the exact structure from example
-                        company_element = card.find_element(
-                            By.CSS_SELECTOR, 
-                            "a[href*='company-profile'] p"
-                        )
-                        company_name = company_element.text.strip() if company_element else "Unknown"
-                        
-                        # Extract location - first text paragraph with the specified class
-                        location_elements = card.find_elements(
-                            By.CSS_SELECTOR, 
-                            "p.text-sm.font-normal.text-zinc-600"
-                        )
-                        job_location = location_elements[0].text.strip() if location_elements else "Unknown"
-                        
-                        # Extract employment type from the box with specific ID
-                        job_employment_type = "Contract"  # Default since we're filtering for contracts
-                        try:
-                            emp_type_element = card.find_element(
-                                By.CSS_SELECTOR, 
-                                "p#employmentType-label"
-                            )
-                            if emp_type_element:
-                                job_employment_type = emp_type_element.text.strip()
-                        except:
-                            # Fallback: look for any box containing "Contract"
-                            try:
-                                box_elements = card.find_elements(By.CSS_SELECTOR, "div.box p")
-                                for element in box_elements:
-                                    if "Contract" in element.text:
-                                        job_employment_type = element.text.strip()
-                                        break
-                            except:
-                                pass
-                        
-                        # Posted date is always "Today" since we filter for last 24 hours
-                        job_posted_date = "Today"
-                        
-                        # Create job entry
-                        job_entry = {
-                            "Job Title": job_title,
-                            "Job URL": job_url,
-                            "Company": company_name,
-                            "Location": job_location,
-                            "Employment Type": job_employment_type,
-                            "Posted Date": job_posted_date,
-                            "Applied": False
-                        }
-                        
-                        # Apply filtering
-                        include_job = True
-                        exclusion_reason = ""
-                        job_title_lower = job_title.lower()
-                        
-                        # Check exclude keywords
-                        if exclude_keywords and any(keyword.lower() in job_title_lower for keyword in exclude_keywords):
-                            matching_keywords = [kw for kw in exclude_keywords if kw.lower() in job_title_lower]
-                            exclusion_reason = f"Contains excluded keywords: {', '.join(matching_keywords)}"
-                            include_job = False
-                        
-                        # Check include keywords
-                        if include_keywords and not any(keyword.lower() in job_title_lower for keyword in include_keywords):
-                            exclusion_reason = f"Missing required keywords: {', '.join(include_keywords)}"
-                            include_job = False
-                        
-                        if include_job:
-                            included_jobs.append(job_entry)
-                        else:
-                            job_entry["Exclusion Reason"] = exclusion_reason
-                            excluded_jobs.append(job_entry)
-                    
-                    except Exception as e:
-                        print(f"Error processing job card {card_index} on page {page}: {str(e)}")
-                        continue
-                
-                total_jobs_found += len(job_cards)
-                
-            except Exception as e:
-                print(f"Error processing job cards on page {page}: {str(e)}")
+            page_jobs, guids = _extract_page_jobs(driver, page, seen_guids=skip_guids, stats=stats)
+            jobs.extend(page_jobs)
+            if watermark is not None:
+                watermark.check_page(guids)
                 
     except Exception as e:
         print(f"Error during job fetching: {str(e)}")
     
-    print(f"Total jobs processed: {total_jobs_found}")
-    print(f"Jobs included after filtering: {len(included_jobs)}")
-    print(f"Jobs excluded after filtering: {len(excluded_jobs)}")
-    
-    return included_jobs, excluded_jobs
+    return jobs
 
 
-            
-
-def save_to_excel(job_data, filename="job_application_report.xlsx"):
+def fetch_jobs_with_page_fetch(driver, search_query, script_timeout=None, seen_guids=None, stats=None,
+                               watermark=None):
     """
-    Saves job data to an Excel file.
+    Loads the first results page in the browser, then fetches all remaining pages
+    from inside the logged-in page with one execute_async_script call.
+
+    The pages are requested in parallel with fetch() and parsed with DOMParser in
+    the browser, so every card of pages 2..N comes back in a single round trip.
+
+    Parameters:
+        driver (WebDriver): Logged-in driver
+        search_query (str): Search query
+        script_timeout (float): Seconds the in-page fetch may take (default: learned "page_fetch" timeout)
+        seen_guids (set): GUIDs already processed in this run; those cards are skipped
+        stats (dict): Receives the number of cards on the pages read under "cards"
+        watermark (QueryWatermark): What earlier runs decided for this query; its jobs are
+            skipped like seen_guids
+
+    Returns:
+        list: Unfiltered job entries
     """
+    base_url = build_search_url(search_query)
+    jobs = []
+    skip_guids = list(set(seen_guids or ()) | (watermark.known if watermark is not None else set()))
+    policy = get_timeout_policy()
+    
     try:
-        df = pd.DataFrame(job_data["jobs"])
-        df.to_excel(filename, index=False)
-        print(f"Job application report saved to {filename}")
+        print(f"Loading search results for query: '{search_query}'...")
+        _load_search_page(driver, base_url)
+        
+        total_pages = _read_total_pages(driver, search_query)
+        page_jobs, guids = _extract_page_jobs(driver, 1, seen_guids=skip_guids, stats=stats)
+        jobs.extend(page_jobs)
+        if watermark is not None:
+            watermark.check_page(guids)
+        
+        urls = [build_search_url(search_query, page) for page in range(2, total_pages + 1)]
+        if urls:
+            timeout = policy.timeout("page_fetch") if script_timeout is None else script_timeout
+            driver.set_script_timeout(timeout)
+            fetch_start = time.time()
+            try:
+                results = driver.execute_async_script(FETCH_PAGES_SCRIPT, urls, skip_guids) or []
+            except TimeoutException:
+                policy.record("page_fetch", timeout, timed_out=True)
+                raise
+            policy.record("page_fetch", time.time() - fetch_start)
+            for page, result in enumerate(results, start=2):
+                if result.get("error"):
+                    print(f"Error fetching page {page}: {result['error']}")
+                    continue
+                cards = [card for card in result.get("cards", []) if card.get("guid")]
+                if stats is not None:
+                    stats["cards"] += result.get("total", 0)
+                print(f"Fetched {result.get('total', 0)} jobs on page {page} ({len(cards)} not seen before)")
+                jobs.extend(job_entry_from_card(card, (page - 1) * JOBS_PER_PAGE) for card in cards)
+                if watermark is not None:
+                    watermark.check_page(result.get("guids", []))
+    
     except Exception as e:
-        print(f"Error saving to Excel: {e}")
+        print(f"Error during job fetching: {str(e)}")
+    
+    return jobs
+
 
-def main():
+def main(resume=False):
+    """
+    Searches Dice and applies to the matching jobs.
+
+    Parameters:
+        resume (bool): Continue the last interrupted run from its journal: its unfinished
+            jobs are applied to first and only the queries it had not finished are searched
+    """
     # Record the start time of the entire script
     script_start_time = time.time()
     
@@ -711,32 +815,40 @@ def main():
     
     driver = get_web_driver()  # Use browser
     
-    # Define file names for fresh start
-    applied_jobs_file = "applied_jobs.xlsx"
-    not_applied_jobs_file = "not_applied_jobs.xlsx"
-    job_report_file = "job_application_report.xlsx"
-    excluded_jobs_file = "excluded_jobs.xlsx"
- 
-    # Delete existing files before login to start fresh (excluding applied_jobs.xlsx)
-    for file in [not_applied_jobs_file, job_report_file, excluded_jobs_file]:
+    # Queued jobs and their progress are journaled so a crashed run can be resumed
+    journal = RunJournal()
+    resume_state = journal.resume() if resume else None
+    if resume_state is not None:
+        print(f"Resuming the last run: {resume_state.summary()}")
+        search_queries = resume_state.remaining_queries()
+        resumed_jobs = resume_state.unfinished_jobs()
+    else:
+        if resume:
+            print("No unfinished run to resume; starting a new run")
+        journal.start(DICE_SEARCH_QUERIES)
+        search_queries = DICE_SEARCH_QUERIES
+        resumed_jobs = []
+    
+    # Delete stale Excel exports before login to start fresh
+    for file in ["job_application_report.xlsx", "excluded_jobs.xlsx"]:
         if os.path.exists(file):
             os.remove(file)
+
+    # Reports are streamed as records arrive; Excel files are exported on demand
+    # (python -m core.report_writer excluded|report). A resumed run adds to its reports.
+    resuming = resume_state is not None
+    excluded_writer = StreamingJobWriter("excluded_jobs.jsonl", EXCLUDED_COLUMNS, append=resuming)
+    report_writer = StreamingJobWriter("job_data.jsonl", append=resuming)
             
-    # Ensure applied_jobs.xlsx exists before writing
-    if not os.path.exists(applied_jobs_file):
-        df_empty = pd.DataFrame(columns=["Job Title", "Job URL", "Company", "Location", "Employment Type", "Posted Date", "Applied"])
-        df_empty.to_excel(applied_jobs_file, index=False)
-
-    job_data = {
-        "Total Jobs Posted Today": 0,
-        "jobs": []
-    }
+    # Applied / not applied outcomes live in the ledger (legacy xlsx files are imported once)
+    ledger = open_ledger()
 
     try:
         # Record login start time
         login_start_time = time.time()
         
-        if login_to_dice(driver):
+        # A saved session is reused when Dice still accepts it; otherwise this logs in
+        if ensure_logged_in(driver, remember=REMEMBER_SESSION):
             login_time = time.time() - login_start_time
             print(f"Login successful in {login_time:.2f} seconds. Starting job search...")
 
@@ -744,126 +856,105 @@ def main():
             pyautogui.moveRel(1, 1, duration=0.1)
             pyautogui.moveRel(-1, -1, duration=0.1)
 
-            # Use existing driver to fetch jobs
-            collected_jobs = {}  # Dictionary to hold unique jobs by URL
-            excluded_jobs = []   # List to hold excluded jobs
             fetch_start_time = time.time()
             
-            for query in DICE_SEARCH_QUERIES:
-                # Pass the existing driver to fetch_jobs_with_requests
-                included_jobs, query_excluded_jobs = fetch_jobs_with_requests(driver, query, INCLUDE_KEYWORDS, EXCLUDE_KEYWORDS)
-                
-                # Add each job to the collected jobs dictionary
-                for job in included_jobs:
-                    if job["Job URL"] not in collected_jobs:
-                        collected_jobs[job["Job URL"]] = job
-                
-                # Add to excluded jobs list
-                excluded_jobs.extend(query_excluded_jobs)
-                
+            # One pooled HTTP session (sharing the browser's cookies) serves every query
+            search_client = DiceSearchClient.from_driver(driver) if (SEARCH_MODE == "http" or PRESCREEN_JOBS) else None
+            
+            # GUIDs seen by earlier queries are skipped by later ones
+            seen_guids = {job_guid_from_url(job["Job URL"]) for job, _ in resumed_jobs}
+            query_stats = []
+            # Jobs crawled by earlier runs (in the last day) are not crawled again
+            watermarks = CrawlWatermarks()
+            
+            def fetch_query(query):
+                """Search one query with the existing driver (runs on the pipeline thread)"""
+                stats = {}
+                included_jobs, query_excluded_jobs = fetch_jobs_with_requests(
+                    driver, query, INCLUDE_KEYWORDS, EXCLUDE_KEYWORDS,
+                    mode=SEARCH_MODE, search_client=search_client, word_boundaries=KEYWORD_WORD_BOUNDARIES,
+                    seen_guids=seen_guids, query_stats=stats, watermark=watermarks.for_query(query)
+                )
+                query_stats.append(stats)
                 print(f"Query '{query}' returned {len(included_jobs)} jobs")
                 
                 # Mouse movement between queries to prevent sleep
                 pyautogui.moveRel(1, 1, duration=0.1)
                 pyautogui.moveRel(-1, -1, duration=0.1)
-                
-            fetch_time = time.time() - fetch_start_time
-            print(f"Finished fetching jobs in {fetch_time:.2f} seconds")
-
-            # Save excluded jobs to Excel
-            if excluded_jobs:
-                df_excluded = pd.DataFrame(excluded_jobs)
-                df_excluded.to_excel(excluded_jobs_file, index=False)
-                print(f"Saved {len(excluded_jobs)} excluded jobs to {excluded_jobs_file}")
-
-            # Merge all job details into job_data
-            job_data["jobs"] = list(collected_jobs.values())
-            print(f"==========> Total unique jobs collected from all queries: {len(job_data['jobs'])}")
+                return included_jobs, query_excluded_jobs
             
-            # Rest of your code stays the same...
-            # Check for already applied jobs
-            if not os.path.exists(not_applied_jobs_file):
-                df_empty = pd.DataFrame(columns=["Job Title", "Job URL", "Company", "Location", "Employment Type", "Posted Date", "Applied"])
-                df_empty.to_excel(not_applied_jobs_file, index=False)
-                
-            existing_applied_jobs = set()
-            existing_not_applied_jobs = set()
-
-            if os.path.exists(applied_jobs_file):
-                try:
-                    df_applied = pd.read_excel(applied_jobs_file)
-                    existing_applied_jobs = set(df_applied["Job URL"].dropna())
-                except Exception as e:
-                    print(f"Error loading existing applied jobs: {e}")
-
-            if os.path.exists(not_applied_jobs_file):
-                try:
-                    df_not_applied = pd.read_excel(not_applied_jobs_file)
-                    existing_not_applied_jobs = set(df_not_applied["Job URL"].dropna())
-                except Exception as e:
-                    print(f"Error loading not applied jobs: {e}")
-
-            # Count already applied jobs
-            already_applied_count = sum(1 for job in job_data["jobs"] if job["Job URL"] in existing_applied_jobs)
-            print(f"==========> Skipping jobs that were already applied: {already_applied_count}")
-
-            # Filter jobs before applying
-            pending_jobs = [job for job in job_data["jobs"] if job["Job URL"] not in existing_applied_jobs]
-            print(f"==========> Total jobs to apply for: {len(pending_jobs)}")
-            
-            # Calculate and display the estimated time
-            print(f"==========> Estimated time to apply all {len(pending_jobs)} jobs: {len(pending_jobs)//8//60} hours {len(pending_jobs)//8%60} minutes")
+            # Search results stream through dedup, the ledger check and the pre-screen into a
+            # bounded queue; the apply workers start on the first eligible job and take the
+            # best-scoring queued job first
+            job_queue = PriorityJobQueue(
+                APPLY_QUEUE_SIZE,
+                scorer=build_job_scorer(ledger, INCLUDE_KEYWORDS, KEYWORD_WORD_BOUNDARIES),
+                time_budget=TIME_BUDGET_MINUTES * 60,
+            )
+            pipeline = JobPipeline(
+                fetch_query, job_queue, ledger,
+                excluded_writer=excluded_writer,
+                report_writer=report_writer,
+                search_client=search_client,
+                prescreen=PRESCREEN_JOBS,
+                journal=journal,
+            )
             
             # Record application start time
             apply_start_time = time.time()
-            successful_applications = 0
-            failed_applications = 0
             
-            # Process only pending jobs
-            for job_index, job in enumerate(pending_jobs):
-                # Move mouse every 3 jobs to prevent system sleeping
-                if job_index % 3 == 0:
-                    pyautogui.moveRel(1, 1, duration=0.1)
-                    pyautogui.moveRel(-1, -1, duration=0.1)
-                
-                job_start_time = time.time()
-                
-                if not job["Applied"] and job["Job URL"] != "Unknown":
-                    applied = apply_to_job_url(driver, job["Job URL"])
-                    job["Applied"] = applied
-                    
-                    job_time = time.time() - job_start_time
-                    
-                    if applied:
-                        successful_applications += 1
-                        try:
-                            df_existing = pd.read_excel(applied_jobs_file)
-                        except Exception:
-                            df_existing = pd.DataFrame(columns=["Job Title", "Job URL", "Company", "Location", "Employment Type", "Posted Date", "Applied"])
-                        df_new = pd.DataFrame([job])
-                        df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-                        df_combined.to_excel(applied_jobs_file, index=False)
-                    else:
-                        failed_applications += 1
-                        try:
-                            df_existing = pd.read_excel(not_applied_jobs_file)
-                        except Exception:
-                            df_existing = pd.DataFrame(columns=["Job Title", "Job URL", "Company", "Location", "Employment Type", "Posted Date", "Applied"])
-                        df_new = pd.DataFrame([job])
-                        df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-                        df_combined.to_excel(not_applied_jobs_file, index=False)
-                    
-                    # Print progress every 5 jobs
-                    if (job_index + 1) % 5 == 0 or job_index == len(pending_jobs) - 1:
-                        elapsed = time.time() - apply_start_time
-                        progress = (job_index + 1) / len(pending_jobs) * 100
-                        estimated_total = elapsed / (job_index + 1) * len(pending_jobs)
-                        remaining = estimated_total - elapsed
-                        
-                        print(f"Progress: {job_index+1}/{len(pending_jobs)} jobs ({progress:.1f}%) | "
-                              f"Last job: {job_time:.1f}s | "
-                              f"Success rate: {successful_applications}/{job_index+1} | "
-                              f"Est. remaining: {remaining/60:.1f} mins")
+            def report_progress(job, applied, job_time):
+                """Print progress every 5 jobs (called by the apply workers)"""
+                done = pool.processed
+                if done % 5 == 0:
+                    elapsed = time.time() - apply_start_time
+                    print(f"Progress: {done}/{pipeline.counts['queued']} queued jobs | "
+                          f"Last job: {job_time:.1f}s | "
+                          f"Success rate: {pool.applied}/{done} | "
+                          f"Elapsed: {elapsed/60:.1f} mins")
+            
+            # Apply with N browsers sharing this driver's login session; this driver keeps searching
+            try:
+                from dice_auto_apply.core.apply_pool import ApplyWorkerPool
+            except ImportError:
+                try:
+                    from ..core.apply_pool import ApplyWorkerPool
+                except ImportError:
+                    from core.apply_pool import ApplyWorkerPool
+            pool = ApplyWorkerPool(
+                APPLY_WORKERS,
+                export_session_cookies(driver),
+                ledger=ledger,
+                report_writer=report_writer,
+                on_result=report_progress,
+                park_between_jobs=PARK_BETWEEN_JOBS,
+                job_queue=job_queue,
+                journal=journal,
+            )
+            pipeline.start(search_queries, resumed_jobs)
+            results = pool.run()
+            pipeline.finish()
+            journal.finish()
+            if search_client is not None:
+                search_client.close()
+            
+            fetch_time = time.time() - fetch_start_time
+            print(f"Search and apply pipeline finished in {fetch_time:.2f} seconds")
+            print(f"==========> Pipeline: {format_pipeline_counts(pipeline.counts)}")
+            print("Query novelty:")
+            for line in format_query_novelty(query_stats):
+                print(f"  {line}")
+            print(f"Saved {excluded_writer.written} excluded jobs to {excluded_writer.path}")
+            successful_applications = results["applied"]
+            failed_applications = results["failed"]
+            
+            # Later runs skip the jobs applied to or skipped for good; failed and deferred ones come back
+            watermarks.save(lambda guid: guid in pipeline.decided_guids or ledger.has_applied(guid))
+            # Keep what this run learned about Dice's response times for the next one
+            timeout_policy = get_timeout_policy()
+            timeout_policy.save()
+            print(timeout_policy.summary())
+            print(get_rate_controller().summary())
 
             apply_time = time.time() - apply_start_time
             applications_per_minute = (successful_applications + failed_applications) / (apply_time / 60) if apply_time > 0 else 0
@@ -872,13 +963,7 @@ def main():
             print(f"==========> Failed applications: {failed_applications} jobs")
             print(f"==========> Average application rate: {applications_per_minute:.2f} jobs per minute")
 
-            # Save final data to JSON
-            with open("job_data.json", "w") as json_file:
-                json.dump(job_data, json_file, indent=4)
-            print("Job data saved to job_data.json")
-
-            # Final save to Excel
-            save_to_excel(job_data)
+            print(f"Job data streamed to {report_writer.path} ({report_writer.written} jobs)")
 
         else:
             print("Login failed. Exiting...")
@@ -886,7 +971,10 @@ def main():
     except Exception as e:
         print(f"An error occurred: {e}")
     finally:
-        pass
+        ledger.close()
+        excluded_writer.close()
+        report_writer.close()
+        journal.close()
         # Don't close the browser immediately for debugging
         # driver.quit()
         
@@ -897,8 +985,8 @@ def main():
     
     print("\n===== EXECUTION TIME SUMMARY =====")
     print(f"Total script execution time: {int(hours)}h {int(minutes)}m {seconds:.2f}s")
-    if 'pending_jobs' in locals() and pending_jobs:
-        print(f"Average time per job processed: {total_time/len(pending_jobs):.2f} seconds")
+    if 'results' in locals() and results["processed"]:
+        print(f"Average time per job processed: {total_time/results['processed']:.2f} seconds")
     print("==================================")
 
 
@@ -914,7 +1002,37 @@ if __name__ == "__main__":
         "Natural Language Processing","analyst","scientist","senior","cloud", 
         "aws","gcp","Azure","agentic","python","rag","llm"]  # Add more if needed
 
+    # Number of browsers applying in parallel (each gets its own debugging port)
+    APPLY_WORKERS = 1
+
+    # "http" reads search results with a pooled requests session, "page_fetch" loads page 1 and fetches
+    # the rest from inside the page, "browser" pages through them in the driver
+    SEARCH_MODE = "http"
+
+    # Match include/exclude keywords as whole words ("AI" won't match "maintain");
+    # off by default, keywords match anywhere in the title
+    KEYWORD_WORD_BOUNDARIES = False
+
+    # Fetch job detail pages over HTTP first and skip external / already applied jobs
+    PRESCREEN_JOBS = True
+
+    # Load about:blank between jobs (the next job URL is otherwise loaded directly)
+    PARK_BETWEEN_JOBS = False
+    # Reuse the encrypted Dice session saved by the previous run instead of logging in
+    REMEMBER_SESSION = True
+
+    # Jobs waiting for an apply worker; searching pauses while this many are queued
+    APPLY_QUEUE_SIZE = 50
+    # Stop taking new jobs after this many minutes of applying (0: no limit)
+    TIME_BUDGET_MINUTES = 0
+
+    parser = argparse.ArgumentParser(description="Search Dice and apply to the matching jobs")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue the last interrupted run from its first unfinished job "
+                             "instead of searching again")
+    args = parser.parse_args()
+
     start_time = datetime.datetime.now()
-    main()
+    main(resume=args.resume)
     end_time = datetime.datetime.now()
     print(f"Exact Execution time: {end_time - start_time}")
\ No newline at end of file
@@ -0,0 +1,320 @@
+"""
+JavaScript run inside Dice pages through execute_script / execute_async_script.
+
+Keeping the scripts here lets the search code do its work in one WebDriver
+round trip instead of one command per element.
+"""
+
+# Defines extractCards(root, seen): returns {total, guids, cards} with the GUIDs of
+# all cards in page order and a plain object per job card under root (a document
+# or element), including the employment-type fallback and the card's index on the
+# page. Cards whose GUID is in seen are counted but not read.
+CARD_EXTRACTOR_JS = """
+function extractCards(root, seen) {
+    var text = function (el) { return el ? (el.textContent || '').trim() : null; };
+    var skip = {};
+    (seen || []).forEach(function (guid) { skip[guid] = true; });
+    var cards = root.querySelectorAll('div[data-id][data-job-guid]');
+    var out = [], guids = [];
+    for (var i = 0; i < cards.length; i++) {
+        var card = cards[i];
+        var guid = card.getAttribute('data-job-guid');
+        guids.push(guid);
+        if (skip[guid]) { continue; }
+        var employmentType = text(card.querySelector('p#employmentType-label'));
+        if (!employmentType) {
+            var boxes = card.querySelectorAll('div.box p');
+            for (var j = 0; j < boxes.length; j++) {
+                if ((boxes[j].textContent || '').indexOf('Contract') !== -1) {
+                    employmentType = text(boxes[j]);
+                    break;
+                }
+            }
+        }
+        out.push({
+            id: card.getAttribute('data-id'),
+            guid: guid,
+            index: i,
+            title: text(card.querySelector("a[data-testid='job-search-job-detail-link']")),
+            company: text(card.querySelector("a[href*='company-profile'] p")),
+            location: text(card.querySelector('p.text-sm.font-normal.text-zinc-600')),
+            employmentType: employmentType
+        });
+    }
+    return {total: cards.length, guids: guids, cards: out};
+}
+"""
+
+# execute_script(EXTRACT_CARDS_SCRIPT, seen_guids)
+# Returns {total, guids, cards} for the current page in one call.
+EXTRACT_CARDS_SCRIPT = CARD_EXTRACTOR_JS + """
+return extractCards(document, arguments[0]);
+"""
+
+# execute_async_script(FETCH_PAGES_SCRIPT, urls, seen_guids)
+# Fetches every URL in parallel with the page's cookies, parses each response
+# with DOMParser and returns [{url, total, guids, cards, error}] in the order of urls.
+FETCH_PAGES_SCRIPT = CARD_EXTRACTOR_JS + """
+var urls = arguments[0], seen = arguments[1];
+var done = arguments[arguments.length - 1];
+var parser = new DOMParser();
+Promise.all(urls.map(function (url) {
+    return fetch(url, {credentials: 'include'})
+        .then(function (response) {
+            if (!response.ok) { throw new Error('HTTP ' + response.status); }
+            return response.text();
+        })
+        .then(function (html) {
+            var result = extractCards(parser.parseFromString(html, 'text/html'), seen);
+            return {url: url, total: result.total, guids: result.guids, cards: result.cards, error: null};
+        })
+        .catch(function (error) {
+            return {url: url, total: 0, guids: [], cards: [], error: String(error)};
+        });
+})).then(done);
+"""
+
+# execute_async_script(WAIT_FOR_ELEMENTS_SCRIPT, selector, text_contains, quiet_ms, target_count, timeout_ms)
+# Resolves once the number of elements matching selector (and containing
+# text_contains, if given) reaches target_count, or has been non-zero and
+# unchanged for quiet_ms. A MutationObserver re-counts on every DOM change.
+# Returns {count, reason: "target" | "quiet" | "timeout", elapsedMs}.
+WAIT_FOR_ELEMENTS_SCRIPT = """
+var selector = arguments[0], textContains = arguments[1], quietMs = arguments[2],
+    targetCount = arguments[3], timeoutMs = arguments[4];
+var done = arguments[arguments.length - 1];
+var start = performance.now();
+var finished = false, quietTimer = null, deadline = null, observer = null;
+var lastCount = -1;
+
+function countElements() {
+    var nodes = document.querySelectorAll(selector);
+    if (!textContains) { return nodes.length; }
+    var matching = 0;
+    for (var i = 0; i < nodes.length; i++) {
+        if ((nodes[i].textContent || '').indexOf(textContains) !== -1) { matching++; }
+    }
+    return matching;
+}
+
+function finish(reason) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearTimeout(quietTimer);
+    clearTimeout(deadline);
+    done({count: countElements(), reason: reason, elapsedMs: performance.now() - start});
+}
+
+function check() {
+    var count = countElements();
+    if (targetCount && count >= targetCount) { finish('target'); return; }
+    if (count !== lastCount) {
+        lastCount = count;
+        clearTimeout(quietTimer);
+        if (count > 0) { quietTimer = setTimeout(function () { finish('quiet'); }, quietMs); }
+    }
+}
+
+observer = new MutationObserver(check);
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+deadline = setTimeout(function () { finish('timeout'); }, timeoutMs);
+check();
+"""
+
+# execute_async_script(APPLY_FLOW_SCRIPT, phase, timeout_ms, confirm_timeout_ms, max_steps)
+# Runs the Easy Apply flow of the current document as a state machine driven by
+# a MutationObserver, re-evaluated on every DOM change (and on a short interval
+# for style-only changes):
+#   "detail": wait for an actionable apply control (button, anchor or the legacy
+#             shadow-DOM component), then click it and continue in "wizard";
+#             an anchor with an href is handed back for Python to navigate to
+#   "wizard": click Next until Submit is available, click Submit, then wait for
+#             the success card (or the older post-apply banner)
+# A navigation ends the script; Python then starts it again in "wizard".
+# Returns {status, phase, kind, href, steps: [{step, ms}], elapsedMs} where status
+# is "submitted", "submitted_unconfirmed", "already_applied", "navigate",
+# "no_apply_control", "click_failed", "too_many_steps" or "timeout".
+APPLY_FLOW_SCRIPT = """
+var phase = arguments[0], timeoutMs = arguments[1], confirmTimeoutMs = arguments[2],
+    maxSteps = arguments[3];
+var done = arguments[arguments.length - 1];
+var start = performance.now(), lastMark = start;
+var steps = [], nextClicks = 0, submitted = false, kind = null;
+var finished = false, scheduled = false, awaitingChange = false, clickedAt = 0;
+var observer = null, interval = null, deadline = null;
+// Set when Submit is clicked; sessionStorage survives a full page load, so the
+// flow rerun on the next document knows the application was already sent
+var SUBMITTED_KEY = 'diceAutoApplySubmitted';
+
+function remember(value) {
+    try {
+        if (value) { sessionStorage.setItem(SUBMITTED_KEY, '1'); } else { sessionStorage.removeItem(SUBMITTED_KEY); }
+    } catch (e) {}
+}
+
+function remembered() {
+    try { return sessionStorage.getItem(SUBMITTED_KEY) === '1'; } catch (e) { return false; }
+}
+
+function mark(step) {
+    var now = performance.now();
+    steps.push({step: step, ms: Math.round(now - lastMark)});
+    lastMark = now;
+}
+
+function label(el) { return (el.textContent || '').replace(/\\s+/g, ' ').trim(); }
+function visible(el) { return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length); }
+function enabled(el) { return !el.disabled && el.getAttribute('aria-disabled') !== 'true'; }
+
+function click(el) {
+    el.scrollIntoView({block: 'center', inline: 'nearest'});
+    el.click();
+}
+
+function findWizardButton(name) {
+    var buttons = document.querySelectorAll('button[type="submit"], button[type="button"]');
+    for (var i = 0; i < buttons.length; i++) {
+        var button = buttons[i];
+        if (!enabled(button) || !visible(button)) { continue; }
+        if (label(button) === name) { return button; }
+        var spans = button.querySelectorAll('span');
+        for (var j = 0; j < spans.length; j++) {
+            if (label(spans[j]) === name) { return button; }
+        }
+    }
+    return null;
+}
+
+function successShown() {
+    if (document.querySelector('[data-testid="job-application-success-card"]')) { return true; }
+    return !!document.evaluate(
+        "//header[contains(@class, 'post-apply-banner')]//h1[contains(text(), 'Application submitted')]",
+        document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+}
+
+function isApplied(text) { return text.indexOf('applied') !== -1 || text.indexOf('application submitted') !== -1; }
+
+// {kind, el, href, applied} once the apply control is actionable, otherwise null
+function applyControl() {
+    var button = document.querySelector('button[data-testid="apply-button"]');
+    if (button) {
+        var text = label(button).toLowerCase();
+        if (isApplied(text)) { return {kind: 'button', applied: true}; }
+        return text.indexOf('apply') !== -1 && enabled(button) ? {kind: 'button', el: button} : null;
+    }
+    var anchor = document.querySelector('a[data-testid="apply-button"]');
+    if (anchor) {
+        var anchorText = label(anchor).toLowerCase();
+        var href = anchor.getAttribute('href') || '';
+        if (isApplied(anchorText)) { return {kind: 'anchor', applied: true}; }
+        var toWizard = href.indexOf('/job-applications/') !== -1 && href.indexOf('/wizard') !== -1;
+        return anchorText.indexOf('apply') !== -1 || toWizard ? {kind: 'anchor', el: anchor, href: anchor.href} : null;
+    }
+    var component = document.querySelector('apply-button-wc');
+    if (component && component.shadowRoot) {
+        var root = component.shadowRoot;
+        var shadowText = root.textContent || '';
+        if (shadowText.indexOf('Application Submitted') !== -1) { return {kind: 'shadow', applied: true}; }
+        if (shadowText.toLowerCase().indexOf('apply') === -1) { return null; }
+        var nested = root.querySelector('apply-button');
+        var shadowButton = root.querySelector('button.btn.btn-primary') ||
+            (nested && nested.shadowRoot && nested.shadowRoot.querySelector('button.btn.btn-primary')) ||
+            Array.prototype.find.call(root.querySelectorAll('button'), function (b) {
+                var t = (b.textContent || '').toLowerCase();
+                return t.indexOf('easy apply') !== -1 || t.indexOf('apply now') !== -1;
+            });
+        return {kind: 'shadow', el: shadowButton || null};
+    }
+    return null;
+}
+
+function finish(status, extra) {
+    if (finished) { return; }
+    finished = true;
+    remember(false);
+    if (observer) { observer.disconnect(); }
+    clearInterval(interval);
+    clearTimeout(deadline);
+    var result = {status: status, phase: phase, kind: kind, href: null, steps: steps,
+                  nextClicks: nextClicks, elapsedMs: Math.round(performance.now() - start)};
+    for (var key in (extra || {})) { result[key] = extra[key]; }
+    done(result);
+}
+
+function detailStep() {
+    var control = applyControl();
+    if (!control) { return; }
+    kind = control.kind;
+    mark('apply_control');
+    if (control.applied) { finish('already_applied'); return; }
+    if (control.kind === 'anchor' && control.href) { finish('navigate', {href: control.href}); return; }
+    if (!control.el) { finish('click_failed'); return; }
+    try { click(control.el); } catch (e) { finish('click_failed', {error: String(e)}); return; }
+    mark('apply_click');
+    phase = 'wizard';
+    awaitingChange = true;
+    clickedAt = performance.now();
+}
+
+function wizardStep() {
+    if (successShown()) { mark('confirmation'); finish('submitted'); return; }
+    if (submitted) {
+        // Submitting may land back on the job page, now showing the job as applied
+        var control = applyControl();
+        if (control && control.applied) { mark('confirmation'); finish('submitted'); }
+        return;
+    }
+    // After a click, wait for the DOM to react before clicking again (a click that
+    // changed nothing is retried after a second)
+    if (awaitingChange && performance.now() - clickedAt < 1000) { return; }
+    var submit = findWizardButton('Submit');
+    if (submit) {
+        remember(true);
+        click(submit);
+        mark('submit');
+        submitted = true;
+        clearTimeout(deadline);
+        deadline = setTimeout(function () { finish('submitted_unconfirmed'); }, confirmTimeoutMs);
+        return;
+    }
+    var next = findWizardButton('Next');
+    if (next) {
+        if (nextClicks >= maxSteps) { finish('too_many_steps'); return; }
+        click(next);
+        nextClicks++;
+        mark('next');
+        awaitingChange = true;
+        clickedAt = performance.now();
+    }
+}
+
+function tick() {
+    scheduled = false;
+    if (finished) { return; }
+    try {
+        if (phase === 'detail') { detailStep(); } else { wizardStep(); }
+    } catch (e) {
+        finish('click_failed', {error: String(e)});
+    }
+}
+
+function schedule() {
+    if (!scheduled) { scheduled = true; setTimeout(tick, 0); }
+}
+
+observer = new MutationObserver(function () { awaitingChange = false; schedule(); });
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+interval = setInterval(schedule, 250);
+if (phase === 'detail') {
+    remember(false);
+} else if (remembered()) {
+    // Submit was clicked on the previous document; only the confirmation is left
+    submitted = true;
+}
+deadline = submitted
+    ? setTimeout(function () { finish('submitted_unconfirmed'); }, confirmTimeoutMs)
+    : setTimeout(function () { finish(phase === 'detail' ? 'no_apply_control' : 'timeout'); }, timeoutMs);
+tick();
+"""
@@ -0,0 +1,252 @@
+import queue
+import threading
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.prescreen import prescreen_jobs
+    from dice_auto_apply.core.ledger import job_guid_from_url
+except ImportError:
+    try:
+        from ..core.prescreen import prescreen_jobs
+        from ..core.ledger import job_guid_from_url
+    except ImportError:
+        from core.prescreen import prescreen_jobs
+        from core.ledger import job_guid_from_url
+
+# Jobs waiting for an apply worker; the crawl pauses when this many are queued
+DEFAULT_QUEUE_SIZE = 50
+
+# Pipeline stages counted in JobPipeline.counts, in flow order
+STAGES = ("crawled", "excluded", "duplicate", "already_applied", "prescreen_skipped", "queued", "deferred")
+
+
+class JobQueue(queue.Queue):
+    """
+    Bounded queue between the search pipeline and the apply workers.
+
+    The producer closes it when no more jobs will come; consumers then drain
+    what is left and stop.
+    """
+
+    def __init__(self, maxsize=DEFAULT_QUEUE_SIZE):
+        super().__init__(maxsize)
+        self.closed = threading.Event()
+
+    def close(self):
+        """Mark the end of the stream."""
+        self.closed.set()
+
+    def put_job(self, job, should_stop=None, rank=None):
+        """
+        Adds a job, blocking while the queue is full (backpressure on the producer).
+
+        Parameters:
+            job (dict): Job entry
+            should_stop (callable): Returns True to give up waiting
+            rank (int): Position of the job in its query's results (used by PriorityJobQueue)
+
+        Returns:
+            bool: True if the job was queued, False if the run was stopped first
+        """
+        while True:
+            try:
+                self.put(job, timeout=0.5)
+                return True
+            except queue.Full:
+                if should_stop is not None and should_stop():
+                    return False
+
+    def get_job(self, should_stop=None):
+        """
+        Takes the next job, waiting while the producer is still running.
+
+        Parameters:
+            should_stop (callable): Returns True to give up waiting
+
+        Returns:
+            dict: Job entry, or None once the queue is closed and empty (or the run stopped)
+        """
+        while should_stop is None or not should_stop():
+            try:
+                return self.get(timeout=0.2)
+            except queue.Empty:
+                if self.closed.is_set() and self.empty():
+                    return None
+        return None
+
+
+class JobPipeline:
+    """
+    Streams search results into the apply queue while the crawl is still running.
+
+    Each query's results go through deduplication, the ledger check and the
+    optional HTTP pre-screen, and the remaining jobs are put on a bounded
+    JobQueue. Apply workers consume the queue at the same time, so the first
+    application starts after the first query instead of after the whole crawl,
+    and a full queue pauses the crawl.
+    """
+
+    def __init__(self, fetch_query, job_queue, ledger, excluded_writer=None, report_writer=None,
+                 search_client=None, prescreen=False, job_limit=0, should_stop=None, on_progress=None,
+                 journal=None):
+        """
+        Parameters:
+            fetch_query (callable): fetch_query(query) returns (included_jobs, excluded_jobs)
+            job_queue (JobQueue): Queue consumed by the apply workers
+            ledger (ApplicationLedger): Used to skip jobs applied to in earlier runs
+            excluded_writer (StreamingJobWriter): Receives the jobs excluded by the keyword filter
+            report_writer (StreamingJobWriter): Receives the jobs skipped as already applied or pre-screened
+            search_client (DiceSearchClient): HTTP session for the pre-screen
+            prescreen (bool): Pre-screen job detail pages over HTTP before queueing
+            job_limit (int): Maximum number of jobs to queue (0: no limit); the rest are deferred
+            should_stop (callable): Returns True when the run should stop early (the
+                jobs not applied to are deferred)
+            on_progress (callable): Called with a copy of the stage counts after every change
+            journal (RunJournal): Records the queued jobs and searched queries so the run can be resumed
+        """
+        self.fetch_query = fetch_query
+        self.job_queue = job_queue
+        self.ledger = ledger
+        self.excluded_writer = excluded_writer
+        self.report_writer = report_writer
+        self.search_client = search_client
+        self.prescreen = prescreen and search_client is not None
+        self.job_limit = job_limit
+        self._stopped = threading.Event()
+        run_should_stop = should_stop or (lambda: False)
+        self.should_stop = lambda: self._stopped.is_set() or run_should_stop()
+        self.on_progress = on_progress
+        self.journal = journal
+
+        self.counts = dict.fromkeys(STAGES, 0)
+        self.deferred_jobs = []
+        # GUIDs that need no further look in later runs: already applied or skipped by the pre-screen
+        self.decided_guids = set()
+        self._seen_urls = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _count(self, **increments):
+        with self._lock:
+            for stage, amount in increments.items():
+                self.counts[stage] += amount
+            snapshot = dict(self.counts)
+        if self.on_progress:
+            self.on_progress(snapshot)
+
+    def _limit_reached(self):
+        return self.job_limit > 0 and self.counts["queued"] >= self.job_limit
+
+    def start(self, queries, resumed_jobs=()):
+        """
+        Starts crawling the queries on a background thread.
+
+        Parameters:
+            queries (list): Search queries, crawled in order
+            resumed_jobs (list): (job, rank) tuples left unfinished by an interrupted run
+                (see RunState.unfinished_jobs); they are queued before any query is searched
+        """
+        self._thread = threading.Thread(
+            target=self._produce, args=(list(queries), list(resumed_jobs)), daemon=True
+        )
+        self._thread.start()
+
+    def finish(self):
+        """
+        Ends the pipeline once the apply workers are done: stops the crawl if it is
+        still running (e.g. every worker failed) and defers the jobs left in the queue.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        while True:
+            try:
+                self.deferred_jobs.append(self.job_queue.get_nowait())
+            except queue.Empty:
+                break
+
+    def _produce(self, queries, resumed_jobs):
+        try:
+            if resumed_jobs:
+                self._queue_resumed(resumed_jobs)
+            for query in queries:
+                if self.should_stop():
+                    break
+                self._process_query(query)
+                if self._limit_reached():
+                    print("Job limit reached; the remaining queries are not searched")
+                    break
+        except Exception as e:
+            print(f"Search pipeline error: {e}")
+        finally:
+            self.job_queue.close()
+
+    def _queue_resumed(self, resumed_jobs):
+        """Queues the unfinished jobs of an interrupted run; they are already journaled."""
+        print(f"Resuming {len(resumed_jobs)} unfinished jobs from the last run")
+        already_applied = 0
+        for job, rank in resumed_jobs:
+            self._seen_urls.add(job["Job URL"])
+            # A worker may have applied just before the interruption
+            if self.ledger.has_applied(job["Job URL"]):
+                already_applied += 1
+                continue
+            if not self.job_queue.put_job(job, self.should_stop, rank=rank):
+                return
+            self._count(queued=1)
+        self._count(already_applied=already_applied)
+
+    def _process_query(self, query):
+        """Runs one query's results through the stages and queues the eligible jobs."""
+        included, excluded = self.fetch_query(query)
+        if self.excluded_writer is not None:
+            self.excluded_writer.write_many(excluded)
+        self._count(crawled=len(included) + len(excluded), excluded=len(excluded))
+
+        pending = []
+        duplicates = already_applied = 0
+        for job in included:
+            job_url = job["Job URL"]
+            if job_url in self._seen_urls:
+                duplicates += 1
+                continue
+            self._seen_urls.add(job_url)
+            if self.ledger.has_applied(job_url):
+                already_applied += 1
+                self.decided_guids.add(job_guid_from_url(job_url))
+                if self.report_writer is not None:
+                    self.report_writer.write(job)
+                continue
+            pending.append(job)
+        self._count(duplicate=duplicates, already_applied=already_applied)
+
+        if self.prescreen and pending:
+            actionable, _ = prescreen_jobs(pending, self.search_client, self.ledger, self.report_writer)
+            self._count(prescreen_skipped=len(pending) - len(actionable))
+            actionable_urls = {job["Job URL"] for job in actionable}
+            self.decided_guids.update(
+                job_guid_from_url(job["Job URL"]) for job in pending if job["Job URL"] not in actionable_urls
+            )
+            pending = actionable
+
+        print(f"Query '{query}': {len(pending)} jobs ready to apply")
+        for index, job in enumerate(pending):
+            if self._limit_reached():
+                self.deferred_jobs.append(job)
+                self._count(deferred=1)
+                continue
+            # Rank by the job's place in the search results, not among the jobs left after filtering
+            rank = job.get("Result Position", index)
+            # Journaled first: a worker may take the job as soon as it is on the queue
+            if self.journal is not None:
+                self.journal.queued(job, rank)
+            if not self.job_queue.put_job(job, self.should_stop, rank=rank):
+                self.deferred_jobs.extend(pending[index:])
+                return
+            self._count(queued=1)
+        if self.journal is not None:
+            self.journal.query_done(query)
+
+
+def format_pipeline_counts(counts):
+    """One-line summary of the pipeline stage counts."""
+    return ", ".join(f"{stage.replace('_', ' ')}: {counts[stage]}" for stage in STAGES)
@@ -0,0 +1,116 @@
+import re
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.search_client import HTML_PARSER
+except ImportError:
+    try:
+        from ..core.search_client import HTML_PARSER
+    except ImportError:
+        from core.search_client import HTML_PARSER
+
+EASY_APPLY = "easy_apply"
+EXTERNAL = "external"
+ALREADY_APPLIED = "already_applied"
+UNAVAILABLE = "unavailable"
+UNKNOWN = "unknown"
+
+# Classifications that still need the browser; unknown pages (e.g. rendered
+# client-side) are left to apply_to_job_url to decide
+ACTIONABLE = {EASY_APPLY, UNKNOWN}
+
+# Ledger status and reason recorded for the jobs the pre-screen skips
+SKIP_OUTCOMES = {
+    ALREADY_APPLIED: ("applied", "Already applied (pre-screen)"),
+    EXTERNAL: ("not_applied", "External application (pre-screen)"),
+    UNAVAILABLE: ("not_applied", "Job no longer available (pre-screen)"),
+}
+
+UNAVAILABLE_PATTERN = re.compile(r"no longer (available|accepting applications)|job (has )?expired", re.I)
+
+
+def _is_external(href):
+    """True if a link leaves dice.com (an apply-on-company-site link)."""
+    host = urlparse(href).netloc.lower()
+    return bool(host) and not (host == "dice.com" or host.endswith(".dice.com"))
+
+
+def classify_job_detail(html):
+    """
+    Classifies a job detail page by its apply control.
+
+    Parameters:
+        html (str): Job detail page HTML
+
+    Returns:
+        str: One of EASY_APPLY, EXTERNAL, ALREADY_APPLIED, UNAVAILABLE or UNKNOWN
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+
+    apply_control = soup.select_one('[data-testid="apply-button"]')
+    if apply_control is not None:
+        text = apply_control.get_text(" ", strip=True).lower()
+        href = (apply_control.get("href") or "").strip()
+
+        if "applied" in text or "application submitted" in text:
+            return ALREADY_APPLIED
+        if apply_control.name == "a" and _is_external(href):
+            return EXTERNAL
+        if "/job-applications/" in href and "/wizard" in href:
+            return EASY_APPLY
+        if "apply" in text:
+            return EASY_APPLY
+
+    if UNAVAILABLE_PATTERN.search(soup.get_text(" ", strip=True)):
+        return UNAVAILABLE
+
+    # Legacy shadow-DOM button and client-rendered pages can only be judged in the browser
+    return UNKNOWN
+
+
+def prescreen_jobs(jobs, search_client, ledger=None, report_writer=None):
+    """
+    Fetches the detail page of every job concurrently over HTTP and keeps only
+    the jobs worth a browser navigation.
+
+    Skipped jobs are recorded in the ledger (and report) with their reason.
+
+    Parameters:
+        jobs (list): Job entries with a "Job URL" key
+        search_client (DiceSearchClient): Pooled HTTP session with the logged-in cookies
+        ledger (ApplicationLedger): Receives an outcome for every skipped job
+        report_writer (StreamingJobWriter): Optional report file for skipped jobs
+
+    Returns:
+        tuple: (actionable_jobs, counts per classification)
+    """
+    urls = [job["Job URL"] for job in jobs]
+    counts = {}
+    actionable = []
+
+    for job, page in zip(jobs, search_client.fetch_many(urls, request_class="detail")):
+        if page is None:
+            classification = UNKNOWN
+        elif page.status_code in (404, 410):
+            classification = UNAVAILABLE
+        elif page.ok:
+            classification = classify_job_detail(page.text)
+        else:
+            classification = UNKNOWN
+        counts[classification] = counts.get(classification, 0) + 1
+
+        if classification in ACTIONABLE:
+            actionable.append(job)
+            continue
+
+        status, reason = SKIP_OUTCOMES[classification]
+        job["Applied"] = status == "applied"
+        if ledger is not None:
+            ledger.record(job, status, reason)
+        if report_writer is not None:
+            report_writer.write(job)
+
+    summary = ", ".join(f"{name}: {count}" for name, count in sorted(counts.items()))
+    print(f"Pre-screened {len(jobs)} jobs over HTTP ({summary}); {len(actionable)} need the browser")
+    return actionable, counts
@@ -0,0 +1,282 @@
+import time
+import threading
+
+# Request class -> (requests per second, burst, initial concurrency, max concurrency,
+# latency target in seconds). The rate is a ceiling: it is halved on congestion and
+# grows back while requests succeed; concurrency follows the same AIMD rule.
+CLASSES = {
+    "search": (4.0, 8, 4, 8, 5.0),     # search result pages (HTTP or browser)
+    "detail": (6.0, 12, 6, 12, 5.0),   # job detail pages (pre-screen or browser)
+    "apply": (1.0, 2, 2, 8, 15.0),     # apply wizard navigations
+}
+
+# Responses that mean Dice wants us to slow down
+THROTTLE_STATUSES = {429, 503}
+
+# Multiplicative decrease on congestion, and the floors it can't go below
+DECREASE_FACTOR = 0.5
+MIN_CONCURRENCY = 1
+MIN_RATE_FRACTION = 0.1
+# Additive increase per successful request: +1 concurrency per "limit" requests, +RATE_STEP req/s
+RATE_STEP = 0.1
+# Weight of the newest sample in the latency average
+LATENCY_SMOOTHING = 0.2
+
+
+class TokenBucket:
+    """Paces requests to a rate with bursts of up to `burst` requests."""
+
+    def __init__(self, rate, burst):
+        """
+        Parameters:
+            rate (float): Tokens added per second
+            burst (int): Bucket size
+        """
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self._updated = time.monotonic()
+        self._not_before = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Takes one token, sleeping until one is available. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._not_before:
+                    delay = self._not_before - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                else:
+                    delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def hold(self, seconds):
+        """Hands out no tokens for the given time (e.g. a Retry-After)."""
+        with self._lock:
+            self._not_before = max(self._not_before, time.monotonic() + seconds)
+
+
+class RequestTicket:
+    """One in-flight request; observe() the response so its status counts as a signal."""
+
+    def __init__(self):
+        self.status = None
+        self.retry_after = None
+
+    def observe(self, response):
+        """
+        Records the outcome of an HTTP response.
+
+        Parameters:
+            response (requests.Response): Response of the request
+        """
+        self.status = response.status_code
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.strip().isdigit():
+            self.retry_after = float(retry_after)
+
+
+class RequestClassController:
+    """
+    Token bucket plus an AIMD concurrency limit for one request class.
+
+    Every finished request is a signal. A success within the latency target
+    raises the concurrency limit by 1/limit and the rate by RATE_STEP
+    (additive increase). A throttling status (429/503), a 5xx, an error or a
+    latency above the target halves both (multiplicative decrease), at most
+    once per smoothed latency so one burst of failures counts as one event.
+    """
+
+    def __init__(self, name, rate, burst, initial_limit, max_limit, latency_target):
+        self.name = name
+        self.max_rate = float(rate)
+        self.min_rate = self.max_rate * MIN_RATE_FRACTION
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.bucket = TokenBucket(rate, burst)
+        self.limit = float(initial_limit)
+        self.in_flight = 0
+        self.latency = None
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.decreases = 0
+        self.wait_seconds = 0.0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """Waits for a free concurrency slot, then for a token."""
+        start = time.monotonic()
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+        self.bucket.acquire()
+        with self._condition:
+            self.wait_seconds += time.monotonic() - start
+
+    def release(self, latency, status=None, error=False, retry_after=None):
+        """
+        Frees a slot and adjusts the limits from the request's outcome.
+
+        Parameters:
+            latency (float): Seconds the request took
+            status (int): HTTP status, if known
+            error (bool): The request raised (network error, timeout, crashed page)
+            retry_after (float): Seconds Dice asked us to wait before the next request
+        """
+        throttled = status in THROTTLE_STATUSES
+        failed = error or throttled or (status is not None and status >= 500)
+        with self._condition:
+            self.in_flight -= 1
+            self.requests += 1
+            self.errors += 1 if error else 0
+            self.throttled += 1 if throttled else 0
+            if not failed:
+                self.latency = latency if self.latency is None else (
+                    LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * self.latency
+                )
+            if failed or latency > self.latency_target:
+                self._decrease()
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                self.bucket.rate = min(self.max_rate, self.bucket.rate + RATE_STEP)
+            self._condition.notify_all()
+        if retry_after:
+            self.bucket.hold(retry_after)
+
+    def _decrease(self):
+        now = time.monotonic()
+        if now - self._last_decrease < max(1.0, self.latency or 0.0):
+            return
+        self._last_decrease = now
+        self.decreases += 1
+        self.limit = max(MIN_CONCURRENCY, self.limit * DECREASE_FACTOR)
+        self.bucket.rate = max(self.min_rate, self.bucket.rate * DECREASE_FACTOR)
+
+    def snapshot(self):
+        """Current limits and counters of the class."""
+        with self._condition:
+            return {
+                "concurrency_limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "rate": round(self.bucket.rate, 2),
+                "max_rate": self.max_rate,
+                "latency": round(self.latency, 3) if self.latency is not None else None,
+                "requests": self.requests,
+                "errors": self.errors,
+                "throttled": self.throttled,
+                "decreases": self.decreases,
+                "wait_seconds": round(self.wait_seconds, 1),
+            }
+
+
+class _Request:
+    """Context manager holding one slot of a request class."""
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.ticket = RequestTicket()
+
+    def __enter__(self):
+        self.controller.acquire()
+        self._start = time.monotonic()
+        return self.ticket
+
+    def __exit__(self, exc_type, exc, tb):
+        self.controller.release(
+            time.monotonic() - self._start,
+            status=self.ticket.status,
+            error=exc_type is not None,
+            retry_after=self.ticket.retry_after,
+        )
+        return False
+
+
+class RateController:
+    """
+    Shared pacing for every request sent to Dice, whether over HTTP or as a
+    browser page load, so parallel searches, pre-screens and apply workers
+    together stay under Dice's limits.
+
+    Usage:
+        with controller.request("detail") as ticket:
+            response = session.get(url)
+            ticket.observe(response)
+    """
+
+    def __init__(self, classes=None):
+        """
+        Parameters:
+            classes (dict): Class name -> (rate, burst, initial concurrency, max concurrency,
+                latency target); defaults to CLASSES
+        """
+        self.classes = {
+            name: RequestClassController(name, *settings)
+            for name, settings in (classes or CLASSES).items()
+        }
+
+    def request(self, request_class):
+        """
+        Reserves a slot for one request; blocks while the class is at its limits.
+
+        Parameters:
+            request_class (str): Class name from CLASSES
+
+        Returns:
+            context manager: Yields a RequestTicket; an exception leaving the block
+            counts as a failed request
+        """
+        return _Request(self.classes[request_class])
+
+    def snapshot(self):
+        """
+        Current limits, rates and counters per request class.
+
+        Returns:
+            dict: Class name -> metrics (see RequestClassController.snapshot)
+        """
+        return {name: controller.snapshot() for name, controller in self.classes.items()}
+
+    def summary(self):
+        """One-line description of every class's limits, for the logs."""
+        parts = []
+        for name, metrics in self.snapshot().items():
+            if not metrics["requests"]:
+                continue
+            latency = f"{metrics['latency']:g}s" if metrics["latency"] is not None else "n/a"
+            parts.append(
+                f"{name} {metrics['concurrency_limit']} concurrent at {metrics['rate']:g}/s "
+                f"({metrics['requests']} requests, latency {latency}, {metrics['throttled']} throttled, "
+                f"{metrics['errors']} errors, {metrics['wait_seconds']:g}s waiting)"
+            )
+        return "Request pacing: " + ("; ".join(parts) if parts else "no requests")
+
+
+_controller = None
+_controller_lock = threading.Lock()
+
+
+def get_rate_controller():
+    """
+    Returns the process-wide RateController.
+
+    Returns:
+        RateController: The shared controller
+    """
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = RateController()
+        return _controller
@@ -0,0 +1,190 @@
+import os
+import csv
+import json
+import threading
+import argparse
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.ledger import JOB_COLUMNS, job_guid_from_url, open_ledger
+except ImportError:
+    try:
+        from ..core.ledger import JOB_COLUMNS, job_guid_from_url, open_ledger
+    except ImportError:
+        from core.ledger import JOB_COLUMNS, job_guid_from_url, open_ledger
+
+EXCLUDED_COLUMNS = ["Job Title", "Job URL", "Company", "Location", "Employment Type", "Posted Date", "Exclusion Reason"]
+
+# Streamed report files and the Excel files exported from them on demand
+REPORT_FILES = {
+    "excluded": ("excluded_jobs.jsonl", "excluded_jobs.xlsx", EXCLUDED_COLUMNS),
+    "report": ("job_data.jsonl", "job_application_report.xlsx", JOB_COLUMNS),
+}
+
+
+def _record_key(record):
+    """Deduplication key for a job record: the job GUID, falling back to the URL."""
+    return job_guid_from_url(record.get("Job URL"))
+
+
+class StreamingJobWriter:
+    """
+    Appends job records to a JSONL or CSV file as they arrive.
+
+    Records are deduplicated by job GUID, so only the set of GUIDs is kept in memory.
+    The format is chosen from the file extension (.jsonl or .csv).
+    """
+
+    def __init__(self, path, columns=None, append=False):
+        """
+        Opens the report file for streaming.
+
+        Parameters:
+            path (str): Destination .jsonl or .csv path
+            columns (list): Column order for CSV files (defaults to JOB_COLUMNS)
+            append (bool): Keep existing records instead of starting a fresh file
+        """
+        self.path = path
+        self.columns = columns or JOB_COLUMNS
+        self.is_csv = path.lower().endswith(".csv")
+        self.written = 0
+        self._seen = set()
+        # The search pipeline and the apply workers write from different threads
+        self._lock = threading.Lock()
+
+        if append and os.path.exists(path):
+            for record in iter_records(path):
+                self._seen.add(_record_key(record))
+
+        write_header = self.is_csv and not (append and os.path.exists(path) and os.path.getsize(path) > 0)
+        self._file = open(path, "a" if append else "w", newline="", encoding="utf-8")
+        if self.is_csv:
+            self._csv = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction="ignore")
+            if write_header:
+                self._csv.writeheader()
+
+    def write(self, record):
+        """
+        Appends a record unless a record with the same GUID was already written.
+
+        Parameters:
+            record (dict): Job record
+
+        Returns:
+            bool: True if the record was written, False if it was a duplicate
+        """
+        key = _record_key(record)
+        with self._lock:
+            if key and key in self._seen:
+                return False
+            self._seen.add(key)
+
+            if self.is_csv:
+                self._csv.writerow(record)
+            else:
+                self._file.write(json.dumps(record, default=str) + "\n")
+            self._file.flush()
+            self.written += 1
+        return True
+
+    def write_many(self, records):
+        """Write several records and return how many were new."""
+        return sum(1 for record in records if self.write(record))
+
+    def close(self):
+        """Close the underlying file."""
+        if not self._file.closed:
+            self._file.close()
+
+
+def iter_records(path):
+    """
+    Yields the records stored in a JSONL or CSV report file one at a time.
+
+    Parameters:
+        path (str): Path to the .jsonl or .csv file
+
+    Yields:
+        dict: One job record
+    """
+    if not os.path.exists(path):
+        return
+
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            for row in csv.DictReader(f):
+                yield row
+        else:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A partially written last line (e.g. after a crash) is skipped
+                    continue
+
+
+def write_excel(records, filename, columns):
+    """
+    Writes records to an Excel file using openpyxl's write-only mode.
+
+    Rows are streamed to the workbook, so no DataFrame is built for large exports.
+
+    Parameters:
+        records (iterable): Job records (dicts)
+        filename (str): Destination .xlsx path
+        columns (list): Column order of the sheet
+
+    Returns:
+        int: Number of rows written
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(columns)
+
+    rows = 0
+    for record in records:
+        sheet.append([record.get(column) for column in columns])
+        rows += 1
+
+    workbook.save(filename)
+    return rows
+
+
+def export_report(name, directory="."):
+    """
+    Exports a streamed report file to its Excel counterpart.
+
+    Parameters:
+        name (str): Report name, one of REPORT_FILES ("excluded", "report")
+        directory (str): Directory that holds the report files
+
+    Returns:
+        str: Path to the written .xlsx file
+    """
+    source, target, columns = REPORT_FILES[name]
+    source = os.path.join(directory, source)
+    target = os.path.join(directory, target)
+    rows = write_excel(iter_records(source), target, columns)
+    print(f"Exported {rows} rows from {os.path.basename(source)} to {os.path.basename(target)}")
+    return target
+
+
+if __name__ == "__main__":
+    # Export command: python -m core.report_writer excluded|report|applied|not_applied
+    parser = argparse.ArgumentParser(description="Export Dice Auto Apply reports to Excel")
+    parser.add_argument("report", choices=list(REPORT_FILES) + ["applied", "not_applied"])
+    parser.add_argument("--dir", default=".", help="Directory holding the report files")
+    args = parser.parse_args()
+
+    if args.report in REPORT_FILES:
+        export_report(args.report, args.dir)
+    else:
+        ledger = open_ledger(os.path.join(args.dir, "job_ledger.db"))
+        filename = os.path.join(args.dir, f"{args.report}_jobs.xlsx")
+        exported = ledger.export_excel(args.report, filename)
+        ledger.close()
+        print(f"Exported {exported} rows from the ledger to {os.path.basename(filename)}")
@@ -0,0 +1,117 @@
+import weakref
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.rate_controller import get_rate_controller
+except ImportError:
+    try:
+        from ..core.rate_controller import get_rate_controller
+    except ImportError:
+        from core.rate_controller import get_rate_controller
+
+IMAGES = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico"]
+FONTS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+MEDIA = ["*.mp4", "*.webm", "*.mp3", "*.m4a", "*.ogg"]
+TRACKERS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*adservice.google.com*", "*facebook.net*", "*connect.facebook.com*", "*hotjar.com*",
+    "*segment.io*", "*segment.com*", "*newrelic.com*", "*nr-data.net*", "*optimizely.com*",
+    "*bat.bing.com*", "*px.ads.linkedin.com*", "*snap.licdn.com*", "*adsrvr.org*",
+    "*quantserve.com*", "*scorecardresearch.com*", "*clarity.ms*", "*fullstory.com*",
+]
+
+# URL patterns blocked per page type (Network.setBlockedURLs wildcards)
+PROFILES = {
+    "off": [],
+    # Login and other pages we don't know: only drop trackers
+    "minimal": TRACKERS,
+    # Search results and job details are read through the DOM; nothing visual is needed
+    "search": IMAGES + FONTS + MEDIA + TRACKERS,
+    "detail": IMAGES + FONTS + MEDIA + TRACKERS,
+    # The apply wizard keeps its fonts so button text renders and measures normally
+    "wizard": IMAGES + MEDIA + TRACKERS,
+}
+
+# Rate controller class of the navigations to each page type
+REQUEST_CLASSES = {"search": "search", "detail": "detail", "wizard": "apply"}
+
+# Profile currently active on each driver that has resource blocking enabled
+_active_profiles = weakref.WeakKeyDictionary()
+
+
+def profile_for_url(url):
+    """
+    Picks the resource profile of a Dice URL.
+
+    Parameters:
+        url (str): Page URL
+
+    Returns:
+        str: Profile name
+    """
+    url = url or ""
+    if "/job-applications/" in url or "/wizard" in url:
+        return "wizard"
+    if "/job-detail/" in url:
+        return "detail"
+    if "dice.com/jobs" in url:
+        return "search"
+    return "minimal"
+
+
+def enable_resource_blocking(driver, profile="minimal"):
+    """
+    Turns on resource blocking for a driver through the DevTools protocol.
+
+    Parameters:
+        driver (WebDriver): Chromium-based driver
+        profile (str): Initial profile
+
+    Returns:
+        bool: True if blocking is active (False on browsers without CDP)
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+    except Exception as e:
+        print(f"Resource blocking unavailable: {e}")
+        return False
+    _active_profiles[driver] = None
+    set_resource_profile(driver, profile)
+    return True
+
+
+def set_resource_profile(driver, profile):
+    """
+    Switches the blocked URL patterns of a driver to a profile.
+    Does nothing for drivers without resource blocking or if the profile is already active.
+
+    Parameters:
+        driver (WebDriver): Driver
+        profile (str): Profile name from PROFILES
+    """
+    if driver not in _active_profiles or _active_profiles[driver] == profile:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": PROFILES[profile]})
+        _active_profiles[driver] = profile
+    except Exception as e:
+        print(f"Could not set resource profile '{profile}': {e}")
+
+
+def load_page(driver, url, profile=None):
+    """
+    Navigates to a URL with the resource profile of its page type. Search, detail
+    and wizard navigations are paced by the shared rate controller.
+
+    Parameters:
+        driver (WebDriver): Driver
+        url (str): URL to load
+        profile (str): Profile to use instead of the one picked from the URL
+    """
+    profile = profile or profile_for_url(url)
+    set_resource_profile(driver, profile)
+    request_class = REQUEST_CLASSES.get(profile)
+    if request_class is None:
+        driver.get(url)
+        return
+    with get_rate_controller().request(request_class):
+        driver.get(url)
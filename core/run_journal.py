@@ -0,0 +1,195 @@
+import os
+import json
+import time
+import threading
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.driver_cache import CACHE_DIR
+    from dice_auto_apply.core.ledger import job_guid_from_url
+except ImportError:
+    try:
+        from ..core.driver_cache import CACHE_DIR
+        from ..core.ledger import job_guid_from_url
+    except ImportError:
+        from core.driver_cache import CACHE_DIR
+        from core.ledger import job_guid_from_url
+
+RUN_JOURNAL_FILE = os.path.join(CACHE_DIR, "run_journal.jsonl")
+
+# Job states in the journal, in order
+QUEUED, STARTED, DONE = "queued", "started", "done"
+STATES = (QUEUED, STARTED, DONE)
+
+
+class RunState:
+    """What a journal says about its run: the queries searched and every queued job's state."""
+
+    def __init__(self):
+        self.queries = []
+        self.completed_queries = set()
+        # GUID -> {"job", "rank", "state"}, in the order the jobs were queued
+        self.jobs = {}
+        self.started_at = None
+        self.resumes = 0
+        self.finished = False
+
+    def apply(self, record):
+        """Replays one journal record."""
+        event = record.get("event")
+        if event == "run":
+            self.queries = list(record.get("queries", []))
+            self.started_at = record.get("at")
+        elif event == "resume":
+            self.resumes += 1
+        elif event == "query_done":
+            self.completed_queries.add(record["query"])
+        elif event == "queued":
+            entry = self.jobs.setdefault(record["guid"], {"state": QUEUED})
+            entry["job"] = record["job"]
+            entry["rank"] = record.get("rank")
+        elif event in (STARTED, DONE):
+            # A worker's record can be written before the job's queued record;
+            # the state only moves forward
+            entry = self.jobs.setdefault(record["guid"], {"job": None, "rank": None, "state": QUEUED})
+            if STATES.index(event) > STATES.index(entry["state"]):
+                entry["state"] = event
+        elif event == "finished":
+            self.finished = True
+
+    def remaining_queries(self):
+        """Queries whose results were not fully queued, in run order."""
+        return [query for query in self.queries if query not in self.completed_queries]
+
+    def unfinished_jobs(self):
+        """
+        Jobs queued but not finished, in queue order. Jobs a worker had started are
+        included; the ledger tells whether the application went through.
+
+        Returns:
+            list: (job, rank) tuples
+        """
+        return [(entry["job"], entry["rank"]) for entry in self.jobs.values()
+                if entry["state"] != DONE and entry["job"] is not None]
+
+    def summary(self):
+        done = sum(1 for entry in self.jobs.values() if entry["state"] == DONE)
+        return (f"{done}/{len(self.jobs)} queued jobs done, "
+                f"{len(self.completed_queries)}/{len(self.queries)} queries searched")
+
+
+def _ends_with_newline(path):
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def read_run_state(path=RUN_JOURNAL_FILE):
+    """
+    Replays a run journal.
+
+    Parameters:
+        path (str): Journal file
+
+    Returns:
+        RunState: State of the journaled run, or None if there is no journal
+    """
+    if not os.path.exists(path):
+        return None
+    state = RunState()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A crash can cut off the last line; everything before it still counts
+                continue
+            state.apply(record)
+    return state if state.queries else None
+
+
+class RunJournal:
+    """
+    Append-only JSONL journal of one run: its queries, the jobs put on the apply
+    queue (with their queue rank) and each job's progress.
+
+    Every record is one appended line flushed right away, so a crashed browser,
+    a closed window or a killed process loses at most the job in progress. A
+    later run can replay the journal (read_run_state) and continue from the
+    first unfinished job instead of searching again.
+    """
+
+    def __init__(self, path=RUN_JOURNAL_FILE):
+        """
+        Parameters:
+            path (str): Journal file; each new run replaces it
+        """
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _open(self, mode):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, mode, encoding="utf-8")
+
+    def _append(self, record):
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self._file.flush()
+
+    def start(self, queries):
+        """
+        Starts the journal of a new run, replacing the previous one.
+
+        Parameters:
+            queries (list): Search queries of the run
+        """
+        self.close()
+        self._open("w")
+        self._append({"event": "run", "at": time.time(), "queries": list(queries)})
+
+    def resume(self):
+        """
+        Reopens the journal of the last run if it did not finish.
+
+        Returns:
+            RunState: State to continue from, or None if there is nothing to resume
+        """
+        state = read_run_state(self.path)
+        if state is None or state.finished:
+            return None
+        self.close()
+        self._open("a")
+        if self._file.tell() and not _ends_with_newline(self.path):
+            # Finish a line cut off by the crash so the next record starts cleanly
+            self._file.write("\n")
+        self._append({"event": "resume", "at": time.time()})
+        return state
+
+    def query_done(self, query):
+        """Records that every job of a query was queued or skipped."""
+        self._append({"event": "query_done", "query": query})
+
+    def queued(self, job, rank=None):
+        """Records a job put on the apply queue."""
+        self._append({"event": "queued", "guid": job_guid_from_url(job["Job URL"]), "rank": rank, "job": job})
+
+    def started(self, job):
+        """Records that an apply worker took a job."""
+        self._append({"event": STARTED, "guid": job_guid_from_url(job["Job URL"])})
+
+    def done(self, job, applied):
+        """Records a job's outcome."""
+        self._append({"event": DONE, "guid": job_guid_from_url(job["Job URL"]), "applied": bool(applied)})
+
+    def finish(self):
+        """Marks the run complete; it is no longer offered for resuming."""
+        self._append({"event": "finished", "at": time.time()})
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,307 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.crawl_watermarks import guids_in_html
+except ImportError:
+    try:
+        from ..core.crawl_watermarks import guids_in_html
+    except ImportError:
+        from core.crawl_watermarks import guids_in_html
+try:
+    from dice_auto_apply.core.timeout_policy import get_timeout_policy
+    from dice_auto_apply.core.rate_controller import get_rate_controller
+except ImportError:
+    try:
+        from ..core.timeout_policy import get_timeout_policy
+        from ..core.rate_controller import get_rate_controller
+    except ImportError:
+        from core.timeout_policy import get_timeout_policy
+        from core.rate_controller import get_rate_controller
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    # lxml is optional; the stdlib parser is slower but always available
+    HTML_PARSER = "html.parser"
+
+SEARCH_URL = "https://www.dice.com/jobs?filters.employmentType=CONTRACTS&filters.postedDate=ONE&q={query}"
+JOBS_PER_PAGE = 20
+MAX_PAGES = 11
+DEFAULT_PAGES = 3
+
+DEFAULT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+def build_search_url(search_query, page=1):
+    """
+    Builds the Dice search URL for a query and result page.
+
+    Parameters:
+        search_query (str): Search query
+        page (int): 1-based result page
+
+    Returns:
+        str: Search URL
+    """
+    url = SEARCH_URL.format(query=quote(search_query))
+    return url if page == 1 else f"{url}&page={page}"
+
+
+def pages_for_total(total_jobs, max_pages=MAX_PAGES):
+    """Number of result pages to read for a total result count."""
+    if total_jobs is None:
+        return DEFAULT_PAGES
+    return min(max_pages, (total_jobs + JOBS_PER_PAGE - 1) // JOBS_PER_PAGE)
+
+
+def parse_total_results(html):
+    """
+    Extracts the total result count from a search page.
+
+    Parameters:
+        html (str): Search page HTML
+
+    Returns:
+        int: Total number of results, or None if the count isn't on the page
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    for element in soup.select("p[class*='text-neutral-900']"):
+        match = re.search(r"([\d,]+)\s+results", element.get_text(" ", strip=True))
+        if match:
+            return int(match.group(1).replace(",", ""))
+    return None
+
+
+def _text(element, default="Unknown"):
+    """Stripped text of an element, or the default if the element is missing."""
+    if element is None:
+        return default
+    return element.get_text(" ", strip=True) or default
+
+
+def parse_job_cards(html, seen_guids=None, first_position=0):
+    """
+    Parses the job cards of a search page into job entries.
+
+    Parameters:
+        html (str): Search page HTML
+        seen_guids (set): GUIDs already processed in this run; only their GUID is read
+        first_position (int): Position of the page's first card in the query's results
+
+    Returns:
+        tuple: (job entries with the same keys as the browser search, number of cards on the page)
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    cards = soup.select("div[data-id][data-job-guid]")
+    seen_guids = seen_guids or ()
+    jobs = []
+    for index, card in enumerate(cards):
+        job_guid = card.get("data-job-guid")
+        if not job_guid or job_guid in seen_guids:
+            continue
+
+        job_employment_type = "Contract"  # Default since we're filtering for contracts
+        emp_type_element = card.select_one("p#employmentType-label")
+        if emp_type_element is not None:
+            job_employment_type = _text(emp_type_element, job_employment_type)
+        else:
+            for element in card.select("div.box p"):
+                if "Contract" in element.get_text():
+                    job_employment_type = element.get_text(strip=True)
+                    break
+
+        jobs.append({
+            "Job Title": _text(card.select_one("a[data-testid='job-search-job-detail-link']")),
+            "Job URL": f"https://www.dice.com/job-detail/{job_guid}",
+            "Company": _text(card.select_one("a[href*='company-profile'] p")),
+            "Location": _text(card.select_one("p.text-sm.font-normal.text-zinc-600")),
+            "Employment Type": job_employment_type,
+            "Posted Date": "Today",
+            "Applied": False,
+            "Result Position": first_position + index,
+        })
+    return jobs, len(cards)
+
+
+class DiceSearchClient:
+    """
+    Fetches Dice search result pages over HTTP with the browser's session.
+
+    The cookies of a logged-in driver are copied into one pooled
+    requests.Session, so all pages reuse keep-alive connections. The pages
+    of a query after the first are fetched concurrently.
+    """
+
+    def __init__(self, cookies=None, user_agent=None, max_workers=6, timeout=None):
+        """
+        Parameters:
+            cookies (list): Selenium-style cookie dicts (name, value, domain, path)
+            user_agent (str): User agent to send, normally the browser's own
+            max_workers (int): Number of pages fetched at the same time
+            timeout (float): Per-request timeout in seconds (default: learned "http_request" timeout)
+        """
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers, max_retries=2)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(DEFAULT_HEADERS)
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+        for cookie in cookies or []:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain"), path=cookie.get("path", "/")
+            )
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+    @classmethod
+    def from_driver(cls, driver, **kwargs):
+        """
+        Creates a client that shares the session of a Selenium driver.
+
+        Parameters:
+            driver (WebDriver): Logged-in driver
+            **kwargs: Passed to the constructor
+
+        Returns:
+            DiceSearchClient: The client
+        """
+        try:
+            user_agent = driver.execute_script("return navigator.userAgent")
+        except Exception:
+            user_agent = None
+        return cls(cookies=driver.get_cookies(), user_agent=user_agent, **kwargs)
+
+    def fetch_page(self, url):
+        """
+        Downloads one page.
+
+        Parameters:
+            url (str): Page URL
+
+        Returns:
+            str: Page HTML
+        """
+        response = self._get(url)
+        response.raise_for_status()
+        return response.text
+
+    def _get(self, url, request_class="search"):
+        """
+        GET a URL paced by the shared rate controller, recording its latency
+        (or timeout) in the timeout policy.
+        """
+        policy = get_timeout_policy()
+        timeout = policy.timeout("http_request") if self.timeout is None else self.timeout
+        try:
+            with get_rate_controller().request(request_class) as ticket:
+                response = self.session.get(url, timeout=timeout)
+                ticket.observe(response)
+        except requests.Timeout:
+            policy.record("http_request", timeout, timed_out=True)
+            raise
+        policy.record("http_request", response.elapsed.total_seconds())
+        return response
+
+    def fetch_many(self, urls, request_class="detail"):
+        """
+        Requests many URLs concurrently over the pooled session.
+
+        Parameters:
+            urls (list): URLs to request
+            request_class (str): Rate controller class the requests are paced in
+
+        Returns:
+            list: requests.Response per URL (any status), or None where the request failed
+        """
+        def get(url):
+            try:
+                return self._get(url, request_class)
+            except Exception as e:
+                print(f"Error fetching {url}: {e}")
+                return None
+        return list(self._executor.map(get, urls))
+
+    def _fetch_or_none(self, url):
+        """Fetch a result page; a failed page is reported and yields None."""
+        try:
+            return self.fetch_page(url)
+        except Exception as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+    def search(self, search_query, max_pages=MAX_PAGES, seen_guids=None, stats=None, watermark=None):
+        """
+        Fetches all result pages of a query.
+
+        Parameters:
+            search_query (str): Search query
+            max_pages (int): Maximum number of pages to read
+            seen_guids (set): GUIDs already processed in this run; those cards are skipped
+            stats (dict): Receives the number of cards on the pages read under "cards"
+            watermark (QueryWatermark): What earlier runs decided for this query; its jobs
+                are skipped like seen_guids, and pages holding only such jobs aren't parsed
+
+        Returns:
+            list: Job entries in page order, or None if the first page couldn't be
+            parsed (e.g. the results are rendered client-side), so the caller can
+            fall back to the browser
+        """
+        first_url = build_search_url(search_query)
+        html = self._fetch_or_none(first_url)
+        if html is None:
+            return None
+
+        skip_guids = set(seen_guids or ())
+        if watermark is not None:
+            skip_guids |= watermark.known
+            watermark.check_page(guids_in_html(html))
+
+        jobs, card_count = parse_job_cards(html, skip_guids)
+        total_jobs = parse_total_results(html)
+        if not card_count:
+            # An explicit "0 results" is a real answer; no cards and no count is not
+            return [] if total_jobs == 0 else None
+
+        total_pages = pages_for_total(total_jobs, max_pages)
+        print(f"Total jobs for query '{search_query}': {total_jobs}, reading up to {total_pages} pages")
+
+        pages = list(range(2, total_pages + 1))
+        urls = [build_search_url(search_query, page) for page in pages]
+        for page, page_html in zip(pages, self._executor.map(self._fetch_or_none, urls)):
+            if page_html is None:
+                continue
+            guids = guids_in_html(page_html)
+            if watermark is not None:
+                watermark.check_page(guids)
+            if guids and skip_guids.issuperset(guids):
+                # Nothing new on the page, so it isn't parsed
+                card_count += len(guids)
+                continue
+            page_jobs, page_cards = parse_job_cards(page_html, skip_guids, (page - 1) * JOBS_PER_PAGE)
+            jobs.extend(page_jobs)
+            card_count += page_cards
+
+        self._count_cards(stats, card_count)
+        return jobs
+
+    @staticmethod
+    def _count_cards(stats, card_count):
+        if stats is not None:
+            stats["cards"] = stats.get("cards", 0) + card_count
+
+    def close(self):
+        """Release the worker threads and pooled connections."""
+        self._executor.shutdown(wait=False)
+        self.session.close()
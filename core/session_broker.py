@@ -0,0 +1,160 @@
+import time
+import threading
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.driver_cache import StartupTimer
+    from dice_auto_apply.core.session_store import SessionStore, ensure_logged_in, probe_session
+except ImportError:
+    try:
+        from ..core.driver_cache import StartupTimer
+        from ..core.session_store import SessionStore, ensure_logged_in, probe_session
+    except ImportError:
+        from core.driver_cache import StartupTimer
+        from core.session_store import SessionStore, ensure_logged_in, probe_session
+
+# A driver that waited longer than this is probed before it is handed out
+RECHECK_AFTER_SECONDS = 15 * 60
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class SessionBroker:
+    """
+    Keeps one logged-in driver ready for the next run.
+
+    The driver is started and logged in on a background thread (warm), so the
+    run that acquires it starts searching immediately. A session created
+    elsewhere, e.g. by Test Login, can be adopted so the warm driver restores
+    it instead of logging in again.
+    """
+
+    def __init__(self, driver_factory, store=None, remember=True):
+        """
+        Parameters:
+            driver_factory (callable): Returns a new WebDriver
+            store (SessionStore): Session store used for logins (default: the one in ~/.dice_auto_apply)
+            remember (bool): Reuse and save sessions on disk (see ensure_logged_in)
+        """
+        self.driver_factory = driver_factory
+        self.store = store or SessionStore()
+        self.remember = remember
+        self._lock = threading.Lock()
+        self._driver = None
+        self._ready_at = 0.0
+        self._username = None
+        self._thread = None
+        self._closed = False
+
+    def warm(self, username, password, session=None):
+        """
+        Starts a logged-in driver for an account in the background.
+        Does nothing if a driver for the account is ready or being started.
+
+        Parameters:
+            username (str): Dice account email/username
+            password (str): Dice account password
+            session (dict): Session to restore instead of logging in (from SessionStore.capture)
+        """
+        with self._lock:
+            if self._closed or not username or not password:
+                return
+            busy = self._driver is not None or (self._thread is not None and self._thread.is_alive())
+            if busy and self._username == username and session is None:
+                return
+            self._username = username
+            self._thread = threading.Thread(
+                target=self._warm, args=(username, password, session), daemon=True
+            )
+            self._thread.start()
+
+    def _warm(self, username, password, session):
+        timer = StartupTimer("Session warm-up")
+        driver = None
+        try:
+            driver = self.driver_factory()
+            timer.mark("browser")
+            if session is not None:
+                self.store.restore(driver, session)
+                logged_in = True
+            else:
+                logged_in = ensure_logged_in(driver, (username, password), self.store, self.remember)
+            timer.mark("login")
+            timer.report()
+        except Exception as e:
+            print(f"Session warm-up failed: {e}")
+            logged_in = False
+
+        with self._lock:
+            keep = logged_in and not self._closed and self._username == username
+            if keep:
+                previous, self._driver, self._ready_at = self._driver, driver, time.time()
+        if not keep:
+            if driver is not None:
+                _quit(driver)
+            return
+        if previous is not None:
+            _quit(previous)
+
+    def adopt(self, driver, username, password):
+        """
+        Takes over the session of a logged-in driver and warms a run driver with it.
+        The given driver is quit.
+
+        Parameters:
+            driver (WebDriver): Logged-in driver (e.g. the Test Login browser)
+            username (str): Account it is logged in to
+            password (str): Account password, used if the session can't be restored
+        """
+        try:
+            session = self.store.capture(driver, username)
+        finally:
+            _quit(driver)
+        if self.remember:
+            self.store.save_session(session)
+        self.warm(username, password, session=session)
+
+    def acquire(self, username, timeout=None):
+        """
+        Hands out the warm driver of an account, waiting for a warm-up in progress.
+
+        Parameters:
+            username (str): Account the run logs in with
+            timeout (float): Maximum seconds to wait for a warm-up (None: until it ends)
+
+        Returns:
+            WebDriver: Logged-in driver now owned by the caller, or None if there is
+            none for this account (the caller logs in itself)
+        """
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        with self._lock:
+            driver, self._driver = self._driver, None
+            ready_at = self._ready_at
+            matches = self._username == username
+        if driver is None:
+            return None
+        try:
+            if not matches:
+                raise ValueError("warm driver belongs to another account")
+            driver.current_url  # raises if the browser was closed
+            if time.time() - ready_at > RECHECK_AFTER_SECONDS and not probe_session(driver.get_cookies()):
+                raise ValueError("warm session has expired")
+        except Exception as e:
+            print(f"Discarding warm driver: {e}")
+            _quit(driver)
+            return None
+        return driver
+
+    def close(self):
+        """Quits the warm driver; later warm-ups are ignored."""
+        with self._lock:
+            self._closed = True
+            driver, self._driver = self._driver, None
+        if driver is not None:
+            _quit(driver)
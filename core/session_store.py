@@ -0,0 +1,286 @@
+import os
+import json
+import time
+import requests
+from urllib.parse import urlparse
+from dotenv import load_dotenv
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.driver_cache import CACHE_DIR, StartupTimer
+    from dice_auto_apply.core.dice_login import login_to_dice, export_session_cookies, apply_session_cookies
+except ImportError:
+    try:
+        from ..core.driver_cache import CACHE_DIR, StartupTimer
+        from ..core.dice_login import login_to_dice, export_session_cookies, apply_session_cookies
+    except ImportError:
+        from core.driver_cache import CACHE_DIR, StartupTimer
+        from core.dice_login import login_to_dice, export_session_cookies, apply_session_cookies
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:
+    # Without cryptography sessions are never written to disk; every run logs in
+    Fernet = None
+try:
+    import keyring
+except ImportError:
+    # The key must not sit next to the ciphertext; without a keyring sessions aren't stored
+    keyring = None
+
+SESSION_FILE = os.path.join(CACHE_DIR, "session.enc")
+# The encryption key lives in the OS keyring (Keychain, Credential Manager, Secret Service)
+KEYRING_SERVICE = "dice_auto_apply"
+KEYRING_KEY_NAME = "session_key"
+# Earlier versions kept the key in this file next to the session; it is deleted on the next save
+LEGACY_KEY_FILE = os.path.join(CACHE_DIR, "session.key")
+
+# Dice sessions last longer, but a week-old session is rarely worth a failed probe
+MAX_SESSION_AGE = 7 * 24 * 60 * 60
+
+BASE_URL = "https://www.dice.com/"
+# Logged-out requests for the dashboard are redirected to the login page
+PROBE_URL = "https://www.dice.com/dashboard"
+
+READ_LOCAL_STORAGE_SCRIPT = """
+var items = {};
+for (var i = 0; i < window.localStorage.length; i++) {
+    var key = window.localStorage.key(i);
+    items[key] = window.localStorage.getItem(key);
+}
+return items;
+"""
+
+WRITE_LOCAL_STORAGE_SCRIPT = """
+var items = arguments[0];
+Object.keys(items).forEach(function (key) { window.localStorage.setItem(key, items[key]); });
+"""
+
+
+def _write_private(path, data):
+    """Atomically write bytes to a file only the current user can read (0600)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class SessionStore:
+    """
+    Encrypted-at-rest store for one logged-in Dice session (cookies and localStorage).
+
+    The data is encrypted with Fernet and written to a 0600 file; the key is kept
+    in the OS keyring, so the file alone (a backup, a copied home directory)
+    doesn't give the session away. Without cryptography, keyring or a usable
+    keyring backend nothing is stored and every run logs in. A session is bound
+    to the username it was created for and expires after max_age seconds.
+    """
+
+    def __init__(self, path=SESSION_FILE, max_age=MAX_SESSION_AGE, keyring_service=KEYRING_SERVICE):
+        """
+        Parameters:
+            path (str): Encrypted session file
+            max_age (float): Seconds after which a saved session is ignored
+            keyring_service (str): Keyring service name the key is stored under
+        """
+        self.path = path
+        self.max_age = max_age
+        self.keyring_service = keyring_service
+
+    @property
+    def available(self):
+        """True if sessions can be stored (cryptography and keyring are installed)."""
+        return Fernet is not None and keyring is not None
+
+    def _fernet(self, create=False):
+        """Fernet for the keyring key, creating the key if asked. None if there is no key."""
+        try:
+            key = keyring.get_password(self.keyring_service, KEYRING_KEY_NAME)
+            if key is None:
+                if not create:
+                    return None
+                key = Fernet.generate_key().decode("ascii")
+                keyring.set_password(self.keyring_service, KEYRING_KEY_NAME, key)
+        except Exception as e:
+            # e.g. no keyring backend on a headless Linux box
+            print(f"Keyring unavailable; the Dice session is not stored: {e}")
+            return None
+        return Fernet(key.encode("ascii"))
+
+    @staticmethod
+    def capture(driver, username):
+        """
+        Reads the session of a logged-in driver.
+
+        Parameters:
+            driver (WebDriver): Logged-in driver on a dice.com page
+            username (str): Account the session belongs to
+
+        Returns:
+            dict: Session with "username", "saved_at", "cookies" and "local_storage"
+        """
+        try:
+            local_storage = driver.execute_script(READ_LOCAL_STORAGE_SCRIPT) or {}
+        except Exception:
+            local_storage = {}
+        return {
+            "username": username,
+            "saved_at": time.time(),
+            "cookies": export_session_cookies(driver),
+            "local_storage": local_storage,
+        }
+
+    def save(self, driver, username):
+        """
+        Stores the session of a logged-in driver.
+
+        Parameters:
+            driver (WebDriver): Logged-in driver on a dice.com page
+            username (str): Account the session belongs to
+        """
+        if self.available:
+            self.save_session(self.capture(driver, username))
+
+    def save_session(self, session):
+        """
+        Encrypts and stores a captured session.
+
+        Parameters:
+            session (dict): Session from capture()
+        """
+        if not self.available:
+            return
+        fernet = self._fernet(create=True)
+        if fernet is None:
+            return
+        try:
+            token = fernet.encrypt(json.dumps(session).encode("utf-8"))
+            _write_private(self.path, token)
+            if os.path.exists(LEGACY_KEY_FILE):
+                os.remove(LEGACY_KEY_FILE)
+        except Exception as e:
+            print(f"Warning: could not save the Dice session: {e}")
+
+    def load(self, username):
+        """
+        Reads the stored session of an account.
+
+        Parameters:
+            username (str): Account to load the session for
+
+        Returns:
+            dict: Session with "cookies" and "local_storage", or None if there is no
+            usable session (missing, expired, another account, or unreadable)
+        """
+        if not self.available or not os.path.exists(self.path):
+            return None
+        fernet = self._fernet()
+        if fernet is None:
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                session = json.loads(fernet.decrypt(f.read()).decode("utf-8"))
+        except (InvalidToken, ValueError, OSError) as e:
+            print(f"Ignoring unreadable saved session: {e}")
+            return None
+        if session.get("username") != username:
+            return None
+        if time.time() - session.get("saved_at", 0) > self.max_age:
+            return None
+        return session
+
+    def clear(self):
+        """Deletes the stored session (the key is kept)."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def restore(driver, session):
+        """
+        Loads a stored session into a driver.
+
+        Parameters:
+            driver (WebDriver): Fresh driver
+            session (dict): Session from load()
+
+        Returns:
+            int: Number of cookies that were set
+        """
+        added = apply_session_cookies(driver, session.get("cookies", []), BASE_URL)
+        if session.get("local_storage"):
+            driver.execute_script(WRITE_LOCAL_STORAGE_SCRIPT, session["local_storage"])
+        return added
+
+
+def probe_session(cookies, timeout=5):
+    """
+    Checks with one HTTP request whether session cookies are still logged in.
+
+    Parameters:
+        cookies (list): Selenium-style cookie dicts
+        timeout (float): Request timeout in seconds
+
+    Returns:
+        bool: True if Dice served the dashboard itself (200 on the dashboard URL),
+        not a login redirect, an error page or a refusal
+    """
+    with requests.Session() as session:
+        for cookie in cookies:
+            session.cookies.set(cookie["name"], cookie["value"],
+                                domain=cookie.get("domain"), path=cookie.get("path", "/"))
+        try:
+            response = session.get(PROBE_URL, timeout=timeout)
+        except requests.RequestException as e:
+            print(f"Session probe failed: {e}")
+            return False
+    final_path = urlparse(response.url).path
+    return response.status_code == 200 and final_path.startswith(urlparse(PROBE_URL).path)
+
+
+def ensure_logged_in(driver, credentials_from_params=None, store=None, remember=True):
+    """
+    Brings a driver into a logged-in state, reusing the saved session when it is still valid.
+
+    The saved session is checked with one HTTP request first; the full login only
+    runs when there is no saved session or Dice no longer accepts it. A successful
+    full login is saved for the next run.
+
+    Parameters:
+        driver (WebDriver): Fresh driver
+        credentials_from_params (tuple): Optional (username, password) instead of the .env values
+        store (SessionStore): Session store (default: the one in ~/.dice_auto_apply)
+        remember (bool): Reuse and save sessions; False always runs the full login
+
+    Returns:
+        bool: True if the driver is logged in
+    """
+    if credentials_from_params and len(credentials_from_params) == 2:
+        username = credentials_from_params[0]
+    else:
+        load_dotenv()
+        username = os.getenv("DICE_USERNAME")
+
+    store = store or SessionStore()
+    if remember and username:
+        timer = StartupTimer("Session restore")
+        session = store.load(username)
+        if session is not None:
+            valid = probe_session(session["cookies"])
+            timer.mark("probe")
+            if valid:
+                store.restore(driver, session)
+                timer.mark("restore")
+                timer.report()
+                print("Reused saved Dice session")
+                return True
+            print("Saved Dice session has expired; logging in again")
+            store.clear()
+
+    if not login_to_dice(driver, credentials_from_params):
+        return False
+    if remember and username:
+        store.save(driver, username)
+    return True
@@ -0,0 +1,180 @@
+import os
+import bisect
+import threading
+# Try both absolute and relative imports for compatibility
+try:
+    from dice_auto_apply.core.driver_cache import CACHE_DIR, load_json_cache, save_json_cache
+except ImportError:
+    try:
+        from ..core.driver_cache import CACHE_DIR, load_json_cache, save_json_cache
+    except ImportError:
+        from core.driver_cache import CACHE_DIR, load_json_cache, save_json_cache
+
+TIMEOUT_CACHE_FILE = os.path.join(CACHE_DIR, "timeouts.json")
+
+# Wait site -> (default, floor, ceiling) in seconds. The default is used until
+# the site has enough samples; learned values never leave [floor, ceiling].
+SITES = {
+    "page_load": (20, 5, 60),        # search page navigation until <body> exists
+    "result_count": (20, 5, 45),     # result count rendered on the first search page
+    "result_cards": (60, 10, 90),    # job cards rendered on a search page
+    "page_fetch": (60, 10, 120),     # in-page fetch of a query's remaining pages
+    "http_request": (20, 5, 30),     # one HTTP request of the search client
+    "apply_flow": (40, 10, 90),      # apply control up to the Submit click
+    "apply_confirm": (30, 5, 60),    # confirmation after Submit
+    "login_step": (20, 5, 45),       # login form step (page, password field)
+    "login_verify": (60, 10, 120),   # logged-in page after submitting the password
+}
+
+PERCENTILE = 0.95
+MARGIN = 1.5
+MIN_SAMPLES = 20
+# Histograms are halved past this many samples, so old runs fade out
+MAX_SAMPLES = 500
+
+# Histogram bucket upper bounds in seconds: 50ms growing by 25% up to ~5 minutes
+BUCKETS = []
+_bound = 0.05
+while _bound < 300:
+    BUCKETS.append(round(_bound, 3))
+    _bound *= 1.25
+BUCKETS.append(float("inf"))
+
+
+class LatencyHistogram:
+    """Bucketed latency samples of one wait site, plus the number of timeouts."""
+
+    def __init__(self, counts=None, timeouts=0):
+        self.counts = list(counts or [0] * len(BUCKETS))
+        if len(self.counts) != len(BUCKETS):
+            # Saved with other buckets; start over rather than misread it
+            self.counts = [0] * len(BUCKETS)
+        self.timeouts = timeouts
+
+    @property
+    def samples(self):
+        return sum(self.counts)
+
+    def record(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        if self.samples > MAX_SAMPLES:
+            self.counts = [count // 2 for count in self.counts]
+            self.timeouts //= 2
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of samples (None if empty)."""
+        total = self.samples
+        if not total:
+            return None
+        cumulative = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            cumulative += count
+            if cumulative >= fraction * total:
+                return bound
+        return BUCKETS[-1]
+
+
+class TimeoutPolicy:
+    """
+    Timeouts learned from the latencies observed at each wait site.
+
+    Every wait reports how long it took (or that it timed out). Once a site has
+    MIN_SAMPLES successful samples its timeout becomes the PERCENTILE latency
+    times MARGIN, clamped to the site's floor and ceiling. Timeouts are counted
+    but not added to the histogram, so a page that never shows up can't stretch
+    the timeout of every later wait.
+    """
+
+    def __init__(self, path=TIMEOUT_CACHE_FILE, sites=None):
+        """
+        Loads the histograms saved by earlier runs.
+
+        Parameters:
+            path (str): JSON file holding the histograms
+            sites (dict): Site name -> (default, floor, ceiling); defaults to SITES
+        """
+        self.path = path
+        self.sites = dict(sites or SITES)
+        self._lock = threading.Lock()
+        data = load_json_cache(path)
+        self.histograms = {
+            site: LatencyHistogram(entry.get("counts"), entry.get("timeouts", 0))
+            for site, entry in data.items() if site in self.sites
+        }
+
+    def timeout(self, site):
+        """
+        Current timeout of a wait site.
+
+        Parameters:
+            site (str): Site name from SITES
+
+        Returns:
+            float: Timeout in seconds
+        """
+        default, floor, ceiling = self.sites[site]
+        with self._lock:
+            histogram = self.histograms.get(site)
+            if histogram is None or histogram.samples < MIN_SAMPLES:
+                return float(default)
+            learned = histogram.percentile(PERCENTILE) * MARGIN
+        return float(min(ceiling, max(floor, round(learned, 1))))
+
+    def record(self, site, seconds, timed_out=False):
+        """
+        Records one wait.
+
+        Parameters:
+            site (str): Site name from SITES
+            seconds (float): How long the wait took
+            timed_out (bool): The wait ended at its timeout
+        """
+        with self._lock:
+            histogram = self.histograms.setdefault(site, LatencyHistogram())
+            if timed_out:
+                histogram.timeouts += 1
+            else:
+                histogram.record(seconds)
+
+    def summary(self):
+        """One-line description of every site's timeout, for the logs."""
+        parts = []
+        for site in self.sites:
+            histogram = self.histograms.get(site)
+            samples = histogram.samples if histogram else 0
+            if samples < MIN_SAMPLES:
+                parts.append(f"{site} {self.timeout(site):g}s (default, {samples} samples)")
+            else:
+                parts.append(
+                    f"{site} {self.timeout(site):g}s (p{int(PERCENTILE * 100)} "
+                    f"{histogram.percentile(PERCENTILE):g}s, {samples} samples, {histogram.timeouts} timeouts)"
+                )
+        return "Timeouts: " + "; ".join(parts)
+
+    def save(self):
+        """Persist the histograms for the next run."""
+        with self._lock:
+            data = {
+                site: {"counts": histogram.counts, "timeouts": histogram.timeouts}
+                for site, histogram in self.histograms.items()
+            }
+        save_json_cache(self.path, data)
+
+
+_policy = None
+_policy_lock = threading.Lock()
+
+
+def get_timeout_policy():
+    """
+    Returns the process-wide TimeoutPolicy, loading it (and logging its timeouts) on first use.
+
+    Returns:
+        TimeoutPolicy: The shared policy
+    """
+    global _policy
+    with _policy_lock:
+        if _policy is None:
+            _policy = TimeoutPolicy()
+            print(_policy.summary())
+        return _policy
@@ -6,6 +6,28 @@ import glob
 import platform
 import subprocess
 
+def fix_driver_permissions(driver_path):
+    """Fix permissions on a single ChromeDriver executable"""
+    if not os.path.isfile(driver_path) or os.path.islink(driver_path):
+        return False
+    
+    try:
+        # Add execute permissions (chmod +x)
+        os.chmod(driver_path, os.stat(driver_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        
+        # On macOS, also remove quarantine attribute
+        if platform.system() == "Darwin":
+            try:
+                subprocess.run(["xattr", "-d", "com.apple.quarantine", driver_path], 
+                              stderr=subprocess.DEVNULL)
+            except:
+                pass  # Ignore if xattr command fails
+        
+        return True
+    except Exception as e:
+        print(f"Error setting permissions for {driver_path}: {e}")
+        return False
+
 def fix_chromedriver_permissions():
     """Fix permissions on ChromeDriver executable"""
     print("Fixing ChromeDriver permissions...")
@@ -27,24 +49,10 @@ def fix_chromedriver_permissions():
     
     for driver_path in chromedriver_files:
         if os.path.isfile(driver_path) and not os.path.islink(driver_path):
-            try:
-                print(f"Setting permissions for: {driver_path}")
-                
-                # Add execute permissions (chmod +x)
-                os.chmod(driver_path, os.stat(driver_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-                
-                # On macOS, also remove quarantine attribute
-                if platform.system() == "Darwin":
-                    try:
-                        subprocess.run(["xattr", "-d", "com.apple.quarantine", driver_path], 
-                                      stderr=subprocess.DEVNULL)
-                    except:
-                        pass  # Ignore if xattr command fails
-                        
+            print(f"Setting permissions for: {driver_path}")
+            if fix_driver_permissions(driver_path):
                 print(f"Fixed permissions for {os.path.basename(driver_path)}")
                 success = True
-            except Exception as e:
-                print(f"Error setting permissions for {driver_path}: {e}")
     
     return success
 
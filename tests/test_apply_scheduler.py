@@ -0,0 +1,78 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.apply_scheduler import JobScorer, OutcomeHistory, PriorityJobQueue, build_job_scorer
+
+
+def job(guid, title="Developer", company="Acme"):
+    return {"Job Title": title, "Job URL": f"https://www.dice.com/job-detail/{guid}", "Company": company}
+
+
+def drain(job_queue):
+    job_queue.close()
+    taken = []
+    while True:
+        entry = job_queue.get_job()
+        if entry is None:
+            return taken
+        taken.append(entry["Job URL"].rsplit("/", 1)[1])
+
+
+def test_highest_score_first_and_queue_order_between_equal_scores():
+    scorer = JobScorer().add("python", 1.0, lambda job, rank: 1.0 if "Python" in job["Job Title"] else 0.0)
+    job_queue = PriorityJobQueue(scorer=scorer)
+    for guid, title in [("a", "Java"), ("b", "Python"), ("c", "Go"), ("d", "Python")]:
+        job_queue.put_job(job(guid, title))
+
+    assert drain(job_queue) == ["b", "d", "a", "c"]
+
+
+def test_earlier_results_score_higher():
+    scorer = build_job_scorer(weights={"keywords": 0, "company": 0, "title_history": 0})
+    job_queue = PriorityJobQueue(scorer=scorer)
+    job_queue.put_job(job("late"), rank=40)
+    job_queue.put_job(job("unknown"))
+    job_queue.put_job(job("first"), rank=0)
+
+    assert drain(job_queue) == ["first", "unknown", "late"]
+
+
+def test_job_limit_leaves_the_rest_queued(capsys):
+    job_queue = PriorityJobQueue(job_limit=2)
+    for guid in "abcd":
+        job_queue.put_job(job(guid))
+
+    assert drain(job_queue) == ["a", "b"]
+    assert job_queue.taken == 2
+    assert job_queue.qsize() == 2
+    assert job_queue.exhausted_reason == "Job limit of 2 reached"
+    assert capsys.readouterr().out.count("Job limit of 2 reached") == 1
+
+
+def test_an_empty_get_does_not_count_against_the_limit():
+    job_queue = PriorityJobQueue(job_limit=1)
+    job_queue.close()
+    assert job_queue.get_job() is None
+    assert job_queue.taken == 0
+
+
+def test_used_up_time_budget_hands_out_nothing():
+    job_queue = PriorityJobQueue(time_budget=1)
+    job_queue.deadline -= 2
+    job_queue.put_job(job("a"))
+
+    assert drain(job_queue) == []
+    assert job_queue.exhausted_reason == "Time budget used up"
+
+
+def test_history_favours_companies_and_titles_applied_to_before():
+    history = OutcomeHistory([
+        ("Python Developer", "Acme", "applied"),
+        ("Python Developer", "Acme", "applied"),
+        ("Java Developer", "Initech", "not_applied"),
+    ])
+
+    assert history.company_rate("acme ") > history.company_rate("New Co") > history.company_rate("Initech")
+    assert history.title_rate("Senior Python Engineer") > history.title_rate("Java Engineer")
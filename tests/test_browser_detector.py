@@ -0,0 +1,83 @@
+import os
+import sys
+import ntpath
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import browser_detector
+from core.browser_detector import find_windows_browsers
+
+
+class FakeFileSystem:
+    """In-memory Windows file system built from a list of file paths (case-insensitive)."""
+
+    def __init__(self, files):
+        self.files = {path.lower() for path in files}
+        self.children = {}
+        for path in files:
+            while ntpath.dirname(path) != path:
+                parent = ntpath.dirname(path)
+                self.children.setdefault(parent.lower(), set()).add(ntpath.basename(path))
+                path = parent
+        self.listed = []
+
+    def listdir(self, path):
+        self.listed.append(path)
+        if path.lower() not in self.children:
+            raise OSError(path)
+        return sorted(self.children[path.lower()])
+
+    def isdir(self, path):
+        return path.lower() in self.children
+
+    def exists(self, path):
+        return path.lower() in self.files or self.isdir(path)
+
+
+ENVIRON = {"ProgramFiles": "D:\\Apps", "ProgramFiles(x86)": "D:\\Apps (x86)", "SystemDrive": "D:"}
+
+
+def test_find_windows_browsers_prefers_program_files_over_profiles():
+    fs = FakeFileSystem([
+        "D:\\Apps\\Google\\Chrome\\Application\\chrome.exe",
+        "D:\\Users\\ann\\AppData\\Local\\Google\\Chrome\\Application\\chrome.exe",
+        "D:\\Users\\ann\\AppData\\Local\\BraveSoftware\\Brave-Browser\\Application\\brave.exe",
+    ])
+
+    assert find_windows_browsers(environ=ENVIRON, fs=fs) == {
+        "Chrome": "D:\\Apps\\Google\\Chrome\\Application\\chrome.exe",
+        "Brave": "D:\\Users\\ann\\AppData\\Local\\BraveSoftware\\Brave-Browser\\Application\\brave.exe",
+    }
+
+
+def test_find_windows_browsers_walks_profiles_for_unusual_installs():
+    fs = FakeFileSystem([
+        "D:\\Users\\ann\\Tools\\Edge\\Application\\msedge.exe",
+        "D:\\Users\\ann\\node_modules\\Chrome\\Application\\chrome.exe",
+        "D:\\Users\\Public\\Firefox\\firefox.exe",
+    ])
+
+    assert find_windows_browsers(environ=ENVIRON, fs=fs) == {
+        "Edge": "D:\\Users\\ann\\Tools\\Edge\\Application\\msedge.exe",
+    }
+    assert not any("node_modules" in path for path in fs.listed)
+
+
+def test_find_windows_browsers_without_users_dir():
+    assert find_windows_browsers(environ=ENVIRON, fs=FakeFileSystem([])) == {}
+
+
+def test_browser_cache_is_invalidated_when_the_binary_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(browser_detector, "BROWSER_CACHE_FILE", str(tmp_path / "browser_cache.json"))
+    monkeypatch.setattr(browser_detector, "get_browser_version", lambda path: "124.0.0.0")
+    browser = tmp_path / "chrome"
+    browser.write_bytes(b"v1")
+
+    browser_detector._save_cached_browser(str(browser))
+    assert browser_detector._load_cached_browser() == str(browser)
+
+    browser.write_bytes(b"version 2")
+    assert browser_detector._load_cached_browser() is None
+
+    browser.unlink()
+    assert browser_detector._load_cached_browser() is None
@@ -0,0 +1,50 @@
+import os
+import sys
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.crawl_watermarks import CrawlWatermarks, QueryWatermark, guids_in_html
+
+
+def test_guids_in_html_reads_card_guids_in_page_order():
+    html = ('<div data-id="1" data-job-guid="b"></div><div data-job-guid=\'a\'>'
+            '<a data-job-guid="b"></a><div data-job-guid=c>')
+
+    assert guids_in_html(html) == ["b", "a", "c"]
+    assert guids_in_html(None) == []
+
+
+def test_check_page_reports_pages_with_only_known_jobs():
+    watermark = QueryWatermark("python", ["a", "b"])
+
+    assert watermark.has_history
+    assert watermark.check_page(["a", "b"]) == "known"
+    assert watermark.check_page(["b", "c"]) == "new"
+    assert watermark.check_page([]) == "new"
+    assert not QueryWatermark("python").has_history
+
+
+def test_only_decided_jobs_are_persisted(tmp_path):
+    path = str(tmp_path / "crawl_watermarks.json")
+    watermarks = CrawlWatermarks(path)
+    watermark = watermarks.for_query("python")
+    watermark.check_page(["applied", "failed", "excluded"])
+    watermark.check_page(["external", "applied"])
+    watermarks.save(lambda guid: guid in {"applied", "external"})
+
+    watermark = CrawlWatermarks(path).for_query("python")
+    assert watermark.guids == ["applied", "external"]
+
+    # Newly decided jobs go first; older ones are kept after them
+    watermark.check_page(["failed", "applied"])
+    assert watermark.to_dict(lambda guid: True)["guids"] == ["failed", "applied", "external"]
+
+
+def test_stale_watermarks_are_ignored(tmp_path):
+    path = str(tmp_path / "crawl_watermarks.json")
+    with open(path, "w") as f:
+        json.dump({"python": {"guids": ["a"], "updated_at": 0}}, f)
+
+    assert not CrawlWatermarks(path).for_query("python").has_history
+    assert CrawlWatermarks(path, max_age=float("inf")).for_query("python").known == {"a"}
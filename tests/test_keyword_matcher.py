@@ -0,0 +1,14 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.keyword_matcher import KeywordMatcher
+
+
+def test_match_many_maps_matches_after_a_title_longer_once_casefolded():
+    matcher = KeywordMatcher(["AI", "ML"])
+    titles = ["ßßßßßßßßßß", "x", "AI lead", "ML ops"]
+
+    assert matcher.match_many(titles) == [[], [], ["AI"], ["ML"]]
+    assert matcher.match_many(titles) == [matcher.matches(title) for title in titles]
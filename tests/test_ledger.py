@@ -0,0 +1,56 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.ledger import ApplicationLedger, job_guid_from_url
+
+
+def job(guid, title="Python Developer", company="Acme"):
+    return {
+        "Job Title": title,
+        "Job URL": f"https://www.dice.com/job-detail/{guid}",
+        "Company": company,
+        "Location": "Remote",
+        "Employment Type": "Contract",
+        "Posted Date": "Today",
+        "Applied": False,
+    }
+
+
+def test_job_guid_from_url_accepts_urls_and_guids():
+    assert job_guid_from_url("https://www.dice.com/job-detail/abc-123?searchlink=x") == "abc-123"
+    assert job_guid_from_url("abc-123") == "abc-123"
+
+
+def test_buffered_outcomes_are_visible_before_the_group_commit(tmp_path):
+    ledger = ApplicationLedger(str(tmp_path / "ledger.db"), commit_every=100, commit_interval=3600)
+    ledger.record(job("a"), "applied")
+    ledger.record(job("b"), "not_applied", "External application")
+
+    assert ledger._pending
+    assert ledger.has_applied("https://www.dice.com/job-detail/a")
+    assert ledger.has_applied("a")
+    assert not ledger.has_applied("b")
+    ledger.close()
+
+
+def test_outcomes_survive_reopening_and_the_latest_one_counts(tmp_path):
+    path = str(tmp_path / "ledger.db")
+    ledger = ApplicationLedger(path, commit_every=2, commit_interval=3600)
+    ledger.record(job("a"), "not_applied", "Timed out")
+    ledger.record(job("b"), "not_applied")
+    ledger.record(job("a"), "applied")
+    ledger.close()
+
+    ledger = ApplicationLedger(path)
+    assert ledger.has_applied("a")
+    assert not ledger.has_applied("b")
+    assert ledger.count("applied") == 1
+    assert ledger.count("not_applied") == 1
+    assert [entry["Job URL"] for entry in ledger.iter_jobs("applied")] == [job("a")["Job URL"]]
+    assert sorted(ledger.iter_outcomes()) == [
+        ("Python Developer", "Acme", "applied"),
+        ("Python Developer", "Acme", "not_applied"),
+    ]
+    ledger.close()
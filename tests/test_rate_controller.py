@@ -0,0 +1,95 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.rate_controller import RateController, RequestClassController, TokenBucket
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def controller():
+    # A large burst so the tests never wait for tokens
+    return RequestClassController("search", rate=4.0, burst=1000, initial_limit=4, max_limit=8, latency_target=5.0)
+
+
+def test_throttling_halves_concurrency_and_rate_once_per_burst():
+    search = controller()
+    for _ in range(3):
+        search.acquire()
+    search.release(0.1, status=429)
+    search.release(0.1, status=503)
+    search.release(0.1, error=True)
+
+    assert search.limit == 2
+    assert search.bucket.rate == 2.0
+    assert (search.decreases, search.throttled, search.errors) == (1, 2, 1)
+
+    # Once the cooldown has passed, the next congestion signal counts again
+    search._last_decrease -= 10
+    search.acquire()
+    search.release(0.1, status=500)
+    assert search.limit == 1
+    assert search.bucket.rate == 1.0
+
+
+def test_limits_never_drop_below_their_floors():
+    search = controller()
+    for _ in range(10):
+        search._last_decrease -= 10
+        search.acquire()
+        search.release(9.0)
+
+    assert search.limit == 1
+    assert search.bucket.rate == search.min_rate
+
+
+def test_successes_grow_the_limits_back_up_to_the_ceiling():
+    search = controller()
+    search.acquire()
+    search.release(0.1, status=429)
+    assert search.limit == 2
+
+    for _ in range(100):
+        search.acquire()
+        search.release(0.1, status=200)
+
+    assert search.limit == 8
+    assert search.bucket.rate == 4.0
+    assert search.snapshot()["concurrency_limit"] == 8
+
+
+def test_retry_after_holds_the_bucket():
+    search = controller()
+    with RateController({"search": (4.0, 8, 4, 8, 5.0)}).request("search") as ticket:
+        ticket.observe(FakeResponse(429, {"Retry-After": "30"}))
+    assert ticket.retry_after == 30.0
+
+    search.acquire()
+    search.release(0.1, status=429, retry_after=30)
+    assert search.bucket._not_before - time.monotonic() > 29
+
+
+def test_an_exception_in_the_request_block_counts_as_an_error():
+    rate_controller = RateController({"detail": (6.0, 12, 6, 12, 5.0)})
+    try:
+        with rate_controller.request("detail"):
+            raise ValueError("connection reset")
+    except ValueError:
+        pass
+
+    metrics = rate_controller.snapshot()["detail"]
+    assert (metrics["requests"], metrics["errors"], metrics["in_flight"]) == (1, 1, 0)
+    assert metrics["concurrency_limit"] == 3
+
+
+def test_token_bucket_paces_requests_after_the_burst():
+    bucket = TokenBucket(rate=50, burst=2)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() > 0
@@ -0,0 +1,72 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.run_journal import RunJournal, RunState, read_run_state
+
+
+def job(guid):
+    return {"Job Title": f"Job {guid}", "Job URL": f"https://www.dice.com/job-detail/{guid}"}
+
+
+def test_resume_continues_with_unfinished_jobs_and_queries(tmp_path):
+    path = str(tmp_path / "run_journal.jsonl")
+    journal = RunJournal(path)
+    journal.start(["python", "golang"])
+    for rank, guid in enumerate("abc"):
+        journal.queued(job(guid), rank)
+    journal.query_done("python")
+    journal.started(job("a"))
+    journal.done(job("a"), applied=True)
+    journal.started(job("b"))
+    journal.close()
+
+    resumed = RunJournal(path)
+    state = resumed.resume()
+    assert state.remaining_queries() == ["golang"]
+    assert state.unfinished_jobs() == [(job("b"), 1), (job("c"), 2)]
+    assert state.summary() == "1/3 queued jobs done, 1/2 queries searched"
+
+    resumed.done(job("b"), applied=False)
+    resumed.finish()
+    resumed.close()
+    assert read_run_state(path).finished
+    assert RunJournal(path).resume() is None
+
+
+def test_a_line_cut_off_by_a_crash_is_skipped(tmp_path):
+    path = str(tmp_path / "run_journal.jsonl")
+    journal = RunJournal(path)
+    journal.start(["python"])
+    journal.queued(job("a"), 0)
+    journal.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"event": "queued", "guid": "b", "jo')
+
+    journal = RunJournal(path)
+    state = journal.resume()
+    journal.queued(job("c"), 2)
+    journal.close()
+
+    assert [entry for entry, _ in state.unfinished_jobs()] == [job("a")]
+    assert [entry for entry, _ in read_run_state(path).unfinished_jobs()] == [job("a"), job("c")]
+
+
+def test_worker_records_before_the_queued_record_are_kept():
+    state = RunState()
+    for record in [
+        {"event": "run", "queries": ["python"]},
+        {"event": "started", "guid": "a"},
+        {"event": "done", "guid": "a", "applied": True},
+        {"event": "queued", "guid": "a", "rank": 0, "job": job("a")},
+        {"event": "started", "guid": "b"},
+        {"event": "queued", "guid": "b", "rank": 1, "job": job("b")},
+        {"event": "started", "guid": "c"},
+    ]:
+        state.apply(record)
+
+    assert state.jobs["a"]["state"] == "done"
+    assert state.jobs["b"]["state"] == "started"
+    # No queued record means the job entry is unknown; there is nothing to resume
+    assert state.unfinished_jobs() == [(job("b"), 1)]
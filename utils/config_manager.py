@@ -30,6 +30,20 @@ class ConfigManager:
         "aws","gcp","Azure","agentic","python","rag","llm"],
                 "headless_mode": False,
                 "job_application_limit": 50,
+                "apply_workers": 1,
+                "driver_recycle_jobs": 150,
+                "driver_recycle_rss_mb": 1500,
+                "search_mode": "http",
+                "keyword_word_boundaries": False,
+                "prescreen_jobs": True,
+                "return_to_search_page": False,
+                "park_between_jobs": False,
+                "page_load_strategy": "eager",
+                "block_resources": True,
+                "remember_session": True,
+                "apply_queue_size": 50,
+                "time_budget_minutes": 0,
+                "warm_browser_at_launch": False,
                 "save_logs": True
             }
             